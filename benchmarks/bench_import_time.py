@@ -0,0 +1,44 @@
+# region License
+# Copyright (c) .NET Foundation and contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# The latest version of this file can be found at https://github.com/p-hzamora/FluentValidation
+# endregion
+
+"""Time taken by 'import fluent_validation' in a fresh interpreter, as reported by 'python -X importtime'.
+
+Run from the repository root: python benchmarks/bench_import_time.py
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC: Path = Path(__file__).parents[1] / "src"
+REPEAT: int = 5
+
+
+def import_time_us() -> int:
+    env = {**os.environ, "PYTHONPATH": str(SRC)}
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", "import fluent_validation"], capture_output=True, text=True, env=env, check=True).stderr
+    last_line = stderr.strip().splitlines()[-1]
+    if not last_line.endswith("| fluent_validation"):
+        raise RuntimeError(f"Unexpected output of -X importtime: {last_line}")
+    return int(last_line.split("|")[1])
+
+
+if __name__ == "__main__":
+    timings = [import_time_us() for _ in range(REPEAT)]
+    print(f"import fluent_validation: {min(timings) / 1000:.1f}ms (best of {REPEAT})")
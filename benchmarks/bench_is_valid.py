@@ -0,0 +1,72 @@
+# region License
+# Copyright (c) .NET Foundation and contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# The latest version of this file can be found at https://github.com/p-hzamora/FluentValidation
+# endregion
+
+"""Throughput of 'is_valid' against 'validate(...).is_valid' on mostly invalid input.
+
+Run from the repository root: python benchmarks/bench_is_valid.py
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parents[1] / "src"))
+
+from fluent_validation import AbstractValidator  # noqa: E402
+
+COUNT: int = 10_000
+INVALID_RATIO: float = 0.9
+
+
+class Customer:
+    def __init__(self, Name: str, Surname: str, Email: str, Age: int, Discount: int, Postcode: str):
+        self.Name: str = Name
+        self.Surname: str = Surname
+        self.Email: str = Email
+        self.Age: int = Age
+        self.Discount: int = Discount
+        self.Postcode: str = Postcode
+
+
+class CustomerValidator(AbstractValidator[Customer]):
+    def __init__(self):
+        super().__init__(Customer)
+        self.rule_for(lambda x: x.Name).not_empty().length(2, 20)
+        self.rule_for(lambda x: x.Surname).not_empty().length(2, 30)
+        self.rule_for(lambda x: x.Email).not_empty().email_address()
+        self.rule_for(lambda x: x.Age).greater_than_or_equal_to(18).less_than(120)
+        self.rule_for(lambda x: x.Discount).inclusive_between(0, 50).when(lambda x: x.Age is not None)
+        self.rule_for(lambda x: x.Postcode).matches(r"^\d{5}$")
+
+
+def customers(count: int = COUNT, invalid_ratio: float = INVALID_RATIO) -> list[Customer]:
+    invalid_every = round(1 / (1 - invalid_ratio))
+    return [Customer("Ana", "Smith", "ana@example.com", 30, 10, "28001") if i % invalid_every == 0 else Customer("", "S", "not an email", 12, 80, "abc") for i in range(count)]
+
+
+def instances_per_second(check, instances: list[Customer]) -> float:
+    seconds = min(timeit.repeat(lambda: [check(x) for x in instances], number=1, repeat=5))
+    return len(instances) / seconds
+
+
+if __name__ == "__main__":
+    instances = customers()
+    for title, validator in (("interpreted", CustomerValidator()), ("compiled", CustomerValidator().compile(codegen=True))):
+        validate = instances_per_second(lambda x: validator.validate(x).is_valid, instances)
+        is_valid = instances_per_second(validator.is_valid, instances)
+        print(f"{title + ':':<13} validate {validate:>9,.0f}/s   is_valid {is_valid:>9,.0f}/s   x{is_valid / validate:.1f}")
@@ -0,0 +1,92 @@
+# region License
+# Copyright (c) .NET Foundation and contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# The latest version of this file can be found at https://github.com/p-hzamora/FluentValidation
+# endregion
+
+"""Memory and creation rate of ValidationContext.
+
+Run from the repository root: python benchmarks/bench_validation_context.py
+
+To compare with another revision, check it out next to this one and pass its 'src' folder:
+
+    git worktree add ../baseline <revision>
+    python benchmarks/bench_validation_context.py --baseline ../baseline/src
+
+Each tree is measured in its own process, so both versions of the package can be imported.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+SRC: Path = Path(__file__).parents[1] / "src"
+COUNT: int = 100_000
+
+
+class Instance:
+    pass
+
+
+def bytes_per_context(count: int = COUNT) -> float:
+    from fluent_validation.IValidationContext import ValidationContext
+
+    instance = Instance()
+    tracemalloc.start()
+    contexts = [ValidationContext(instance) for _ in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del contexts
+    return size / count
+
+
+def contexts_per_second(count: int = COUNT) -> float:
+    from fluent_validation.IValidationContext import ValidationContext
+
+    instance = Instance()
+    seconds = min(timeit.repeat(lambda: ValidationContext(instance), number=count, repeat=5))
+    return count / seconds
+
+
+def measure(src: Path) -> dict[str, float]:
+    output = subprocess.run([sys.executable, __file__, "--measure", str(src)], capture_output=True, text=True, check=True).stdout
+    return json.loads(output)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baseline", type=Path, help="'src' folder of the revision to compare with")
+    parser.add_argument("--measure", type=Path, help=argparse.SUPPRESS)
+    arguments = parser.parse_args()
+
+    if arguments.measure:
+        sys.path.insert(0, str(arguments.measure))
+        print(json.dumps({"bytes/context": bytes_per_context(), "contexts/s": contexts_per_second()}))
+        sys.exit()
+
+    current = measure(SRC)
+    if arguments.baseline is None:
+        print(f"bytes/context:  {current['bytes/context']:.0f}")
+        print(f"contexts/s:     {current['contexts/s']:,.0f}")
+        sys.exit()
+
+    baseline = measure(arguments.baseline)
+    print(f"{'':<15} {'baseline':>10} {'current':>10}")
+    print(f"{'bytes/context':<15} {baseline['bytes/context']:>10.0f} {current['bytes/context']:>10.0f}")
+    print(f"{'contexts/s':<15} {baseline['contexts/s']:>10,.0f} {current['contexts/s']:>10,.0f}")
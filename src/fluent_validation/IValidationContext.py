@@ -35,10 +35,12 @@ class StackParams[T](NamedTuple):
     IsChildCollectionContext: bool
     ParentContext: IValidationContext
     Chain: PropertyChain
-    SharedConditionCache: dict[str, dict[T, bool]]
+    SharedConditionCache: dict[str, dict[int, tuple[T, bool]]]
 
 
 class IValidationContext(ABC):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def instance_to_validate(self) -> Any: ...
@@ -77,6 +79,8 @@ class IValidationContext(ABC):
 
 
 class IHasFailures(ABC):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def Failures(self) -> list[ValidationFailure]: ...
@@ -99,6 +103,7 @@ class ValidationContext[T](IValidationContext, IHasFailures):
         "_is_async",
         "_parentContext",
         "_sharedConditionCache",
+        "_state",
     )
 
     @overload
@@ -116,39 +121,31 @@ class ValidationContext[T](IValidationContext, IHasFailures):
         failures: Optional[list[ValidationFailure]] = None,
         messageFormatter: Optional[MessageFormatter] = None,
     ):
-        if instance_to_validate and all(x is None for x in [propertyChain, validatorSelector, failures, messageFormatter]):
-            self.__init__one_attr(instance_to_validate)
-        elif instance_to_validate and propertyChain and validatorSelector and all(x is None for x in [failures, messageFormatter]):
-            self.__init__three_attr(instance_to_validate, propertyChain, validatorSelector)
-        else:
-            self.__init__all_attr(instance_to_validate, propertyChain, validatorSelector, failures, messageFormatter)
-
-    def __init__one_attr(self, instanceToValidate: T):
-        self.__init__(instanceToValidate, None, ValidatorOptions.Global.ValidatorSelectors.DefaultValidatorSelectorFactory())
-
-    def __init__three_attr(self, instanceToValidate: T, propertyChain: PropertyChain, validatorSelector: IValidatorSelector):
-        self.__init__(instanceToValidate, propertyChain, validatorSelector, [], ValidatorOptions.Global.MessageFormatterFactory())
+        # Only a context created from the instance alone gets the default selector
+        if validatorSelector is None and instance_to_validate and propertyChain is None and failures is None and messageFormatter is None:
+            validatorSelector = ValidatorOptions.Global.ValidatorSelectors.DefaultValidatorSelectorFactory()
 
-    def __init__all_attr(self, instanceToValidate: T, propertyChain: PropertyChain, validatorSelector: IValidatorSelector, failures: list[ValidationFailure], messageFormatter: MessageFormatter):
-        self._instance_to_validate: T = instanceToValidate
+        self._instance_to_validate: T = instance_to_validate
 
-        self._PropertyChain = PropertyChain(propertyChain)
+        # The chain and the formatter are created on first use when there is nothing to copy, most root contexts build them late or never
+        self._PropertyChain: Optional[PropertyChain] = PropertyChain(propertyChain) if propertyChain else None
         self._Selector = validatorSelector
         # COMMENT!!: I added 'is not None' to the 'failures if failures else []' conditional because the 'failures' variable could be an empty list, and otherwise, it could return False.
         # It was creating an empty list instead of assigning the original list when 'failures' was an empty list.
         # That's the reason why failures was not passed by reference and the information was not propagated properly.
         self._failures: list[ValidationFailure] = failures if failures is not None else []
-        self._messageFormatter: MessageFormatter = messageFormatter if messageFormatter is not None else MessageFormatter()
+        self._messageFormatter: Optional[MessageFormatter] = messageFormatter
         self._property_path: Optional[str] = None
         self._displayNameFunc: Optional[str] = None
         self._ThrowOnFailures: bool = False
-        self._RootContextData: dict[str, Any] = {}
+        # Created on first use, most contexts never read it
+        self._RootContextData: Optional[dict[str, Any]] = None
         self._IsChildContext: bool = False
         self._IsChildCollectionContext: bool = False
         self._RawPropertyName: str = None
         self._is_async: bool = False
         self._parentContext: IValidationContext = None
-        self._sharedConditionCache: dict[str, dict[T, bool]] = None
+        self._sharedConditionCache: dict[str, dict[int, tuple[T, bool]]] = None
         self._state: deque[StackParams] = None
 
     @override
@@ -158,6 +155,8 @@ class ValidationContext[T](IValidationContext, IHasFailures):
 
     @property
     def MessageFormatter(self) -> MessageFormatter:
+        if self._messageFormatter is None:
+            self._messageFormatter = ValidatorOptions.Global.MessageFormatterFactory()
         return self._messageFormatter
 
     @property
@@ -191,11 +190,13 @@ class ValidationContext[T](IValidationContext, IHasFailures):
 
     @instance_to_validate.setter
     def instance_to_validate(self, value: T) -> None:
-        self._InstanceToValidate = value
+        self._instance_to_validate = value
 
     @override
     @property
     def RootContextData(self) -> dict[str, set[str]]:
+        if self._RootContextData is None:
+            self._RootContextData = {}
         return self._RootContextData
 
     @RootContextData.setter
@@ -204,6 +205,8 @@ class ValidationContext[T](IValidationContext, IHasFailures):
 
     @property
     def PropertyChain(self) -> PropertyChain:
+        if self._PropertyChain is None:
+            self._PropertyChain = PropertyChain()
         return self._PropertyChain
 
     @PropertyChain.setter
@@ -264,7 +267,7 @@ class ValidationContext[T](IValidationContext, IHasFailures):
         self._ThrowOnFailures = value
 
     @property
-    def SharedConditionCache(self) -> dict[str, dict[T, bool]]:
+    def SharedConditionCache(self) -> dict[str, dict[int, tuple[T, bool]]]:
         if self._sharedConditionCache is None:
             self._sharedConditionCache = {}
         return self._sharedConditionCache
@@ -17,6 +17,7 @@
 # endregion
 
 from enum import Enum
+from functools import lru_cache, wraps
 from typing import (
     Annotated,
     Any,
@@ -52,7 +53,36 @@ def applied_metadata_from_annotated(type_: Annotated) -> Type:
     return metadata
 
 
+# Resolving type hints is slow and the result only depends on the types, so it is cached for the whole process.
+# Each cache keeps up to TYPE_HINT_CACHE_SIZE entries. MemberInfo.clear_cache() empties them, e.g. between tests that redefine classes
+TYPE_HINT_CACHE_SIZE: int = 1024
+_type_caches: list[Any] = []
+
+
+def _type_cache[**P, R](func: Callable[P, R]) -> Callable[P, R]:
+    cached = lru_cache(maxsize=TYPE_HINT_CACHE_SIZE)(func)
+    _type_caches.append(cached)
+
+    @wraps(func)
+    def wrapper(*args: P.args) -> R:
+        try:
+            hash(args)
+        except TypeError:
+            return func(*args)  # Some type hints hold unhashable metadata (Annotated...)
+        return cached(*args)
+
+    wrapper.cache_info = cached.cache_info
+    return wrapper
+
+
 class MemberInfo[T]:
+    @staticmethod
+    def clear_cache() -> None:
+        """Empties the caches of resolved type hints and disassembled lambdas."""
+        for cache in _type_caches:
+            cache.cache_clear()
+        TreeInstruction.disassemble.cache_clear()
+
     @overload
     def __init__(self, func: Callable[[T], Any], model: T) -> None: ...
     @overload
@@ -63,8 +93,8 @@ class MemberInfo[T]:
 
         self._model = model
         self._func: Callable[[T], Any] = func
-        self._disassembler: TreeInstruction = TreeInstruction(func)
-        self._lambda_vars: list[TupleInstruction] = self._disassembler.to_list()
+        code = getattr(func, "__code__", None)
+        self._lambda_vars: tuple[TupleInstruction, ...] = TreeInstruction.disassemble(code) if code is not None else tuple(TreeInstruction(func).to_list())
 
         self._name: Optional[str] = self.assign_name()
 
@@ -104,50 +134,28 @@ class MemberInfo[T]:
         return lambda_var if not nested_name else nested_name[-1]
 
     def get_type_hint(self, type_model: Type) -> Type[Any]:
-        def get_types(obj: Any):
-            init_types = get_type_hints(obj.__init__, include_extras=True) if hasattr(obj, "__init__") else {}
-            annotations_types = get_type_hints(obj, include_extras=True) if hasattr(obj, "__annotations__") else {}
-
-            dict_types = init_types
-
-            dict_types.update(annotations_types)
-
-
-            for key in dict_types:
-                type_ = dict_types[key]
-
-                # COMMENT: Bypass pydantic Enum validation
-                # Deal with Annotated with the main goal to pass Other types as default values.
-                # If your're working with pydantic, it will validate against enums so you're going to get an error 
-                # in the instantiation and you cannot validate the attribute with fluent_validation
-                # Example 
-                """
-                >>> class Address(BaseModel):
-                >>>     Line1: Optional[str] = None
-                >>>     Town: Optional[str] = None
-                >>>     Country: Annotated[Optional[int], CountryEnum] = None # Country:Optional[CoutryEnum]
-                >>>     Postcode: Optional[str] = None
-                """
-                if get_origin(type_) is Annotated:
-                    dict_types[key] = applied_metadata_from_annotated(type_)
-
-            return dict_types
-
-        current_type_hints: dict[str, Any] = get_types(type_model)
-
         if not self._lambda_vars:
+            self.get_types(type_model)
             return None
 
-        lambda_var, *nested_name = self._lambda_vars[0].nested_element.parents
+        return self.resolve_type_hint(type_model, self.Name, tuple(self._lambda_vars[0].nested_element.parents))
 
-        if hasattr(type_model, self.Name) and isinstance(prop := getattr(type_model, self.Name), property):
+    @classmethod
+    @_type_cache
+    def resolve_type_hint(cls, type_model: Type, name: str, parents: tuple[str, ...]) -> Type[Any]:
+        """Type of the attribute chain 'parents' (the lambda parameter followed by the attributes) of 'type_model'. Cached per model type and attribute chain."""
+        current_type_hints: dict[str, Any] = cls.get_types(type_model)
+
+        lambda_var, *nested_name = parents
+
+        if hasattr(type_model, name) and isinstance(prop := getattr(type_model, name), property):
             return get_type_hints(prop.fget)["return"]
 
         if len(current_type_hints) == 0:
-            if lambda_var == self.Name:
+            if lambda_var == name:
                 return get_origin(type_model)
 
-            raise TypeError(f"The variable '{self.Name}' does not exist in '{type_model.__name__}' class")
+            raise TypeError(f"The variable '{name}' does not exist in '{type_model.__name__}' class")
 
         current_instance_var = None
 
@@ -159,11 +167,11 @@ class MemberInfo[T]:
             var_type_hint = current_type_hints[var]
 
             # It would be something like:   int | float | Decimal | ...
-            if self.isUnionType(var_type_hint) or self.isOptional(var_type_hint):
+            if cls.isUnionType(var_type_hint) or cls.isOptional(var_type_hint):
                 # For Union types, try to extract the non-None type
-                return self.get_args(var_type_hint)
+                return cls.get_args(var_type_hint)
 
-            current_instance_var = self.get_args(var_type_hint)
+            current_instance_var = cls.get_args(var_type_hint)
 
             # Handle Enum types - they don't have type hints like regular classes
             if isinstance(current_instance_var, type) and issubclass(current_instance_var, Enum):
@@ -177,9 +185,41 @@ class MemberInfo[T]:
             if hasattr(current_instance_var, "dtype"):
                 return current_instance_var.dtype
 
-            current_type_hints = get_types(current_instance_var)
+            current_type_hints = cls.get_types(current_instance_var)
         return current_instance_var
 
+    @staticmethod
+    @_type_cache
+    def get_types(obj: Any) -> dict[str, Any]:
+        """Type hints of the constructor and the annotations of 'obj'. The result is cached, do not modify it."""
+        init_types = get_type_hints(obj.__init__, include_extras=True) if hasattr(obj, "__init__") else {}
+        annotations_types = get_type_hints(obj, include_extras=True) if hasattr(obj, "__annotations__") else {}
+
+        dict_types = init_types
+
+        dict_types.update(annotations_types)
+
+
+        for key in dict_types:
+            type_ = dict_types[key]
+
+            # COMMENT: Bypass pydantic Enum validation
+            # Deal with Annotated with the main goal to pass Other types as default values.
+            # If your're working with pydantic, it will validate against enums so you're going to get an error 
+            # in the instantiation and you cannot validate the attribute with fluent_validation
+            # Example 
+            """
+            >>> class Address(BaseModel):
+            >>>     Line1: Optional[str] = None
+            >>>     Town: Optional[str] = None
+            >>>     Country: Annotated[Optional[int], CountryEnum] = None # Country:Optional[CoutryEnum]
+            >>>     Postcode: Optional[str] = None
+            """
+            if get_origin(type_) is Annotated:
+                dict_types[key] = applied_metadata_from_annotated(type_)
+
+        return dict_types
+
     @staticmethod
     def isUnionType(value: Any) -> bool:
         return get_origin(value) is types.UnionType
@@ -215,6 +255,7 @@ class MemberInfo[T]:
         return value
 
     @classmethod
+    @_type_cache
     def extract_base_class(cls, type_hint: Any) -> Type[Any]:
         """
         Extracts the actual class type from a complex type annotation,
@@ -292,6 +333,7 @@ class MemberInfo[T]:
             return origin
 
     @classmethod
+    @_type_cache
     def get_property_class(cls, obj: Any) -> Type[Any]:
         """
         Extracts the actual class type from a complex type annotation using MemberInfo's get_args,
@@ -0,0 +1,234 @@
+# region License
+# Copyright (c) .NET Foundation and contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# The latest version of this file can be found at https://github.com/p-hzamora/FluentValidation
+# endregion
+
+from __future__ import annotations
+import importlib
+from itertools import islice, repeat
+import os
+from typing import Any, Callable, Iterable, Iterator, Optional, Self, Type, TYPE_CHECKING
+
+from fluent_validation.abstract_validator import AbstractValidator
+from fluent_validation.InlineValidator import InlineValidator
+from fluent_validation.internal.Resources.ILanguageManager import CultureInfo, _thread_culture
+from fluent_validation.internal.ValidationStrategy import ValidationStrategy
+from fluent_validation.results.BatchValidationResult import BatchValidationResult
+from fluent_validation.ValidationException import ValidationException
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+    from fluent_validation.results.ValidationResult import ValidationResult
+
+
+# State of each worker process, set once by '_initialize_worker'
+_worker_validator: Optional[AbstractValidator] = None
+
+
+def _initialize_worker(class_path: str, args: tuple[Any, ...], kwargs: dict[str, Any], compiled: bool, codegen: bool) -> None:
+    global _worker_validator
+
+    validator: AbstractValidator = ParallelValidator.resolve(class_path)(*args, **kwargs)
+    if compiled:
+        validator.compile(codegen)
+    _worker_validator = validator
+
+
+def _validate_chunk(start: int, instances: list[Any], strategy: ValidationStrategy, culture: CultureInfo) -> tuple[dict[int, ValidationResult], set[str]]:
+    _thread_culture.CurrentUICulture = culture
+    invalid_results: dict[int, ValidationResult] = {}
+    rule_sets_executed: set[str] = set()
+
+    for index, result in enumerate(_worker_validator._validate_batch(instances, strategy), start):
+        if not result.is_valid:
+            invalid_results[index] = result
+        if result.RuleSetsExecuted:
+            rule_sets_executed.update(result.RuleSetsExecuted)
+    return invalid_results, rule_sets_executed
+
+
+class ParallelValidator[T]:
+    """Validates large batches on a pool of processes.
+
+    Rules are built from lambdas, which cannot be pickled, so the validator is never sent to the workers. Instead each
+    worker imports the validator class from its path ('package.module:ClassName') and creates its own instance once,
+    when the worker starts. Only the instances and the failing results travel between processes.
+
+    Only the rules declared in '__init__' are rebuilt. Rules added to an instance after construction, and cascade modes
+    changed on it, are not seen by the workers.
+
+    Example:
+        with ParallelValidator(PersonValidator, workers=4) as validator:
+            batch = validator.validate_many(people)
+    """
+
+    __slots__ = (
+        "_class_path",
+        "_args",
+        "_kwargs",
+        "_workers",
+        "_chunk_size",
+        "_compiled",
+        "_codegen",
+        "_executor",
+    )
+
+    def __init__(
+        self,
+        validator: Type[AbstractValidator[T]] | AbstractValidator[T] | str,
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        args: Optional[tuple[Any, ...]] = None,
+        kwargs: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """
+        Args:
+            validator: The validator class, an instance of it or its importable path ('package.module:ClassName')
+            workers: Number of processes. Defaults to the number of CPUs
+            chunk_size: Number of instances sent to a worker at once. By default the batch is split in four chunks per worker
+            args: Positional arguments used to create the validator in each worker
+            kwargs: Keyword arguments used to create the validator in each worker
+
+        Raises:
+            ValueError: If 'validator' is an instance and neither 'args' nor 'kwargs' are given. The arguments an instance
+                was created with cannot be recovered, pass 'args=()' when its class takes none.
+        """
+        self._compiled: bool = False
+        self._codegen: bool = False
+
+        if isinstance(validator, AbstractValidator):
+            if args is None and kwargs is None:
+                raise ValueError(
+                    f"The arguments used to create '{type(validator).__qualname__}' cannot be recovered from the instance. "
+                    + "Pass them with 'args' and 'kwargs', or 'args=()' if the validator takes none."
+                )
+            self._compiled = validator.IsCompiled
+            self._codegen = validator._plan.Codegen if validator.IsCompiled else False
+            validator = type(validator)
+
+        self._class_path: str = validator if isinstance(validator, str) else self.class_path(validator)
+        self._args: tuple[Any, ...] = args if args is not None else ()
+        self._kwargs: dict[str, Any] = kwargs if kwargs is not None else {}
+        self._workers: int = workers if workers else (os.cpu_count() or 1)
+        self._chunk_size: Optional[int] = chunk_size
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} '{self._class_path}' workers={self._workers}>"
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    @property
+    def ClassPath(self) -> str:
+        return self._class_path
+
+    @property
+    def Workers(self) -> int:
+        return self._workers
+
+    @staticmethod
+    def class_path(validator_type: Type[AbstractValidator]) -> str:
+        """Returns the path used by the workers to import 'validator_type'."""
+        if validator_type in (AbstractValidator, InlineValidator) or "<locals>" in validator_type.__qualname__:
+            raise ValueError(
+                f"'{validator_type.__qualname__}' cannot be rebuilt in a worker process. "
+                + "ParallelValidator needs a subclass of AbstractValidator defined at module level, that declares its rules in '__init__'."
+            )
+        return f"{validator_type.__module__}:{validator_type.__qualname__}"
+
+    @staticmethod
+    def resolve(class_path: str) -> Type[AbstractValidator]:
+        """Imports a validator class from 'package.module:ClassName' (or 'package.module.ClassName')."""
+        module_name, sep, qualname = class_path.partition(":")
+        if not sep:
+            module_name, _, qualname = class_path.rpartition(".")
+
+        obj: Any = importlib.import_module(module_name)
+        for name in qualname.split("."):
+            obj = getattr(obj, name)
+        return obj
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # multiprocessing is imported here, it would double the time needed to import fluent_validation
+            from concurrent.futures import ProcessPoolExecutor
+
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._workers,
+                initializer=_initialize_worker,
+                initargs=(self._class_path, self._args, self._kwargs, self._compiled, self._codegen),
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """Shuts the worker processes down. They are started again by the next call to validate_many."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _chunks(self, instances: Iterable[T]) -> Iterator[tuple[int, list[T]]]:
+        chunk_size = self._chunk_size
+        if chunk_size is None:
+            if not isinstance(instances, (list, tuple)):
+                instances = list(instances)
+            chunk_size = max(1, -(-len(instances) // (self._workers * 4)))
+
+        iterator = iter(instances)
+        start = 0
+        while chunk := list(islice(iterator, chunk_size)):
+            yield start, chunk
+            start += len(chunk)
+
+    def validate_many(self, instances: Iterable[T], options: Optional[Callable[[ValidationStrategy[T]], None]] = None) -> BatchValidationResult:
+        """Validates a batch of instances on the worker processes.
+
+        Args:
+            instances: The objects to validate. They must be picklable
+            options: Optional validation strategy options, applied to every instance
+
+        Returns:
+            A BatchValidationResult with the results in input order
+        """
+        # Not subscripted: the strategy is pickled for the workers, and the generic alias of a PEP 695 class cannot be
+        strategy: ValidationStrategy[T] = ValidationStrategy()
+        if options:
+            options(strategy)
+
+        # Exceptions raised in the workers would stop the whole pool, so failures are raised here, once merged in order
+        throwOnFailures: bool = strategy._throw
+        strategy._throw = False
+
+        chunks = list(self._chunks(instances))
+        count: int = sum(len(chunk) for _, chunk in chunks)
+        invalid_results: dict[int, ValidationResult] = {}
+        rule_sets_executed: set[str] = set()
+
+        starts = (start for start, _ in chunks)
+        instances_by_chunk = (chunk for _, chunk in chunks)
+        # The messages are built in the culture of the calling thread
+        culture = CultureInfo.CurrentUICulture()
+        for chunk_invalid, chunk_rule_sets in self._get_executor().map(_validate_chunk, starts, instances_by_chunk, repeat(strategy), repeat(culture)):
+            invalid_results.update(chunk_invalid)
+            rule_sets_executed.update(chunk_rule_sets)
+
+        if throwOnFailures and invalid_results:
+            raise ValidationException(errors=invalid_results[min(invalid_results)].errors)
+
+        return BatchValidationResult(count, invalid_results, sorted(rule_sets_executed) if rule_sets_executed else None)
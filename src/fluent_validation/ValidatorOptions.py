@@ -41,7 +41,7 @@ class ValidatorSelectorOptions:
 
     @property
     def DefaultSelector(self) -> IValidatorSelector:
-        return DefaultValidatorSelector()
+        return DefaultValidatorSelector.Instance
 
     @property
     def DefaultValidatorSelectorFactory(self) -> Callable[[], IValidatorSelector]:
@@ -83,6 +83,7 @@ class ValidatorConfiguration:
         self._messageFormatterFactory: Callable[[], MessageFormatter] = lambda: MessageFormatter()
         self._errorCodeResolver: Callable[[IPropertyValidator], str] = self.DefaultErrorCodeResolver
         self._languageManager: ILanguageManager = LanguageManager()
+        self._validatorSelectors: ValidatorSelectorOptions = ValidatorSelectorOptions()
 
         self._defaultClassLevelCascadeMode: _CascadeMode = _CascadeMode.Continue
         self._defaultRuleLevelCascadeMode: _CascadeMode = _CascadeMode.Continue
@@ -152,7 +153,7 @@ class ValidatorConfiguration:
 
     @property
     def ValidatorSelectors(self) -> ValidatorSelectorOptions:
-        return ValidatorSelectorOptions()
+        return self._validatorSelectors
 
     @property
     def MessageFormatterFactory(self) -> Callable[[], MessageFormatter]:
@@ -16,6 +16,8 @@
 # The latest version of this file can be found at https://github.com/p-hzamora/FluentValidation
 # endregion
 
+from typing import TYPE_CHECKING
+
 # Interfaces
 from fluent_validation.validators.ComparableComparer import IComparer as IComparer
 from fluent_validation.validators.ComparableComparer import ComparableComparer as ComparableComparer
@@ -40,6 +42,7 @@ from fluent_validation.internal.Resources.ILanguageManager import CultureInfo as
 
 # Result class
 from fluent_validation.results.ValidationResult import ValidationResult as ValidationResult
+from fluent_validation.results.BatchValidationResult import BatchValidationResult as BatchValidationResult
 from fluent_validation.results.ValidationFailure import ValidationFailure as ValidationFailure
 
 # Custom Validation
@@ -56,3 +59,18 @@ from fluent_validation.ValidationException import ValidationException as Validat
 
 # LanguageManager
 from fluent_validation.internal.Resources import LanguageManager as LanguageManager
+
+
+if TYPE_CHECKING:
+    from fluent_validation.ParallelValidator import ParallelValidator as ParallelValidator
+
+
+def __getattr__(name: str):
+    # ParallelValidator is only needed to validate on several processes, so it is imported on first access
+    if name == "ParallelValidator":
+        from fluent_validation.ParallelValidator import ParallelValidator
+
+        # Importing the submodule binds its name in this package, it is bound to the class instead
+        globals()[name] = ParallelValidator
+        return ParallelValidator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
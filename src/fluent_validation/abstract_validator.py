@@ -17,7 +17,9 @@
 # endregion
 
 from __future__ import annotations
-from typing import Awaitable, Callable, Optional, Type, overload, override, TYPE_CHECKING
+from functools import wraps
+from itertools import batched
+from typing import Any, Awaitable, Callable, Iterable, Iterator, Literal, Mapping, Optional, Self, Type, overload, override, TYPE_CHECKING
 import re
 
 from fluent_validation.internal.CollectionPropertyRule import CollectionPropertyRule
@@ -26,7 +28,6 @@ from fluent_validation.internal.ExtensionInternal import ExtensionsInternal
 
 if TYPE_CHECKING:
     from fluent_validation.IValidationRuleInternal import IValidationRuleInternal
-    from fluent_validation.internal.ValidationStrategy import ValidationStrategy
     from .syntax import IConditionBuilder, IRuleBuilder
     from fluent_validation.IValidationRule import IValidationRule
     from fluent_validation.DefaultValidatorOptions import IRuleBuilderInitial
@@ -35,15 +36,22 @@ from fluent_validation.ValidationException import ValidationException
 from fluent_validation.internal.TrackingCollection import TrackingCollection
 from fluent_validation.IValidator import IValidator
 from fluent_validation.results.ValidationResult import ValidationResult
+from fluent_validation.results.BatchValidationResult import BatchValidationResult
+from fluent_validation.internal.ValidationStrategy import ValidationStrategy
 from fluent_validation.IValidationContext import IValidationContext, ValidationContext
 from fluent_validation.internal.PropertyRule import PropertyRule
 from fluent_validation.internal.RuleBuilder import RuleBuilder
 from fluent_validation.internal.RuleSetValidatorSelector import RulesetValidatorSelector
+from fluent_validation.internal.RuleSetIndex import RuleSetIndex
 
 from fluent_validation.ValidatorOptions import ValidatorOptions
+from fluent_validation.internal.Resources.ILanguageManager import CultureInfo, _thread_culture
 from fluent_validation.enums import CascadeMode
 from fluent_validation.internal.IncludeRule import IncludeRule
 from fluent_validation.internal.ConditionBuilder import ConditionBuilder
+from fluent_validation.internal.ExecutionPlan import ExecutionPlan
+from fluent_validation.internal.FailFastFailures import FailFastFailures, StopValidation
+from fluent_validation.internal.VectorizedEngine import VectorizedEngine
 
 
 class AbstractValidator[T](IValidator[T]):
@@ -59,6 +67,61 @@ class AbstractValidator[T](IValidator[T]):
         self._classLevelCascadeMode: Callable[[], CascadeMode] = lambda: ValidatorOptions.Global.DefaultClassLevelCascadeMode
         self._ruleLevelCascadeMode: Callable[[], CascadeMode] = lambda: ValidatorOptions.Global.DefaultRuleLevelCascadeMode
         self._rules: TrackingCollection[IValidationRuleInternal] = TrackingCollection()
+        self._plan: Optional[ExecutionPlan[T]] = None
+        self._rule_set_index: Optional[RuleSetIndex] = None
+        self._shares_rules: bool = False
+
+    def __init_subclass__(cls, cache_rules: bool = False, **kwargs: Any) -> None:
+        """Opts a validator class into the rule definition cache.
+
+        With 'class PersonValidator(AbstractValidator[Person], cache_rules=True)' '__init__' runs once per set of arguments,
+        on a template kept by the cache. Every instance built with the same arguments skips it and shares the rules, the
+        compiled plan and any other attribute set in '__init__' (mutable attributes included). Each instance gets its own
+        rule collection, so rules added afterwards only affect that instance, but the rules themselves are shared and must
+        be treated as read-only. Their cascade modes can only be set in '__init__': the setters raise on cached instances.
+
+        Args:
+            cache_rules: Whether the rules built by '__init__' are shared between instances of this class
+        """
+        super().__init_subclass__(**kwargs)
+        if cache_rules:
+            cls.__init__ = cls.__cache_definition(cls.__init__)
+
+    @classmethod
+    def __cache_definition(cls, init: Callable[..., None]) -> Callable[..., None]:
+        definitions: dict[Any, dict[str, Any]] = {}
+        cls._rule_definitions = definitions
+
+        @wraps(init)
+        def __init__(self: AbstractValidator[T], *args: Any, **kwargs: Any) -> None:
+            # Subclasses calling 'super().__init__()' build their rules as usual
+            if type(self) is not cls:
+                return init(self, *args, **kwargs)
+            try:
+                key = (args, frozenset(kwargs.items()))
+                definition = definitions.get(key, None)
+            except TypeError:
+                return init(self, *args, **kwargs)
+
+            if definition is None:
+                # The rules capture the instance they are built on, so they are built on a template rather than on 'self'
+                template = cls.__new__(cls, *args, **kwargs)
+                init(template, *args, **kwargs)
+                template._shares_rules = True
+                definition = definitions[key] = {**template.__dict__, "_rule_set_index": None}
+
+            self.__dict__.update(definition)
+            self._rules = definition["_rules"].copy()
+            return None
+
+        return __init__
+
+    @classmethod
+    def clear_rules_cache(cls) -> None:
+        """Discards the rules cached for this class, e.g. after changing the global options used to build them."""
+        definitions: Optional[dict[Any, dict[str, Any]]] = cls.__dict__.get("_rule_definitions", None)
+        if definitions:
+            definitions.clear()
 
     @property
     def CascadeMode(self) -> CascadeMode:
@@ -125,6 +188,164 @@ class AbstractValidator[T](IValidator[T]):
 
         return self.__validate__(ValidationContext[T](instance, None, ValidatorOptions.Global.ValidatorSelectors.DefaultValidatorSelectorFactory()))
 
+    def is_valid(self, instance: T, options: Optional[Callable[[ValidationStrategy[T]], None]] = None) -> bool:
+        """Checks whether the instance is valid, without building any validation failure.
+
+        Validation stops at the first failing component, across all the rules and child validators, so it is much cheaper
+        than 'validate' when only the outcome is needed and most instances are invalid.
+
+        Args:
+            instance: The object to validate
+            options: Optional validation strategy options. ThrowOnFailures is ignored
+
+        Returns:
+            True if the instance passes every rule
+        """
+        selector = self._create_strategy(options).GetSelector() if options else ValidatorOptions.Global.ValidatorSelectors.DefaultValidatorSelectorFactory()
+        context = ValidationContext[T](instance, None, selector, FailFastFailures())
+        try:
+            self.__validate__(context)
+        except StopValidation:
+            return False
+        return len(context.Failures) == 0
+
+    @overload
+    def validate_many(self, instances: Iterable[T]) -> BatchValidationResult: ...
+
+    @overload
+    def validate_many(self, instances: Iterable[T], options: Callable[[ValidationStrategy[T]], None]) -> BatchValidationResult: ...
+
+    @overload
+    def validate_many(self, instances: Iterable[T], options: Optional[Callable[[ValidationStrategy[T]], None]], lazy: Literal[True]) -> Iterator[ValidationResult]: ...
+
+    @overload
+    def validate_many(self, instances: Iterable[T], options: Optional[Callable[[ValidationStrategy[T]], None]], *, vectorized: Literal[True]) -> BatchValidationResult: ...
+
+    @overload
+    def validate_many(
+        self,
+        instances: Iterable[T],
+        options: Optional[Callable[[ValidationStrategy[T]], None]],
+        *,
+        workers: int,
+        args: Optional[tuple[Any, ...]] = None,
+        kwargs: Optional[dict[str, Any]] = None,
+    ) -> BatchValidationResult: ...
+
+    @overload
+    def validate_many(self, instances: Iterable[T], options: Optional[Callable[[ValidationStrategy[T]], None]], *, threads: int) -> BatchValidationResult: ...
+
+    def validate_many(
+        self,
+        instances: Iterable[T],
+        options: Optional[Callable[[ValidationStrategy[T]], None]] = None,
+        lazy: bool = False,
+        vectorized: bool = False,
+        workers: Optional[int] = None,
+        threads: Optional[int] = None,
+        args: Optional[tuple[Any, ...]] = None,
+        kwargs: Optional[dict[str, Any]] = None,
+    ) -> BatchValidationResult | Iterator[ValidationResult]:
+        """Validates a batch of instances.
+
+        The validation strategy, the selector and the message formatter are created once and shared by every instance
+        of the batch, instead of being built again on each call to validate.
+
+        Args:
+            instances: The objects to validate
+            options: Optional validation strategy options, applied to every instance
+            lazy: When True, returns a generator that yields one ValidationResult per instance, in input order
+            vectorized: Evaluate the simple property rules column-wise with numpy (see 'validate_columns')
+            workers: Validate on this many processes (see 'ParallelValidator'). The validator must be a module level class
+            threads: Validate on a pool of this many threads. Only worth it on free-threaded builds of Python (3.13t), where threads run in parallel
+            args: With 'workers', the positional arguments used to create the validator in each process ('args=()' if it takes none)
+            kwargs: With 'workers', the keyword arguments used to create the validator in each process
+
+        Returns:
+            A BatchValidationResult, or an iterator of ValidationResult if 'lazy' is True
+        """
+        if vectorized:
+            if lazy:
+                raise ValueError("'lazy' cannot be combined with 'vectorized', the whole batch is evaluated at once")
+            if workers is not None or threads is not None:
+                raise ValueError("'vectorized' cannot be combined with 'workers' or 'threads'")
+            return self.validate_columns(instances, options)
+
+        if workers is not None:
+            if lazy or threads is not None:
+                raise ValueError("'workers' cannot be combined with 'lazy' or 'threads'")
+            from fluent_validation import ParallelValidator
+
+            with ParallelValidator[T](self, workers, args=args, kwargs=kwargs) as parallel:
+                return parallel.validate_many(instances, options)
+
+        if threads is not None:
+            if lazy:
+                raise ValueError("'threads' cannot be combined with 'lazy'")
+            return BatchValidationResult.from_results(self._validate_threaded(instances, self._create_strategy(options), threads))
+
+        results = self._validate_batch(instances, self._create_strategy(options))
+        if lazy:
+            return results
+        return BatchValidationResult.from_results(results)
+
+    def validate_columns(
+        self,
+        columns: Iterable[T] | Mapping[str, Iterable[Any]] | Any,
+        options: Optional[Callable[[ValidationStrategy[T]], None]] = None,
+    ) -> BatchValidationResult:
+        """Validates a batch column-wise using numpy.
+
+        Property rules made only of not_null, comparison, inclusive/exclusive between and length validators with constant
+        arguments are evaluated as array operations. ValidationFailure objects are only created for the rows that fail,
+        through the regular path, so they are identical to the ones returned by validate. Any other rule is run row by row.
+
+        Args:
+            columns: A list of instances, a dict of columns keyed by property name (nested properties as 'Address.Line1') or a numpy structured array
+            options: Optional validation strategy options, applied to every row
+
+        Returns:
+            A BatchValidationResult with one entry per row
+        """
+        strategy = self._create_strategy(options)
+        engine = VectorizedEngine[T](self)
+        return engine.validate(columns, strategy.GetSelector(), ValidatorOptions.Global.MessageFormatterFactory(), strategy._throw)
+
+    @staticmethod
+    def _create_strategy(options: Optional[Callable[[ValidationStrategy[T]], None]]) -> ValidationStrategy[T]:
+        strategy = ValidationStrategy[T]()
+        if options:
+            options(strategy)
+        return strategy
+
+    def _validate_batch(self, instances: Iterable[T], strategy: ValidationStrategy[T]) -> Iterator[ValidationResult]:
+        selector = strategy.GetSelector()
+        messageFormatter = ValidatorOptions.Global.MessageFormatterFactory()
+        throwOnFailures: bool = strategy._throw
+
+        for instance in instances:
+            context = ValidationContext(instance, None, selector, [], messageFormatter)
+            context.ThrowOnFailures = throwOnFailures
+            yield self.validate(context)
+
+    def _validate_threaded(self, instances: Iterable[T], strategy: ValidationStrategy[T], threads: int) -> Iterator[ValidationResult]:
+        # Each chunk gets its own message formatter from '_validate_batch', the only state that changes while validating
+        if not isinstance(instances, (list, tuple)):
+            instances = list(instances)
+        chunk_size: int = max(1, -(-len(instances) // (threads * 4)))
+
+        # The culture is stored per thread, so the pool uses the one of the calling thread to build the messages
+        culture = CultureInfo.CurrentUICulture()
+
+        def initializer() -> None:
+            _thread_culture.CurrentUICulture = culture
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=threads, initializer=initializer) as executor:
+            for results in executor.map(lambda chunk: list(self._validate_batch(chunk, strategy)), batched(instances, chunk_size)):
+                yield from results
+
     def __validate__(self, context: ValidationContext[T]) -> ValidationResult:
         # Use synchronous validation to avoid async deadlocks in nested collections
         return self.ValidateSync(context)
@@ -172,12 +393,16 @@ class AbstractValidator[T](IValidator[T]):
 
             return result
 
-        count: int = len(self._rules)
-        for i in range(count):
-            totalFailures = len(context.Failures)
+        positions = self._rule_positions(context)
+        # Resolved once per run. With CascadeMode.Stop the run ends at the first rule that fails, so the number of
+        # failures to compare with never changes
+        stopOnFailure: bool = self.ClassLevelCascadeMode == CascadeMode.Stop
+        failures = context.Failures
+        totalFailures = len(failures)
+        for i in range(len(self._rules)) if positions is None else positions:
             await self._rules[i].ValidateAsync(context, useAsync)
 
-            if self.ClassLevelCascadeMode == CascadeMode.Stop and len(result.errors) > totalFailures:
+            if stopOnFailure and len(failures) > totalFailures:
                 break
 
         self.SetExecutedRuleSets(result, context)
@@ -222,14 +447,21 @@ class AbstractValidator[T](IValidator[T]):
                 self.RaiseValidationException(context, result)
             return result
 
-        count: int = len(self._rules)
-        for i in range(count):
-            totalFailures = len(context.Failures)
-            # COMMENT: Call synchronous validation instead of async
-            self._rules[i].ValidateSync(context)
-
-            if self.ClassLevelCascadeMode == CascadeMode.Stop and len(result.errors) > totalFailures:
-                break
+        positions = self._rule_positions(context)
+        if self._plan is not None:
+            self._plan.execute(context, positions)
+        elif self.ClassLevelCascadeMode != CascadeMode.Stop:
+            for i in range(len(self._rules)) if positions is None else positions:
+                # COMMENT: Call synchronous validation instead of async
+                self._rules[i].ValidateSync(context)
+        else:
+            # Fail fast: the run ends at the first rule that fails, so the number of failures to compare with never changes
+            failures = context.Failures
+            totalFailures = len(failures)
+            for i in range(len(self._rules)) if positions is None else positions:
+                self._rules[i].ValidateSync(context)
+                if len(failures) > totalFailures:
+                    break
 
         self.SetExecutedRuleSets(result, context)
 
@@ -237,6 +469,56 @@ class AbstractValidator[T](IValidator[T]):
             self.RaiseValidationException(context, result)
         return result
 
+    def compile(self, codegen: bool = False) -> Self:
+        """Lowers the rules of this validator into a flat, pre-resolved ExecutionPlan used by synchronous validation.
+
+        Property names, accessors, conditions and cascade modes are resolved once here instead of on every call to validate.
+        Call it once all the rules have been defined. Adding a new rule, chaining validators or options onto an existing rule
+        or changing the cascade modes afterwards discards the plan, so the validator keeps working through the regular path
+        until 'compile' is called again. Cascade modes inherited from ValidatorOptions.Global are snapshotted too, call
+        'refresh' after changing the global defaults.
+
+        Args:
+            codegen: Generate a specialised Python function for each property rule, with the checks of the built-in validators inlined
+
+        Returns:
+            The same validator, so it can be chained after the constructor
+        """
+        self._plan = ExecutionPlan[T].build(self, codegen)
+        return self
+
+    def _discard_plan(self) -> None:
+        self._plan = None
+
+    def refresh(self) -> Self:
+        """Rebuilds the ExecutionPlan of a compiled validator, to pick up changes made to ValidatorOptions.Global since 'compile'.
+
+        Returns:
+            The same validator. Nothing is done if it is not compiled
+        """
+        if self._plan is not None:
+            self._plan = ExecutionPlan[T].build(self, self._plan.Codegen)
+        return self
+
+    def _rule_positions(self, context: ValidationContext[T]) -> Optional[tuple[int, ...]]:
+        """Returns the positions of the rules that can run with the rule sets selected in 'context', or None to visit every rule."""
+        selector = context.Selector
+        if type(selector) is not RulesetValidatorSelector:
+            return None
+
+        index = self._rule_set_index
+        if index is None or not index.IsCurrent(self._rules):
+            index = self._rule_set_index = RuleSetIndex(self._rules)
+        if len(self._rules) > 0:
+            # The selector records the executed rule sets when it is asked, even if no rule matches. Skipped rules never ask
+            selector.GetExecutedRuleSets(context)
+        return index.positions(selector.RuleSets)
+
+    @property
+    def IsCompiled(self) -> bool:
+        """Whether synchronous validation is currently running through a compiled ExecutionPlan."""
+        return self._plan is not None
+
     def SetExecutedRuleSets(self, result: ValidationResult, context: ValidationContext[T]) -> None:
         """Sets the executed rule sets in the validation result.
 
@@ -281,6 +563,7 @@ class AbstractValidator[T](IValidator[T]):
         ExtensionsInternal.Guard(expression, "Cannot pass None to rule_for", "expression")
         rule: PropertyRule[T, TProperty] = PropertyRule[T, TProperty].create(expression, lambda: self.RuleLevelCascadeMode, self._type_model)
         self._rules.append(rule)
+        self._plan = None
         self.OnRuleAdded(rule)
         return RuleBuilder[T, TProperty](rule, self)
 
@@ -312,6 +595,7 @@ class AbstractValidator[T](IValidator[T]):
         ExtensionsInternal.Guard(expression, "Cannot pass null to rule_for_each", "expression")
         rule = CollectionPropertyRule[T, TElement].Create(expression, lambda: self.RuleLevelCascadeMode, self._type_model)
         self._rules.append(rule)
+        self._plan = None
         self.OnRuleAdded(rule)
         return RuleBuilder[T, TElement](rule, self)
 
@@ -409,6 +693,7 @@ class AbstractValidator[T](IValidator[T]):
         """
         rule = IncludeRule[T].Create(rulesToInclude, lambda: self.RuleLevelCascadeMode, type_model=self._type_model)
         self.Rules.append(rule)
+        self._plan = None
         self.OnRuleAdded(rule)
 
     def pre_validate(self, context: ValidationContext[T], result: ValidationResult) -> bool:
@@ -478,7 +763,9 @@ class AbstractValidator[T](IValidator[T]):
 
     @ClassLevelCascadeMode.setter
     def ClassLevelCascadeMode(self, value):
+        self._raise_if_shares_rules("ClassLevelCascadeMode")
         self._classLevelCascadeMode = lambda: value
+        self._plan = None
 
     @property
     def RuleLevelCascadeMode(self) -> CascadeMode:
@@ -497,6 +784,12 @@ class AbstractValidator[T](IValidator[T]):
 
     @RuleLevelCascadeMode.setter
     def RuleLevelCascadeMode(self, value):
+        self._raise_if_shares_rules("RuleLevelCascadeMode")
         self._ruleLevelCascadeMode = lambda: value
+        self._plan = None
+
+    def _raise_if_shares_rules(self, name: str) -> None:
+        if self._shares_rules:
+            raise RuntimeError(f"'{name}' cannot be changed on '{type(self).__name__}', its rules are shared with other instances. Set it in '__init__' instead.")
 
     # endregion
@@ -16,50 +16,82 @@
 # The latest version of this file can be found at https://github.com/p-hzamora/FluentValidation
 # endregion
 
-from typing import Callable, Optional
-from fluent_validation.MemberInfo import MemberInfo
+from __future__ import annotations
+import dis
+from functools import lru_cache
+import operator
+from types import CodeType
+from typing import Any, Callable, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from fluent_validation.MemberInfo import MemberInfo
+
+
+# Maximum number of lambdas and attribute paths kept by each cache
+ACCESSOR_CACHE_SIZE: int = 1024
 
 
 class AccessorCache[T]:
-    _cache = {}
+    """Turns the lambdas of 'rule_for' into fast accessors.
+
+    A lambda that only reads an attribute chain ('lambda x: x.Address.Line1') is replaced by 'operator.attrgetter', which
+    reads the same attributes without running Python bytecode. Accessors are shared by every rule reading the same path.
+    Any other expression is returned as is.
+    """
 
     @staticmethod
     def GetCachedAccessor[TProperty](member: Optional[MemberInfo], expression: Callable[[T], TProperty], bypass_cache: bool = False, cache_prefix=None) -> Callable[[T], TProperty]:
+        # 'member' and 'cache_prefix' are kept for compatibility, the accessor only depends on the attribute path
         if bypass_cache:
             return expression
 
-        if member is None:
-            if isinstance(expression, str):  # Python equivalent to "ParameterExpression"
-                key = Key(None, expression, f"{type(expression).__name__}:{cache_prefix}")
-            else:
-                return expression
-        else:
-            key = Key(member, expression, cache_prefix)
-
-        if key not in AccessorCache._cache:
-            AccessorCache._cache[key] = expression
-
-        return AccessorCache._cache[key]
+        chain = AccessorCache.attribute_chain(expression)
+        if not chain:
+            return expression
+        return AccessorCache._getter(".".join(chain))
 
     @staticmethod
-    def clear():
-        AccessorCache._cache.clear()
+    def attribute_chain(func: Callable[..., Any]) -> Optional[tuple[str, ...]]:
+        """Returns the attributes accessed by a lambda such as 'lambda x: x.Address.Line1', or None if it does anything else."""
+        code = getattr(func, "__code__", None)
+        if code is None or getattr(func, "__defaults__", None):
+            return None
+        return AccessorCache._code_chain(code)
 
+    @staticmethod
+    @lru_cache(maxsize=ACCESSOR_CACHE_SIZE)
+    def _code_chain(code: CodeType) -> Optional[tuple[str, ...]]:
+        if code.co_argcount != 1 or code.co_freevars:
+            return None
 
-class Key:
-    def __init__(self, member: MemberInfo, expression, cache_prefix):
-        self._member_info = member
-        self._expression_debug_view = f"{cache_prefix}{expression}" if cache_prefix else str(expression)
+        chain: list[str] = []
+        loaded = False
+        for instr in dis.get_instructions(code):
+            if instr.opname in ("RESUME", "CACHE"):
+                continue
+            if not loaded:
+                if instr.opname != "LOAD_FAST" or instr.arg != 0:
+                    return None
+                loaded = True
+            elif instr.opname == "LOAD_ATTR" and "NULL" not in instr.argrepr:
+                chain.append(instr.argval)
+            elif instr.opname == "RETURN_VALUE":
+                return tuple(chain)
+            else:
+                return None
+        return None
 
-    def __eq__(self, other):
-        if not isinstance(other, Key):
-            return False
-        return self._member_info == other._member_info and self._expression_debug_view == other._expression_debug_view
+    @staticmethod
+    @lru_cache(maxsize=ACCESSOR_CACHE_SIZE)
+    def _getter(path: str) -> Callable[[Any], Any]:
+        return operator.attrgetter(path)
 
-    def __hash__(self):
-        # Python equivalent to GetHashCode() with some custom hash calculation
-        hash_member_info = hash(self._member_info) if self._member_info is not None else 0
-        hash_expression_debug_view = hash(self._expression_debug_view) if self._expression_debug_view is not None else 0
+    @staticmethod
+    def cache_info():
+        """Hits and misses of the accessors, one entry per attribute path."""
+        return AccessorCache._getter.cache_info()
 
-        # Combining the hashes similar to the C# approach
-        return (hash_member_info * 397) ^ hash_expression_debug_view
+    @staticmethod
+    def clear():
+        AccessorCache._code_chain.cache_clear()
+        AccessorCache._getter.cache_clear()
@@ -0,0 +1,244 @@
+# region License
+# Copyright (c) .NET Foundation and contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# The latest version of this file can be found at https://github.com/p-hzamora/FluentValidation
+# endregion
+
+from __future__ import annotations
+import datetime as dt
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Optional, TYPE_CHECKING
+import re
+
+from fluent_validation.AsyncValidatorInvokedSynchronouslyException import AsyncValidatorInvokedSynchronouslyException
+from fluent_validation.internal.AccessorCache import AccessorCache
+from fluent_validation.internal.DefaultValidatorSelector import DefaultValidatorSelector
+from fluent_validation.validators.AbstractComparisonValidator import Comparison
+from fluent_validation.validators.ComparableComparer import ComparableComparer
+from fluent_validation.validators.EnumValidator import EnumValidator
+from fluent_validation.validators.GreaterThanOrEqualValidator import GreaterThanOrEqualValidator
+from fluent_validation.validators.GreaterThanValidator import GreaterThanValidator
+from fluent_validation.validators.InclusiveBetweenValidator import InclusiveBetweenValidator
+from fluent_validation.validators.LengthValidator import ExactLengthValidator, LengthValidator, MaximumLengthValidator, MinimumLengthValidator
+from fluent_validation.validators.LessThanOrEqualValidator import LessThanOrEqualValidator
+from fluent_validation.validators.LessThanValidator import LessThanValidator
+from fluent_validation.validators.NotEmptyValidator import NotEmptyValidator
+from fluent_validation.validators.NotNullValidator import NotNullValidator
+from fluent_validation.validators.RegularExpressionValidator import RegularExpressionValidator
+
+if TYPE_CHECKING:
+    from fluent_validation.IValidationContext import ValidationContext
+    from fluent_validation.internal.ExecutionPlan import PropertyRuleStep
+    from fluent_validation.validators.IpropertyValidator import IPropertyValidator
+
+
+_UNSET = object()
+
+_NUMBERS: tuple[type, ...] = (int, float, Decimal)
+_ORDERED: tuple[type, ...] = (str, dt.date, dt.datetime, dt.time, dt.timedelta)
+
+_OPERATORS: dict[Comparison, str] = {
+    Comparison.greater_than: ">",
+    Comparison.GreaterThanOrEqual: ">=",
+    Comparison.less_than: "<",
+    Comparison.LessThanOrEqual: "<=",
+}
+
+
+class CodeGenerator:
+    """Generates a specialised Python function for a PropertyRuleStep.
+
+    Attribute access, null checks, comparisons and length checks of the built-in validators are inlined in the generated
+    source. An inlined check is only used to detect that a value is valid: when it does not pass, the original property
+    validator is invoked, so the failure (message, placeholders, error code...) is built exactly as in the generic path.
+    Any other validator ('must', 'custom', child validators...) always goes through the generic RuleComponent path.
+    """
+
+    INDENT: str = "    "
+
+    @classmethod
+    def inline_check(cls, validator: IPropertyValidator, prefix: str, namespace: dict[str, Any]) -> Optional[str]:
+        """Returns a Python expression over 'value' that is only True when 'validator.is_valid' would return True."""
+        kind = type(validator)
+
+        if kind is NotNullValidator:
+            return "value is not None"
+
+        if kind is NotEmptyValidator:
+            return '(value.__class__ is str and value.strip() != "") or (value.__class__ is list and len(value) > 0) or (value.__class__ is int and value != 0)'
+
+        if kind in (LengthValidator, ExactLengthValidator, MaximumLengthValidator, MinimumLengthValidator):
+            if validator._min_func is not None or validator._max_func is not None:
+                return None
+            upper = "" if validator.Max == -1 else f" and len(value) <= {validator.Max!r}"
+            return f"value is None or (value.__class__ is str and len(value) >= {validator.Min!r}{upper})"
+
+        if kind in (GreaterThanValidator, GreaterThanOrEqualValidator, LessThanValidator, LessThanOrEqualValidator):
+            if validator._valueToCompareFunc is not None or validator._valueToCompareFuncForNullables is not None or not hasattr(validator, "_valueToCompare"):
+                return None
+            return cls._inline_ordered(validator.ValueToCompare, _OPERATORS[validator.Comparison], prefix, namespace)
+
+        if kind is InclusiveBetweenValidator:
+            if getattr(validator._explicitComparer, "__origin__", validator._explicitComparer) is not ComparableComparer:
+                return None
+            namespace[f"{prefix}from"] = validator.From
+            namespace[f"{prefix}to"] = validator.To
+            return f"value is None or (not value < {prefix}from and not value > {prefix}to)"
+
+        if kind is RegularExpressionValidator:
+            if hasattr(validator, "_original_callable"):
+                return None
+            pattern: re.Pattern = validator._regex_func(None)
+            namespace[f"{prefix}match"] = pattern.match
+            return f"value is None or (value.__class__ is str and {prefix}match(value) is not None)"
+
+        if kind is EnumValidator:
+            if not isinstance(validator._enumType, type) or not issubclass(validator._enumType, Enum):
+                return None
+            namespace[f"{prefix}enum"] = validator._enumType
+            return f"value is None or value in {prefix}enum"
+
+        return None
+
+    @staticmethod
+    def _inline_ordered(constant: Any, operator: str, prefix: str, namespace: dict[str, Any]) -> Optional[str]:
+        # Only types whose comparison operators never raise against each other are inlined
+        if type(constant) in _NUMBERS:
+            namespace[f"{prefix}types"] = _NUMBERS
+        elif type(constant) in _ORDERED:
+            namespace[f"{prefix}types"] = (type(constant),)
+        else:
+            return None
+        namespace[f"{prefix}value"] = constant
+        return f"value is None or (value.__class__ in {prefix}types and value {operator} {prefix}value)"
+
+    @classmethod
+    def generate(cls, step: PropertyRuleStep) -> tuple[Callable[[ValidationContext], None], str]:
+        """Returns the generated function together with its source code."""
+        rule = step._rule
+        namespace: dict[str, Any] = {
+            "rule": rule,
+            "property_name": step._property_name,
+            "display_name_func": step._display_name_func,
+            "shared_condition": step._shared_condition,
+            "condition": step._condition,
+            "component_condition": step._component_condition,
+            "dependents": step._dependent_steps,
+            "_UNSET": _UNSET,
+            "default_selector": DefaultValidatorSelector.Instance,
+            "_raise_type_error": cls._raise_type_error,
+            "AsyncValidatorInvokedSynchronouslyException": AsyncValidatorInvokedSynchronouslyException,
+        }
+
+        chain = AccessorCache.attribute_chain(rule.Expression.func)
+        if chain is not None:
+            accessor = ".".join(("context.instance_to_validate", *chain))
+        else:
+            namespace["property_func"] = step._property_func
+            accessor = "property_func(context.instance_to_validate)"
+
+        lines: list[str] = ["def validate(context, guarded=True):"]
+        emit = lines.append
+        i1, i2 = cls.INDENT, cls.INDENT * 2
+
+        if step._property_name:
+            emit(f"{i1}PropertyPath = context.PropertyChain.BuildPropertyPath(property_name)")
+        else:
+            emit(f"{i1}displayName = rule.get_display_name(context)")
+            if step._property_name is None:
+                emit(f"{i1}if displayName is None:")
+                emit(f'{i2}displayName = ""')
+            emit(f"{i1}PropertyPath = context.PropertyChain.BuildPropertyPath(displayName)")
+
+        emit(f"{i1}selector = context.Selector")
+        if step._in_rule_sets:
+            emit(f"{i1}if not selector.CanExecute(rule, PropertyPath, context):")
+        else:
+            emit(f"{i1}if selector is not default_selector and not selector.CanExecute(rule, PropertyPath, context):")
+        emit(f"{i2}return None")
+        if step._shared_condition is not None:
+            emit(f"{i1}if guarded and not shared_condition(context):")
+            emit(f"{i2}return None")
+        if step._condition is not None:
+            emit(f"{i1}if not condition(context):")
+            emit(f"{i2}return None")
+
+        emit(f"{i1}failures = context.Failures")
+        if step._stop_on_failure or step._dependent_steps:
+            emit(f"{i1}total_failures = len(failures)")
+        emit(f"{i1}context.InitializeForPropertyValidator(PropertyPath, display_name_func, property_name)")
+
+        # Conditions hoisted from the components guard all of them, the dependent rules run either way
+        base = i1
+        if step._component_condition is not None and step._components:
+            emit(f"{i1}if component_condition(context):")
+            base = i2
+
+        lazy_value = any(x.condition is not None for x in step._components)
+        if lazy_value:
+            emit(f"{base}value = _UNSET")
+        elif step._components:
+            cls._emit_fetch(emit, base, accessor)
+
+        for index, component_step in enumerate(step._components):
+            prefix = f"c{index}_"
+            namespace[f"{prefix}component"] = component_step.component
+            indent = base
+            if component_step.condition is not None:
+                namespace[f"{prefix}condition"] = component_step.condition
+                emit(f"{indent}if {prefix}condition(context):")
+                indent += cls.INDENT
+                emit(f"{indent}if value is _UNSET:")
+                cls._emit_fetch(emit, indent + cls.INDENT, accessor)
+
+            if component_step.invoke is None:
+                emit(f"{indent}raise AsyncValidatorInvokedSynchronouslyException")
+                continue
+
+            namespace[f"{prefix}invoke"] = component_step.invoke
+            check = cls.inline_check(component_step.component.Validator, prefix, namespace)
+            if check is not None:
+                emit(f"{indent}if not ({check}):")
+                indent += cls.INDENT
+
+            emit(f"{indent}context.MessageFormatter.Reset()")
+            emit(f"{indent}if not {prefix}invoke(context, value):")
+            emit(f"{indent}{cls.INDENT}rule.PrepareMessageFormatterForValidationError(context, value)")
+            emit(f"{indent}{cls.INDENT}failures.append(rule.CreateValidationError(context, value, {prefix}component))")
+            if step._stop_on_failure:
+                emit(f"{indent}if len(failures) > total_failures:")
+                emit(f"{indent}{cls.INDENT}return None")
+
+        if step._dependent_steps:
+            emit(f"{i1}if len(failures) <= total_failures:")
+            emit(f"{i2}for dependent in dependents:")
+            emit(f"{i2}{cls.INDENT}dependent.execute(context)")
+        emit(f"{i1}return None")
+
+        source = "\n".join(lines) + "\n"
+        exec(compile(source, f"<fluent_validation generated rule for '{step._property_name}'>", "exec"), namespace)
+        return namespace["validate"], source
+
+    @classmethod
+    def _emit_fetch(cls, emit: Callable[[str], None], indent: str, accessor: str) -> None:
+        emit(f"{indent}try:")
+        emit(f"{indent}{cls.INDENT}value = {accessor}")
+        emit(f"{indent}except TypeError:")
+        emit(f"{indent}{cls.INDENT}_raise_type_error(rule)")
+
+    @staticmethod
+    def _raise_type_error(rule) -> None:
+        raise TypeError(f"TypeError occurred when executing rule for '{rule.Expression.lambda_to_string}'. If this property can be None you should add a null check using a when condition")
@@ -24,6 +24,8 @@ from fluent_validation.IValidationRuleInternal import IValidationRuleInternal
 from fluent_validation.MemberInfo import MemberInfo
 from fluent_validation.enums import CascadeMode
 from fluent_validation.internal.AccessorCache import AccessorCache
+from fluent_validation.internal.DefaultValidatorSelector import DefaultValidatorSelector
+from fluent_validation.internal.PropertyChain import PropertyChain
 from fluent_validation.internal.RuleBase import RuleBase
 from fluent_validation.internal.RuleComponent import RuleComponent
 from fluent_validation.LambdaExpression import LambdaExpression
@@ -75,7 +77,7 @@ class CollectionPropertyRule[T, TElement](RuleBase[T, list[TElement], TElement],
         compiled = AccessorCache[T].GetCachedAccessor(member, expression, bypassCache, "FV_RuleForEach")
         t_element: Type[TElement] = member.get_type_hint(type_model)
 
-        return CollectionPropertyRule[T, TElement](member, lambda x: compiled(x), expression, cascadeModeThunk, t_element)
+        return CollectionPropertyRule[T, TElement](member, compiled, expression, cascadeModeThunk, t_element)
 
     # 	internal static CollectionPropertyRule[T, TElement] CreateTransformed<TOriginal>(Expression<Func<T, list<TOriginal>>> expression, Func<TOriginal, TElement> transformer, Func<CascadeMode> cascadeModeThunk, bool bypassCache = False) {
     # 		"""
@@ -126,7 +128,8 @@ class CollectionPropertyRule[T, TElement](RuleBase[T, list[TElement], TElement],
 
         # Ensure that this rule is allowed to run.
         # The validatselector has the opportunity to veto this before any of the validators execute.
-        if not context.Selector.CanExecute(self, propertyName, context):
+        selector = context.Selector
+        if (selector is not DefaultValidatorSelector.Instance or self.RuleSets) and not selector.CanExecute(self, propertyName, context):
             return None
 
         if self.Condition:
@@ -150,7 +153,7 @@ class CollectionPropertyRule[T, TElement](RuleBase[T, list[TElement], TElement],
             # If there are no property validators to execute after running the conditions, bail out.
             return None
 
-        cascade = self.CascadeMode
+        stopOnFailure: bool = self.CascadeMode == CascadeMode.Stop
 
         try:
             # FIXME [x]: Get the error most similar to 'NullReferenceException'
@@ -164,45 +167,51 @@ class CollectionPropertyRule[T, TElement](RuleBase[T, list[TElement], TElement],
             if propertyName is None or propertyName == "":
                 raise RuntimeError("Could not automatically determine the property name ")
 
-            for element in collection:
-                index: int = count
-                count += 1
-
-                if self.Filter is not None and not self.Filter(element):
-                    continue
-
-                indexer: str = str(index)
-                useDefaultIndexFormat: bool = True
-
-                if self.IndexBuilder is not None:
-                    indexer = self.IndexBuilder(context.instance_to_validate, collection, element, index)
-                    useDefaultIndexFormat = False
-
-                context.PrepareForChildCollectionValidator()
-                context.PropertyChain.Add(propertyName)
-                context.PropertyChain.AddIndexer(indexer, useDefaultIndexFormat)
-
-                valueToValidate = element
-                propertyPath = context.PropertyChain.ToString()
-                totalFailuresInner = len(context.Failures)
-                context.InitializeForPropertyValidator(propertyPath, self._displayNameFunc, self.PropertyName)
-
-                for component in filteredValidators:
-                    context.MessageFormatter.Reset()
-                    context.MessageFormatter.AppendArgument("CollectionIndex", index)
-
-                    valid: bool = await component.ValidateAsync(context, valueToValidate, useAsync)  # , cancellation
-
-                    if not valid:
-                        self.PrepareMessageFormatterForValidationError(context, valueToValidate)
-                        failure = self.CreateValidationError(context, valueToValidate, component)
-                        context.Failures.append(failure)
-
-                    # If there has been at least one failure, and our CascadeMode has been set to Stop
-                    # then don't continue to the next rule
-                    if len(context.Failures) > totalFailuresInner and cascade == CascadeMode.Stop:
-                        context.RestoreState()
-                        return await AfterValidate()  # 🙃
+            # The context and its chain are prepared once for the whole collection, each element only swaps the indexer
+            collectionChain = PropertyChain(None, [propertyName])
+            context.PrepareForChildCollectionValidator()
+            context.PropertyChain = elementChain = PropertyChain(collectionChain)
+            try:
+                for element in collection:
+                    index: int = count
+                    count += 1
+
+                    if self.Filter is not None and not self.Filter(element):
+                        continue
+
+                    indexer: str = str(index)
+                    useDefaultIndexFormat: bool = True
+
+                    if self.IndexBuilder is not None:
+                        indexer = self.IndexBuilder(context.instance_to_validate, collection, element, index)
+                        useDefaultIndexFormat = False
+
+                    elementChain.ReplaceIndexer(collectionChain, indexer, useDefaultIndexFormat)
+
+                    valueToValidate = element
+                    propertyPath = elementChain.ToString()
+                    totalFailuresInner = len(context.Failures)
+                    context.InitializeForPropertyValidator(propertyPath, self._displayNameFunc, self.PropertyName)
+
+                    for component in filteredValidators:
+                        context.MessageFormatter.Reset()
+                        context.MessageFormatter.AppendArgument("CollectionIndex", index)
+
+                        valid: bool = await component.ValidateAsync(context, valueToValidate, useAsync)  # , cancellation
+
+                        if not valid:
+                            self.PrepareMessageFormatterForValidationError(context, valueToValidate)
+                            failure = self.CreateValidationError(context, valueToValidate, component)
+                            context.Failures.append(failure)
+
+                        # If there has been at least one failure, and our CascadeMode has been set to Stop
+                        # then don't continue to the next rule
+                        if stopOnFailure and len(context.Failures) > totalFailuresInner:
+                            break
+                    else:
+                        continue
+                    break  # Stopped by the cascade mode, the rest of the collection is not validated
+            finally:
                 context.RestoreState()
         return await AfterValidate()
 
@@ -225,7 +234,8 @@ class CollectionPropertyRule[T, TElement](RuleBase[T, list[TElement], TElement],
         if propertyName is None or propertyName == "":
             propertyName = self.InferPropertyName(self.Expression)
 
-        if not context.Selector.CanExecute(self, propertyName, context):
+        selector = context.Selector
+        if (selector is not DefaultValidatorSelector.Instance or self.RuleSets) and not selector.CanExecute(self, propertyName, context):
             return None
 
         if self.Condition:
@@ -237,7 +247,7 @@ class CollectionPropertyRule[T, TElement](RuleBase[T, list[TElement], TElement],
         if len(filteredValidators) == 0:
             return None
 
-        cascade = self.CascadeMode
+        stopOnFailure: bool = self.CascadeMode == CascadeMode.Stop
 
         try:
             collection: list[TElement] = self.PropertyFunc(context.instance_to_validate)
@@ -254,43 +264,49 @@ class CollectionPropertyRule[T, TElement](RuleBase[T, list[TElement], TElement],
             if propertyName is None or propertyName == "":
                 raise RuntimeError("Could not automatically determine the property name ")
 
-            for element in collection:
-                index: int = count
-                count += 1
-
-                if self.Filter is not None and not self.Filter(element):
-                    continue
-
-                indexer: str = str(index)
-                useDefaultIndexFormat: bool = True
-
-                if self.IndexBuilder is not None:
-                    indexer = self.IndexBuilder(context.instance_to_validate, collection, element, index)
-                    useDefaultIndexFormat = False
-
-                context.PrepareForChildCollectionValidator()
-                context.PropertyChain.Add(propertyName)
-                context.PropertyChain.AddIndexer(indexer, useDefaultIndexFormat)
-
-                valueToValidate = element
-                propertyPath = context.PropertyChain.ToString()
-                totalFailuresInner = len(context.Failures)
-                context.InitializeForPropertyValidator(propertyPath, self._displayNameFunc, self.PropertyName)
-
-                for component in filteredValidators:
-                    context.MessageFormatter.Reset()
-                    context.MessageFormatter.AppendArgument("CollectionIndex", index)
-
-                    valid: bool = component.ValidateSync(context, valueToValidate)
-
-                    if not valid:
-                        self.PrepareMessageFormatterForValidationError(context, valueToValidate)
-                        failure = self.CreateValidationError(context, valueToValidate, component)
-                        context.Failures.append(failure)
-
-                    if len(context.Failures) > totalFailuresInner and cascade == CascadeMode.Stop:
-                        context.RestoreState()
-                        return AfterValidateSync()
+            # The context and its chain are prepared once for the whole collection, each element only swaps the indexer
+            collectionChain = PropertyChain(None, [propertyName])
+            context.PrepareForChildCollectionValidator()
+            context.PropertyChain = elementChain = PropertyChain(collectionChain)
+            try:
+                for element in collection:
+                    index: int = count
+                    count += 1
+
+                    if self.Filter is not None and not self.Filter(element):
+                        continue
+
+                    indexer: str = str(index)
+                    useDefaultIndexFormat: bool = True
+
+                    if self.IndexBuilder is not None:
+                        indexer = self.IndexBuilder(context.instance_to_validate, collection, element, index)
+                        useDefaultIndexFormat = False
+
+                    elementChain.ReplaceIndexer(collectionChain, indexer, useDefaultIndexFormat)
+
+                    valueToValidate = element
+                    propertyPath = elementChain.ToString()
+                    totalFailuresInner = len(context.Failures)
+                    context.InitializeForPropertyValidator(propertyPath, self._displayNameFunc, self.PropertyName)
+
+                    for component in filteredValidators:
+                        context.MessageFormatter.Reset()
+                        context.MessageFormatter.AppendArgument("CollectionIndex", index)
+
+                        valid: bool = component.ValidateSync(context, valueToValidate)
+
+                        if not valid:
+                            self.PrepareMessageFormatterForValidationError(context, valueToValidate)
+                            failure = self.CreateValidationError(context, valueToValidate, component)
+                            context.Failures.append(failure)
+
+                        if stopOnFailure and len(context.Failures) > totalFailuresInner:
+                            break
+                    else:
+                        continue
+                    break  # Stopped by the cascade mode, the rest of the collection is not validated
+            finally:
                 context.RestoreState()
         return AfterValidateSync()
 
@@ -17,7 +17,7 @@
 # endregion
 
 from __future__ import annotations
-from typing import Iterable, override, TYPE_CHECKING
+from typing import ClassVar, Iterable, override, TYPE_CHECKING
 
 from fluent_validation.internal.IValidatorSelector import IValidatorSelector
 
@@ -27,9 +27,40 @@ if TYPE_CHECKING:
 
 
 class CompositeValidatorSelector(IValidatorSelector):
+    """Runs a rule when any of its selectors does.
+
+    Selectors are asked lazily, cheapest first, and the remaining ones are skipped as soon as one returns True. The
+    decision of the static selectors is kept per rule and property path, so it is computed once per ValidationStrategy.
+    """
+
+    MaxCachedDecisions: ClassVar[int] = 4096
+
     def __init__(self, selectors: Iterable[IValidatorSelector]):
-        self._selectors: Iterable[IValidatorSelector] = selectors
+        ordered: list[IValidatorSelector] = sorted(selectors, key=lambda x: x.Cost)
+        self._staticSelectors: list[IValidatorSelector] = [x for x in ordered if x.IsStatic]
+        self._selectors: list[IValidatorSelector] = [x for x in ordered if not x.IsStatic]
+        self._decisions: dict[tuple[IValidationRule, str], bool] = {}
+
+    @property
+    @override
+    def IsStatic(self) -> bool:
+        return not self._selectors
+
+    @property
+    @override
+    def Cost(self) -> int:
+        return sum(x.Cost for x in self._selectors)
 
     @override
     def CanExecute(self, rule: IValidationRule, propertyPath: str, context: IValidationContext) -> bool:
-        return any([s.CanExecute(rule, propertyPath, context) for s in self._selectors])
+        if self._staticSelectors:
+            key = (rule, propertyPath)
+            decision = self._decisions.get(key, None)
+            if decision is None:
+                decision = any(s.CanExecute(rule, propertyPath, context) for s in self._staticSelectors)
+                if len(self._decisions) < self.MaxCachedDecisions:
+                    self._decisions[key] = decision
+            if decision:
+                return True
+
+        return any(s.CanExecute(rule, propertyPath, context) for s in self._selectors)
@@ -40,22 +40,24 @@ class ConditionBuilder[T]:
             action()
 
         # Generate unique ID for this shared condition.
-        id = "_FV_Condition_" + str(uuid.uuid4())
+        conditionId = "_FV_Condition_" + str(uuid.uuid4())
 
         def Condition(context: IValidationContext) -> bool:
             actualContext = ValidationContext[T].GetFromNonGenericContext(context)
-
-            if actualContext.instance_to_validate is not None:
-                if cachedResults := actualContext.SharedConditionCache.get(id, None):
-                    if result := cachedResults.get(actualContext.instance_to_validate):
-                        return result
-
-            executionResult = predicate(actualContext.instance_to_validate, actualContext)
-            if actualContext.instance_to_validate is not None:
-                if cachedResults := actualContext.SharedConditionCache.get(id, None):
-                    cachedResults[actualContext.instance_to_validate] = executionResult
-                else:
-                    actualContext.SharedConditionCache[id] = {actualContext.instance_to_validate: executionResult}
+            instance = actualContext.instance_to_validate
+            if instance is None:
+                return predicate(instance, actualContext)
+
+            # Results are keyed by identity, so instances don't need to be hashable and equal instances are not mixed up.
+            # The instance is stored with its result, in case its id is reused by another object during the validation.
+            cachedResults = actualContext.SharedConditionCache.get(conditionId, None)
+            if cachedResults is None:
+                cachedResults = actualContext.SharedConditionCache[conditionId] = {}
+            elif (cached := cachedResults.get(id(instance), None)) is not None and cached[0] is instance:
+                return cached[1]
+
+            executionResult = predicate(instance, actualContext)
+            cachedResults[id(instance)] = (instance, executionResult)
             return executionResult
 
         # Must apply the predicate after the rule has been fully created to ensure any rules-specific conditions have already been applied.
@@ -136,8 +138,14 @@ class ConditionOtherwiseBuilder[T](IConditionBuilder):
         with self._rules.OnItemAdded(onRuleAdded):
             action()
 
+        # A single negated condition is shared by all the rules, so the execution plan can group them
+        condition = self._condition
+
+        def Otherwise(ctx: IValidationContext) -> bool:
+            return not condition(ctx)
+
         for rule in propertyRules:
-            rule.ApplySharedCondition(lambda ctx: not self._condition(ctx))
+            rule.ApplySharedCondition(Otherwise)
 
 
 # internal class AsyncConditionOtherwiseBuilder[T] : IConditionBuilder {
@@ -17,7 +17,7 @@
 # endregion
 
 from __future__ import annotations
-from typing import override, TYPE_CHECKING
+from typing import ClassVar, override, TYPE_CHECKING
 
 from fluent_validation.internal.IValidatorSelector import IValidatorSelector
 from fluent_validation.internal.RuleSetValidatorSelector import RulesetValidatorSelector
@@ -28,10 +28,31 @@ if TYPE_CHECKING:
 
 
 class DefaultValidatorSelector(IValidatorSelector):
+    """Runs every rule that is not part of a RuleSet.
+
+    It has no state, so a single instance ('DefaultValidatorSelector.Instance') is shared by all the contexts. Rules without
+    RuleSets compare the selector against it to skip 'CanExecute', which would always return True.
+    """
+
+    Instance: ClassVar[DefaultValidatorSelector]
+
+    @property
+    @override
+    def IsStatic(self) -> bool:
+        return True
+
+    @property
+    @override
+    def Cost(self) -> int:
+        return 0
+
     @override
     @staticmethod
     def CanExecute(rule: IValidationRule, propertyPath: str, context: IValidationContext):
         # By default we ignore any rules part of a RuleSet.
-        if rule.RuleSets is not None and len(rule.RuleSets) > 0 and RulesetValidatorSelector.DefaultRuleSetName not in tuple(map(str.lower, rule.RuleSets)):
+        if rule.RuleSets and not RulesetValidatorSelector.IncludesDefault(rule.RuleSets):
             return False
         return True
+
+
+DefaultValidatorSelector.Instance = DefaultValidatorSelector()
@@ -0,0 +1,354 @@
+# region License
+# Copyright (c) .NET Foundation and contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# The latest version of this file can be found at https://github.com/p-hzamora/FluentValidation
+# endregion
+
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Optional, TYPE_CHECKING
+
+from fluent_validation.AsyncValidatorInvokedSynchronouslyException import AsyncValidatorInvokedSynchronouslyException
+from fluent_validation.enums import CascadeMode
+from fluent_validation.internal.CodeGenerator import CodeGenerator
+from fluent_validation.internal.ConditionChain import ConditionChain
+from fluent_validation.internal.DefaultValidatorSelector import DefaultValidatorSelector
+from fluent_validation.internal.PropertyRule import PropertyRule
+
+if TYPE_CHECKING:
+    from fluent_validation.abstract_validator import AbstractValidator
+    from fluent_validation.IValidationContext import ValidationContext
+    from fluent_validation.IValidationRuleInternal import IValidationRuleInternal
+    from fluent_validation.internal.RuleComponent import RuleComponent
+
+
+class IPlanStep[T](ABC):
+    """A single, already resolved, unit of work of an ExecutionPlan."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def execute(self, context: ValidationContext[T]) -> None: ...
+
+
+class RuleStep[T](IPlanStep[T]):
+    """Step used for every rule the plan does not know how to lower (collections, includes, custom rules...).
+
+    It simply delegates into the interpreted path, so behaviour is exactly the same as an uncompiled validator.
+    """
+
+    __slots__ = ("_rule",)
+
+    def __init__(self, rule: IValidationRuleInternal[T]) -> None:
+        self._rule: IValidationRuleInternal[T] = rule
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} for {self._rule!r}>"
+
+    def execute(self, context: ValidationContext[T]) -> None:
+        self._rule.ValidateSync(context)
+
+
+class ComponentStep[T, TProperty]:
+    """Pre-resolved view of a RuleComponent: its condition and the bound callable that runs the property validator."""
+
+    __slots__ = (
+        "component",
+        "condition",
+        "invoke",
+    )
+
+    def __init__(self, component: RuleComponent[T, TProperty], hoisted: int = 0) -> None:
+        self.component: RuleComponent[T, TProperty] = component
+        # The first 'hoisted' conditions are evaluated once by the PropertyRuleStep
+        self.condition: Optional[Callable[[ValidationContext[T]], bool]] = ConditionChain.combine(component.Conditions[hoisted:])
+        self.invoke: Optional[Callable[[ValidationContext[T], TProperty], bool]] = component.InvokePropertyValidator if component.SupportsSynchronousValidation else None
+
+
+class PropertyRuleStep[T, TProperty](IPlanStep[T]):
+    """Lowered version of 'PropertyRule.ValidateSync'.
+
+    Everything that does not depend on the instance being validated (property name, accessor, conditions, cascade mode,
+    component list and dependent rules) is resolved once when the plan is built. Conditions applied to every component
+    (a 'when' on the rule builder) are hoisted and evaluated once per rule instead of once per component.
+    """
+
+    __slots__ = (
+        "_rule",
+        "_property_name",
+        "_property_func",
+        "_display_name_func",
+        "_shared_condition",
+        "_condition",
+        "_component_condition",
+        "_in_rule_sets",
+        "_components",
+        "_stop_on_failure",
+        "_dependent_steps",
+    )
+
+    def __init__(self, rule: PropertyRule[T, TProperty], codegen: bool = False, shared: Optional[Callable[[ValidationContext[T]], bool]] = None) -> None:
+        self._rule: PropertyRule[T, TProperty] = rule
+        self._property_name: Optional[str] = rule.PropertyName
+        self._property_func: Callable[[T], TProperty] = rule.PropertyFunc
+        self._display_name_func: Callable[[ValidationContext[T]], str] = rule._displayNameFunc
+
+        # 'shared' is the first condition of the rule, evaluated by its ConditionGroupStep when the rule is part of one
+        conditions = rule.Conditions
+        self._shared_condition: Optional[Callable[[ValidationContext[T]], bool]] = None
+        if shared is not None and conditions and conditions[0] is shared:
+            self._shared_condition = shared
+            conditions = conditions[1:]
+        self._condition: Optional[Callable[[ValidationContext[T]], bool]] = ConditionChain.combine(conditions)
+
+        hoisted = ConditionChain.common_prefix([x.Conditions for x in rule.Components])
+        self._component_condition: Optional[Callable[[ValidationContext[T]], bool]] = ConditionChain.combine(hoisted)
+        self._in_rule_sets: bool = bool(rule.RuleSets)
+        self._components: tuple[ComponentStep[T, TProperty], ...] = tuple(ComponentStep[T, TProperty](x, len(hoisted)) for x in rule.Components)
+        self._stop_on_failure: bool = rule.CascadeMode == CascadeMode.Stop
+        self._dependent_steps: tuple[IPlanStep[T], ...] = tuple(ExecutionPlan.lower(x, codegen) for x in rule.dependent_rules) if rule.dependent_rules else ()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} for '{self._property_name}'>"
+
+    def execute(self, context: ValidationContext[T], guarded: bool = True) -> None:
+        """'guarded' is False when the ConditionGroupStep has already evaluated the shared condition."""
+        rule = self._rule
+        if self._property_name:
+            # The display name is only used to build the path when the rule has no name of its own.
+            PropertyPath: str = context.PropertyChain.BuildPropertyPath(self._property_name)
+        else:
+            displayName: None | str = rule.get_display_name(context)
+            if self._property_name is None and displayName is None:
+                displayName = ""
+            PropertyPath = context.PropertyChain.BuildPropertyPath(displayName)
+
+        selector = context.Selector
+        if (selector is not DefaultValidatorSelector.Instance or self._in_rule_sets) and not selector.CanExecute(rule, PropertyPath, context):
+            return None
+
+        if guarded and self._shared_condition is not None and not self._shared_condition(context):
+            return None
+
+        if self._condition is not None and not self._condition(context):
+            return None
+
+        failures = context.Failures
+        formatter = context.MessageFormatter
+        total_failures = len(failures)
+        first = True
+        propValue: Any = None
+
+        context.InitializeForPropertyValidator(PropertyPath, self._display_name_func, self._property_name)
+
+        # When the hoisted conditions are False every component is skipped, but the dependent rules still run
+        components = self._components
+        if self._component_condition is not None and not self._component_condition(context):
+            components = ()
+
+        for step in components:
+            formatter.Reset()
+
+            if step.condition is not None and not step.condition(context):
+                continue
+
+            if first:
+                first = False
+                try:
+                    propValue = self._property_func(context.instance_to_validate)
+                except TypeError:
+                    raise TypeError(f"TypeError occurred when executing rule for '{rule.Expression.lambda_to_string}'. If this property can be None you should add a null check using a when condition")
+
+            if step.invoke is None:
+                raise AsyncValidatorInvokedSynchronouslyException
+
+            if not step.invoke(context, propValue):
+                rule.PrepareMessageFormatterForValidationError(context, propValue)
+                failures.append(rule.CreateValidationError(context, propValue, step.component))
+
+            # Validators such as 'custom' may add failures while returning True, so the check does not depend on 'invoke'.
+            if self._stop_on_failure and len(failures) > total_failures:
+                break
+
+        if self._dependent_steps and len(failures) <= total_failures:
+            for dependent in self._dependent_steps:
+                dependent.execute(context)
+        return None
+
+
+class GeneratedRuleStep[T, TProperty](PropertyRuleStep[T, TProperty]):
+    """PropertyRuleStep whose execution has been replaced by a function generated by CodeGenerator."""
+
+    __slots__ = (
+        "_function",
+        "_source",
+    )
+
+    def __init__(self, rule: PropertyRule[T, TProperty], shared: Optional[Callable[[ValidationContext[T]], bool]] = None) -> None:
+        super().__init__(rule, codegen=True, shared=shared)
+        self._function, self._source = CodeGenerator.generate(self)
+
+    @property
+    def Source(self) -> str:
+        """Source code of the generated function, useful to debug the fast path."""
+        return self._source
+
+    def execute(self, context: ValidationContext[T], guarded: bool = True) -> None:
+        self._function(context, guarded)
+
+
+class ConditionGroupStep[T](IPlanStep[T]):
+    """Consecutive property rules whose first condition is the same, as those declared in a when/unless/otherwise block.
+
+    With the default selector every rule of the group is selected, so the condition is evaluated once and the whole group
+    is skipped when it is False. Any other selector may skip some of the rules, so each rule evaluates the condition itself
+    once it has been selected, as the interpreted path does.
+    """
+
+    __slots__ = (
+        "_condition",
+        "_steps",
+        "_in_rule_sets",
+        "_stop_on_failure",
+    )
+
+    def __init__(self, condition: Callable[[ValidationContext[T]], bool], steps: tuple[PropertyRuleStep[T, Any], ...], stopOnFailure: bool) -> None:
+        self._condition: Callable[[ValidationContext[T]], bool] = condition
+        self._steps: tuple[PropertyRuleStep[T, Any], ...] = steps
+        self._in_rule_sets: bool = any(x._in_rule_sets for x in steps)
+        self._stop_on_failure: bool = stopOnFailure
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} with {len(self._steps)} steps>"
+
+    @property
+    def Steps(self) -> tuple[PropertyRuleStep[T, Any], ...]:
+        return self._steps
+
+    def execute(self, context: ValidationContext[T]) -> None:
+        guarded: bool = context.Selector is not DefaultValidatorSelector.Instance or self._in_rule_sets
+        if not guarded and not self._condition(context):
+            return None
+
+        if not self._stop_on_failure:
+            for step in self._steps:
+                step.execute(context, guarded)
+            return None
+
+        failures = context.Failures
+        totalFailures = len(failures)
+        for step in self._steps:
+            step.execute(context, guarded)
+            if len(failures) > totalFailures:
+                break
+        return None
+
+
+class ExecutionPlan[T]:
+    """Flat, pre-resolved list of steps built from the rules of an AbstractValidator.
+
+    Created by 'AbstractValidator.compile()'. With 'codegen=True' property rules are lowered to GeneratedRuleStep. The plan is a snapshot: rules, conditions and cascade modes are read once
+    when it is built, so any rule added afterwards discards it and the validator goes back to the interpreted path.
+
+    'Steps' has one step per rule. A full run executes 'Runs' instead, where the rules that share a condition are grouped
+    in a ConditionGroupStep.
+    """
+
+    __slots__ = (
+        "_steps",
+        "_runs",
+        "_stop_on_failure",
+        "_codegen",
+    )
+
+    def __init__(self, steps: tuple[IPlanStep[T], ...], classLevelCascadeMode: CascadeMode, codegen: bool = False, runs: Optional[tuple[IPlanStep[T], ...]] = None) -> None:
+        self._steps: tuple[IPlanStep[T], ...] = steps
+        self._runs: tuple[IPlanStep[T], ...] = runs if runs is not None else steps
+        self._stop_on_failure: bool = classLevelCascadeMode == CascadeMode.Stop
+        self._codegen: bool = codegen
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} with {len(self._steps)} steps>"
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    @property
+    def Steps(self) -> tuple[IPlanStep[T], ...]:
+        return self._steps
+
+    @property
+    def Runs(self) -> tuple[IPlanStep[T], ...]:
+        return self._runs
+
+    @property
+    def Codegen(self) -> bool:
+        return self._codegen
+
+    @classmethod
+    def build(cls, validator: AbstractValidator[T], codegen: bool = False) -> ExecutionPlan[T]:
+        stopOnFailure: bool = validator.ClassLevelCascadeMode == CascadeMode.Stop
+        steps: list[IPlanStep[T]] = []
+        runs: list[IPlanStep[T]] = []
+
+        rules = list(validator.Rules)
+        start = 0
+        while start < len(rules):
+            shared = cls._shared_condition(rules[start])
+            end = start + 1
+            while shared is not None and end < len(rules) and cls._shared_condition(rules[end]) is shared:
+                end += 1
+
+            if end - start > 1:
+                group = tuple(cls.lower(rule, codegen, shared) for rule in rules[start:end])
+                steps.extend(group)
+                runs.append(ConditionGroupStep[T](shared, group, stopOnFailure))
+            else:
+                step = cls.lower(rules[start], codegen)
+                steps.append(step)
+                runs.append(step)
+            start = end
+
+        return cls(tuple(steps), validator.ClassLevelCascadeMode, codegen, tuple(runs))
+
+    @staticmethod
+    def _shared_condition(rule: IValidationRuleInternal[T]) -> Optional[Callable[[ValidationContext[T]], bool]]:
+        if type(rule) is PropertyRule and rule.Conditions:
+            return rule.Conditions[0]
+        return None
+
+    @staticmethod
+    def lower(rule: IValidationRuleInternal[T], codegen: bool = False, shared: Optional[Callable[[ValidationContext[T]], bool]] = None) -> IPlanStep[T]:
+        # Only plain property rules are lowered. Subclasses (IncludeRule...) override ValidateSync, so they keep their own behaviour.
+        if type(rule) is PropertyRule:
+            return GeneratedRuleStep(rule, shared) if codegen else PropertyRuleStep(rule, shared=shared)
+        return RuleStep(rule)
+
+    def execute(self, context: ValidationContext[T], positions: Optional[tuple[int, ...]] = None) -> None:
+        """Runs the steps in order, or only those at 'positions' (see RuleSetIndex)."""
+        steps = self._runs if positions is None else [self._steps[i] for i in positions]
+        if not self._stop_on_failure:
+            for step in steps:
+                step.execute(context)
+            return None
+
+        # Fail fast: the run ends at the first step that fails, so the number of failures to compare with never changes
+        failures = context.Failures
+        totalFailures = len(failures)
+        for step in steps:
+            step.execute(context)
+            if len(failures) > totalFailures:
+                break
+        return None
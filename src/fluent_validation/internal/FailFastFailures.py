@@ -0,0 +1,49 @@
+# region License
+# Copyright (c) .NET Foundation and contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# The latest version of this file can be found at https://github.com/p-hzamora/FluentValidation
+# endregion
+
+from __future__ import annotations
+from typing import Any, Iterable, Never
+
+
+class StopValidation(Exception):
+    """Raised at the first failure of a fail fast validation, to leave every rule and child validator at once."""
+
+
+class FailFastFailures(list):
+    """Failure list of 'AbstractValidator.is_valid'.
+
+    Child contexts share the failure list of their parent, so its type tells every rule that only the outcome matters. Rules
+    raise StopValidation before building the ValidationFailure (see 'RuleBase.PrepareMessageFormatterForValidationError'),
+    and any failure added anyway, as 'context.AddFailure' in a 'custom' rule does, stops the validation too.
+    """
+
+    __slots__ = ()
+
+    def append(self, failure: Any) -> Never:
+        raise StopValidation
+
+    def insert(self, index: int, failure: Any) -> Never:
+        raise StopValidation
+
+    def extend(self, failures: Iterable[Any]) -> None:
+        for _ in failures:
+            raise StopValidation
+
+    def __iadd__(self, failures: Iterable[Any]) -> FailFastFailures:
+        self.extend(failures)
+        return self
@@ -27,5 +27,18 @@ if TYPE_CHECKING:
 
 
 class IValidatorSelector(ABC):
+    @property
+    def IsStatic(self) -> bool:
+        """Whether 'CanExecute' depends only on the rule and the property path.
+
+        The decisions of a static selector are reused for every instance validated with the same ValidationStrategy.
+        """
+        return False
+
+    @property
+    def Cost(self) -> int:
+        """Relative cost of 'CanExecute'. CompositeValidatorSelector asks the cheapest selectors first."""
+        return 100
+
     @abstractmethod
     def CanExecute(self, rule: IValidationRule, propertyPath: str, context: IValidationContext) -> bool: ...
@@ -17,7 +17,8 @@
 # endregion
 
 from __future__ import annotations
-from typing import Iterable, Optional, override, Callable, Any, TYPE_CHECKING
+from typing import Collection, Iterable, Optional, override, Callable, Any, TYPE_CHECKING
+from functools import lru_cache
 import re
 
 from fluent_validation.MemberInfo import MemberInfo
@@ -29,18 +30,84 @@ if TYPE_CHECKING:
     from fluent_validation.IValidationContext import IValidationContext
 
 
+class _MemberNode:
+    __slots__ = ("children", "selected")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _MemberNode] = {}
+        self.selected: bool = False
+
+
+class _MemberTrie:
+    """Member names split on every '.' and '[' and stored as a trie of their segments.
+
+    Separators are kept as segments, so walking a property path through the trie gives the same answers as the prefix
+    checks 'memberName.startswith(propertyPath + ".")' and alike, in time proportional to the depth of the path.
+    """
+
+    __slots__ = ("_root",)
+
+    _segments: re.Pattern[str] = re.compile(r"([.\[])")
+
+    def __init__(self, memberNames: Iterable[str]) -> None:
+        self._root: _MemberNode = _MemberNode()
+        for memberName in memberNames:
+            node = self._root
+            for segment in self.split(memberName):
+                node = node.children.setdefault(segment, _MemberNode())
+            node.selected = True
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def compile(memberNames: tuple[str, ...]) -> tuple[_MemberTrie, Optional[_MemberTrie]]:
+        """Returns the trie of all member names and the trie of those with a wildcard indexer ('Orders[].Name'), if any."""
+        wildcards = [x for x in memberNames if "[]" in x]
+        return _MemberTrie(memberNames), _MemberTrie(wildcards) if wildcards else None
+
+    @classmethod
+    def split(cls, path: str) -> list[str]:
+        return cls._segments.split(path)
+
+    def Matches(self, propertyPath: str, includeChildren: bool) -> bool:
+        segments = self.split(propertyPath)
+        last = len(segments) - 1
+        node = self._root
+        for i, segment in enumerate(segments):
+            node = node.children.get(segment)
+            # No member name starts like this path, the remaining segments cannot match anything
+            if node is None:
+                return False
+
+            # The path is a child property of a selected member
+            if includeChildren and node.selected and i < last and segments[i + 1] == ".":
+                return True
+
+        # The path is a selected member, or the parent of one (a child property or an item of a collection)
+        return node.selected or "." in node.children or "[" in node.children
+
+
 class MemberNameValidatorSelector(IValidatorSelector):
     DisableCascadeKey: str = "_FV_DisableSelectorCascadeForChildRules"
 
     _collectionIndexNormalizer: re.Pattern[str] = re.compile(r"\[.*?\]")
 
     def __init__(self, memberNames: Iterable[str]):
-        self._memberNames: Iterable[str] = memberNames
+        names: tuple[str, ...] = tuple(memberNames)
+        # Keep the caller's collection, unless it was an iterator consumed above
+        self._memberNames: Iterable[str] = memberNames if isinstance(memberNames, Collection) else names
+
+        self._hasChildMembers: bool = any("." in x for x in names)
+        self._members, self._wildcardMembers = _MemberTrie.compile(names)
 
     @property
     def MemberNames(self) -> Iterable[str]:
         return self._memberNames
 
+    @property
+    @override
+    def Cost(self) -> int:
+        return 20
+
     @override
     def CanExecute(self, rule: IValidationRule, propertyPath: str, context: IValidationContext) -> bool:
         from fluent_validation.internal.IncludeRule import IIncludeRule
@@ -48,67 +115,31 @@ class MemberNameValidatorSelector(IValidatorSelector):
         # Validator selector only applies to the top level.
         # If we're running in a child context then this means that the child validator has already been selected
         # Because of this, we assume that the rule should continue (ie if the parent rule is valid, all children are valid)
-        isChildContext: bool = context.IsChildContext
-        cascadeEnabled: bool = self.DisableCascadeKey not in context.RootContextData
-
         # If a child validator is being executed and the cascade is enabled (which is the default)
         # then the child validator's rule should always be included.
         # The only time this isn't the case is if the member names contained for inclusion are for child
         # properties (which is indicated by them containing a period).
-        if isChildContext and cascadeEnabled and not any(["." in x for x in self._memberNames]):
+        if not self._hasChildMembers and context.IsChildContext and self.DisableCascadeKey not in context.RootContextData:
             return True
 
         if isinstance(rule, IIncludeRule):
             return True
-        # Stores the normalized property name if we're working with collection properties
-        # eg Orders[0].Name -> Orders[].Name. This is only initialized if needed (see below).
-        normalizedPropertyPath: Optional[str] = None
-
-        # If the current property path is equal to any of the member names for inclusion
-        # or it's a child property path (indicated by a period) where we have a partial match.
-        for memberName in self._memberNames:
-            # If the property path is equal to any of the input member names then it should be executed.
-            if memberName == propertyPath:
-                return True
 
-            # If the property path is for a child property,
-            # and the parent property is selected for inclusion,
-            # then it should be allowed to execute.
-            if propertyPath.startswith(memberName + "."):
-                return True
-
-            # If the property path is for a parent property,
-            # and any of its child properties are selected for inclusion
-            # then it should be allowed to execute
-            if memberName.startswith(propertyPath + "."):
-                return True
-
-            # If the property path is for a collection property
-            # and a child property for this collection has been passed in for inclusion.
-            # For example, memberName is "Orders[0].Amount"
-            # and propertyPath is "Orders" then it should be allowed to execute.
-            if memberName.startswith(propertyPath + "["):
-                return True
+        # If the property path is equal to any of the member names for inclusion, a child property of one of them,
+        # or the parent of one of them (eg "Orders" when "Orders[0].Amount" was passed in for inclusion).
+        if self._members.Matches(propertyPath, includeChildren=True):
+            return True
 
-            # If property path is for child property within collection,
-            # and member path contains wildcard [] then this means that we want to match
-            # with all items in the collection, but we need to normalize the property path
-            # in order to match. For example, if the propertyPath is "Orders[0].Name"
-            # and the memberName for inclusion is "Orders[].Name" then this should
-            # be allowed to match.
-            if "[]" in memberName:
-                if normalizedPropertyPath is None:
-                    # Normalize the property path using a regex. Orders[0].Name -> Orders[].Name.
-                    normalizedPropertyPath = self._collectionIndexNormalizer.sub("[]", propertyPath)
-
-                if memberName == normalizedPropertyPath:
-                    return True
-
-                if memberName.startswith(normalizedPropertyPath + "."):
-                    return True
-
-                if memberName.startswith(normalizedPropertyPath + "["):
-                    return True
+        # If property path is for child property within collection,
+        # and member path contains wildcard [] then this means that we want to match
+        # with all items in the collection, but we need to normalize the property path
+        # in order to match. For example, if the propertyPath is "Orders[0].Name"
+        # and the memberName for inclusion is "Orders[].Name" then this should
+        # be allowed to match.
+        if self._wildcardMembers is not None and "[" in propertyPath:
+            # Normalize the property path using a regex. Orders[0].Name -> Orders[].Name.
+            normalizedPropertyPath = self._collectionIndexNormalizer.sub("[]", propertyPath)
+            return self._wildcardMembers.Matches(normalizedPropertyPath, includeChildren=False)
 
         return False
 
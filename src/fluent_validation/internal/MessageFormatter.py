@@ -16,15 +16,20 @@
 # The latest version of this file can be found at https://github.com/p-hzamora/FluentValidation
 # endregion
 
+from functools import lru_cache
 import re
+from typing import Optional
 
 
 class MessageFormatter:
-    _placeholderValues: dict[str, object] = {}
     _keyRegex: re.Pattern = re.compile(r"{([^{}:]+)(?::([^{}]+))?}")
     PropertyName = "PropertyName"
     PropertyValue = "PropertyValue"
 
+    def __init__(self) -> None:
+        # One dict per formatter. A class-level dict would be shared by every validation running at the same time
+        self._placeholderValues: dict[str, object] = {}
+
     def __repr__(self) -> str:
         return f"{MessageFormatter.__name__}"
 
@@ -42,21 +47,60 @@ class MessageFormatter:
         return self.replace_placeholders(messageTemplate)
 
     def replace_placeholders(self, message_template: str):
-        def replace(match: re.Match[str]) -> str:
-            key = match.group(1)
+        return self.format_template(message_template, self._placeholderValues)
+
+    @classmethod
+    def format_template(cls, message_template: str, placeholderValues: dict[str, object]) -> str:
+        """Replaces the placeholders of 'message_template' with 'placeholderValues'. Used to render messages after the formatter has been reset."""
+        tokens = cls.parse_template(cls._keyRegex, message_template)
+        if tokens is None:
+            return message_template  # No placeholders
+
+        parts: list[str] = []
+        for token in tokens:
+            if token.__class__ is str:
+                parts.append(token)
+                continue
 
-            if key not in self._placeholderValues:
-                return match.group(0)  # No placeholder / value
+            key, format_spec, placeholder = token
+            if key not in placeholderValues:
+                parts.append(placeholder)  # No placeholder / value
+                continue
 
-            value = self._placeholderValues.get(key)
+            value = placeholderValues[key]
+            if format_spec is None:
+                if value is not None:
+                    parts.append(str(value))
+            else:
+                parts.append(format(value, format_spec))  # Format specified?
+        return "".join(parts)
 
-            format = match.group(2)
-            if format is None:
-                return str(value) if value is not None else None
-            format_string = f"{{0:{format}}}"
-            return format_string.format(value)  # Format specified?
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def parse_template(keyRegex: re.Pattern, message_template: str) -> Optional[tuple[str | tuple[str, Optional[str], str], ...]]:
+        """Splits a template into literal strings and (name, format, placeholder) tuples, or None if it has no placeholders.
 
-        return self._keyRegex.sub(replace, message_template)
+        The templates come from a small set (language files and 'with_message'), so they are parsed once and kept in an LRU cache.
+        """
+        tokens: list[str | tuple[str, Optional[str], str]] = []
+        position: int = 0
+        for match in keyRegex.finditer(message_template):
+            if match.start() > position:
+                tokens.append(message_template[position : match.start()])
+            tokens.append((match.group(1), match.group(2), match.group(0)))
+            position = match.end()
+
+        if not tokens:
+            return None
+        if position < len(message_template):
+            tokens.append(message_template[position:])
+        return tuple(tokens)
+
+    @property
+    def RendersLazily(self) -> bool:
+        """True if messages can be rendered later with 'format_template', i.e. the formatter does not override how they are built."""
+        formatter_type = type(self)
+        return formatter_type.BuildMessage is MessageFormatter.BuildMessage and formatter_type.replace_placeholders is MessageFormatter.replace_placeholders
 
     @property
     def PlaceholderValues(self) -> dict[str, object]:
@@ -23,14 +23,122 @@ from fluent_validation.MemberInfo import MemberInfo
 from fluent_validation.ValidatorOptions import ValidatorOptions
 
 
+# Maximum number of children interned by each node, so chains built from arbitrary names do not grow without limit
+_MAX_CHILDREN: int = 256
+
+# Separator the path of every node is built with. Paths for other separators are built on demand
+_DEFAULT_SEPARATOR: str = "."
+
+
+class _PathNode:
+    """Immutable link of a property path. Nodes are shared by every chain going through the same properties.
+
+    Nodes are shared between threads, so their path is built once in the constructor. The caches filled later only
+    add entries, and two threads racing to add the same one store equal strings.
+    """
+
+    __slots__ = (
+        "_parent",
+        "_name",
+        "_count",
+        "_path",
+        "_children",
+        "_paths",
+        "_indexers",
+        "_separated",
+    )
+
+    def __init__(self, parent: Optional[_PathNode], name: str) -> None:
+        self._parent: Optional[_PathNode] = parent
+        self._name: str = name
+        self._count: int = 0 if parent is None else parent._count + 1
+        if self._count == 0:
+            self._path: str = ""
+        elif parent._count == 0:
+            self._path = name
+        else:
+            self._path = parent._path + _DEFAULT_SEPARATOR + name
+        self._children: dict[str, _PathNode] = {}
+        self._paths: dict[str, str] = {}
+        self._indexers: Optional[dict[str, _PathNode]] = None
+        # Paths built with a separator other than the default one, keyed by separator, or by (separator, name) for 'build_path'
+        self._separated: Optional[dict[str | tuple[str, str], str]] = None
+
+    def child(self, name: str) -> _PathNode:
+        node = self._children.get(name, None)
+        if node is None:
+            node = _PathNode(self, name)
+            if len(self._children) < _MAX_CHILDREN:
+                node = self._children.setdefault(name, node)
+        return node
+
+    def with_name(self, name: str) -> _PathNode:
+        """Returns a node in the same position with a different name, used by indexers. They are interned by this node."""
+        indexers = self._indexers
+        if indexers is None:
+            indexers = self._indexers = {}
+        node = indexers.get(name, None)
+        if node is None:
+            node = _PathNode(self._parent, name)
+            if len(indexers) < _MAX_CHILDREN:
+                node = indexers.setdefault(name, node)
+        return node
+
+    def _separated_paths(self) -> dict[str | tuple[str, str], str]:
+        paths = self._separated
+        if paths is None:
+            paths = self._separated = {}
+        return paths
+
+    def to_string(self) -> str:
+        # The separator is global and can change at any time, so it is read on every call
+        separator = ValidatorOptions.Global.PropertyChainSeparator
+        if separator == _DEFAULT_SEPARATOR or self._parent is None or self._parent._count == 0:
+            return self._path
+
+        paths = self._separated_paths()
+        path = paths.get(separator, None)
+        if path is None:
+            path = paths.setdefault(separator, self._parent.to_string() + separator + self._name)
+        return path
+
+    def build_path(self, name: str) -> str:
+        separator = ValidatorOptions.Global.PropertyChainSeparator
+        if separator == _DEFAULT_SEPARATOR:
+            paths = self._paths
+            key = name
+        else:
+            paths = self._separated_paths()
+            key = (separator, name)
+
+        path = paths.get(key, None)
+        if path is None:
+            path = self.to_string() + separator + name
+            if len(paths) < _MAX_CHILDREN:
+                path = paths.setdefault(key, path)
+        return path
+
+
+_ROOT: _PathNode = _PathNode(None, "")
+
+
 class PropertyChain:
+    """Chain of properties from the root instance to the property being validated.
+
+    The chain is a handle over immutable nodes shared between chains, so copying a chain, adding a member or building a
+    path does not copy the member names, and the string form of each node is built only once.
+    """
+
+    __slots__ = ("_node",)
+
     def __init__(self, parent: Optional["PropertyChain"] = None, memberNames: Optional[Iterable[str]] = None):
-        self._memberNames: list[str] = []
+        self._node: _PathNode = _ROOT
 
-        if parent and not memberNames and len(parent._memberNames) > 0:
-            self._memberNames.extend(parent._memberNames)
+        if parent and not memberNames and len(parent) > 0:
+            self._node = parent._node
         elif not parent and memberNames:
-            self._memberNames.extend(memberNames)
+            for name in memberNames:
+                self._node = self._node.child(name)
 
     # Original method
     # @staticmethod
@@ -72,31 +180,30 @@ class PropertyChain:
     def Add(self, member: MemberInfo) -> None:
         if isinstance(member, str):
             if not (member is None or member == ""):
-                self._memberNames.append(member)
+                self._node = self._node.child(member)
             return None
         if member:
-            self._memberNames.append(member.Name)
+            self._node = self._node.child(member.Name)
         return None
 
     def AddIndexer(self, indexer: Any, surroundWithBrackets: bool = True) -> None:
-        if len(self._memberNames) == 0:
+        if self._node._count == 0:
             raise AttributeError("Could not apply an Indexer because the property chain is empty.")
 
-        last: str = self._memberNames[len(self._memberNames) - 1]
+        last: str = self._node._name
         last += f"[{indexer}]" if surroundWithBrackets else indexer
 
-        self._memberNames[len(self._memberNames) - 1] = last
+        self._node = self._node.with_name(last)
         return None
 
+    def ReplaceIndexer(self, collectionChain: PropertyChain, indexer: Any, surroundWithBrackets: bool = True) -> None:
+        """Points this chain to 'collectionChain' followed by 'indexer', so a single chain is reused for every item of a collection."""
+        self._node = collectionChain._node
+        self.AddIndexer(indexer, surroundWithBrackets)
+
     @override
     def ToString(self) -> str:
-        match len(self._memberNames):
-            case 0:
-                return ""
-            case 1:
-                return self._memberNames[0]
-            case _:
-                return ValidatorOptions.Global.PropertyChainSeparator.join(self._memberNames)
+        return self._node.to_string()
 
     # bool IsChildChainOf(PropertyChain parentChain:
     # 	return ToString().StartsWith(parentChain.ToString())
@@ -106,16 +213,18 @@ class PropertyChain:
     # 	=> BuildPropertyPath(propertyName)
 
     def BuildPropertyPath(self, propertyName: str) -> str:
-        if len(self._memberNames) == 0:
+        if self._node._count == 0:
             return propertyName
 
-        chain = PropertyChain(self)
-        chain.Add(propertyName)
-        return chain.ToString()
+        if not isinstance(propertyName, str):
+            propertyName = propertyName.Name if propertyName else None
+        if not propertyName:
+            return self._node.to_string()
+        return self._node.build_path(propertyName)
 
     @property
     def Count(self) -> int:
-        return len(self._memberNames)
+        return self._node._count
 
     def __len__(self):
-        return len(self._memberNames)
+        return self._node._count
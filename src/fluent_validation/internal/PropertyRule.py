@@ -21,6 +21,7 @@ from typing import Any, Callable, Self, TYPE_CHECKING, Type
 
 from fluent_validation.MemberInfo import MemberInfo
 from fluent_validation.internal.AccessorCache import AccessorCache
+from fluent_validation.internal.DefaultValidatorSelector import DefaultValidatorSelector
 
 from fluent_validation.enums import CascadeMode
 from fluent_validation.internal.RuleBase import RuleBase
@@ -53,7 +54,7 @@ class PropertyRule[T, TProperty](RuleBase[T, TProperty, TProperty]):
         compiled = AccessorCache[T].GetCachedAccessor(member, expression, bypassCache)
 
         t_property: Type[TProperty] = member.get_type_hint(type_model)
-        return PropertyRule[T, TProperty](member, lambda x: compiled(x), expression, cascadeModeThunk, t_property)
+        return PropertyRule[T, TProperty](member, compiled, expression, cascadeModeThunk, t_property)
 
     def AddValidator(self, validator: IPropertyValidator[T, TProperty]) -> None:
         component: RuleComponent = RuleComponent[T, TProperty](validator)
@@ -67,7 +68,8 @@ class PropertyRule[T, TProperty](RuleBase[T, TProperty, TProperty]):
             displayName = ""
 
         PropertyPath: str = context.PropertyChain.BuildPropertyPath(displayName if not self.PropertyName else self.PropertyName)
-        if not context.Selector.CanExecute(self, PropertyPath, context):
+        selector = context.Selector
+        if (selector is not DefaultValidatorSelector.Instance or self.RuleSets) and not selector.CanExecute(self, PropertyPath, context):
             return None
 
         if self.Condition:
@@ -87,7 +89,7 @@ class PropertyRule[T, TProperty](RuleBase[T, TProperty, TProperty]):
 
         first = True
         propValue = None
-        cascade = self.CascadeMode
+        stopOnFailure: bool = self.CascadeMode == CascadeMode.Stop
         total_failures = len(context.Failures)
 
         context.InitializeForPropertyValidator(PropertyPath, self._displayNameFunc, self.PropertyName)
@@ -118,7 +120,7 @@ class PropertyRule[T, TProperty](RuleBase[T, TProperty, TProperty]):
                 failure = self.CreateValidationError(context, propValue, component)
                 context.Failures.append(failure)
 
-            if len(context.Failures) > total_failures and cascade == CascadeMode.Stop:
+            if stopOnFailure and len(context.Failures) > total_failures:
                 break
 
         if len(context.Failures) <= total_failures and self.dependent_rules is not None:
@@ -135,7 +137,8 @@ class PropertyRule[T, TProperty](RuleBase[T, TProperty, TProperty]):
             displayName = ""
 
         PropertyPath: str = context.PropertyChain.BuildPropertyPath(displayName if not self.PropertyName else self.PropertyName)
-        if not context.Selector.CanExecute(self, PropertyPath, context):
+        selector = context.Selector
+        if (selector is not DefaultValidatorSelector.Instance or self.RuleSets) and not selector.CanExecute(self, PropertyPath, context):
             return None
 
         if self.Condition:
@@ -144,7 +147,7 @@ class PropertyRule[T, TProperty](RuleBase[T, TProperty, TProperty]):
 
         first = True
         propValue = None
-        cascade = self.CascadeMode
+        stopOnFailure: bool = self.CascadeMode == CascadeMode.Stop
         total_failures = len(context.Failures)
 
         context.InitializeForPropertyValidator(PropertyPath, self._displayNameFunc, self.PropertyName)
@@ -168,7 +171,7 @@ class PropertyRule[T, TProperty](RuleBase[T, TProperty, TProperty]):
                 failure = self.CreateValidationError(context, propValue, component)
                 context.Failures.append(failure)
 
-            if len(context.Failures) > total_failures and cascade == CascadeMode.Stop:
+            if stopOnFailure and len(context.Failures) > total_failures:
                 break
 
         if len(context.Failures) <= total_failures and self.dependent_rules is not None:
@@ -16,68 +16,10 @@
 # The latest version of this file can be found at https://github.com/p-hzamora/FluentValidation
 # endregion
 
-from typing import Callable, Literal, Optional, override
+from typing import Literal, Optional, override
 
 from .ILanguageManager import ILanguageManager, CultureInfo
-from .Lenguages import (
-    EnglishLanguage,
-    AlbanianLanguage,
-    ArabicLanguage,
-    AzerbaijaneseLanguage,
-    BengaliLanguage,
-    BosnianLanguage,
-    BulgarianLanguage,
-    CatalanLanguage,
-    ChineseSimplifiedLanguage,
-    ChineseTraditionalLanguage,
-    CroatianLanguage,
-    CzechLanguage,
-    DanishLanguage,
-    DutchLanguage,
-    EstonianLanguage,
-    FinnishLanguage,
-    FrenchLanguage,
-    GermanLanguage,
-    GeorgianLanguage,
-    GreekLanguage,
-    HebrewLanguage,
-    HindiLanguage,
-    HungarianLanguage,
-    IcelandicLanguage,
-    IndonesianLanguage,
-    ItalianLanguage,
-    JapaneseLanguage,
-    KazakhLanguage,
-    KhmerLanguage,
-    KoreanLanguage,
-    LatvianLanguage,
-    MacedonianLanguage,
-    NorwegianBokmalLanguage,
-    NorwegianNynorskLanguage,
-    PersianLanguage,
-    PolishLanguage,
-    PortugueseLanguage,
-    PortugueseBrazilLanguage,
-    RomanianLanguage,
-    RomanshLanguage,
-    RussianLanguage,
-    SerbianCyrillicLanguage,
-    SerbianLatinLanguage,
-    SlovakLanguage,
-    SlovenianLanguage,
-    SpanishLanguage,
-    SwedishLanguage,
-    TajikLanguage,
-    TamilLanguage,
-    TeluguLanguage,
-    ThaiLanguage,
-    TurkishLanguage,
-    UkrainianLanguage,
-    UzbekCyrillicLanguage,
-    UzbekLatinLanguage,
-    VietnameseLanguage,
-    WelshLanguage,
-)
+from .Lenguages import EnglishLanguage, load_language
 
 type ValidatorType = (
     str
@@ -129,6 +71,9 @@ class LanguageManager(ILanguageManager, LanguageManagerExtension):
         self._languages = {}
         self._enabled = True
         self._culture: Optional[CultureInfo] = None
+        # Resolved lookups, cleared whenever a translation is added or removed
+        self._strings: dict[tuple[str, str], str] = {}
+        self._error_messages: dict[tuple[str, Optional[str], str], str] = {}
 
     @property
     def Enabled(self) -> bool:
@@ -137,6 +82,11 @@ class LanguageManager(ILanguageManager, LanguageManagerExtension):
     @Enabled.setter
     def Enabled(self, value: bool) -> None:
         self._enabled = value
+        self._clear_cache()
+
+    def _clear_cache(self) -> None:
+        self._strings.clear()
+        self._error_messages.clear()
 
     @staticmethod
     def GetTranslation(culture: str, key: str) -> Optional[str]:
@@ -151,69 +101,8 @@ class LanguageManager(ILanguageManager, LanguageManagerExtension):
         Optional[str]: The corresponding Language instance or null.
         """
 
-        dicc: dict[str, Callable[[str], str]] = {
-            EnglishLanguage.AmericanCulture: lambda x: EnglishLanguage.GetTranslation(x),
-            EnglishLanguage.BritishCulture: lambda x: EnglishLanguage.GetTranslation(x),
-            EnglishLanguage.Culture: lambda x: EnglishLanguage.GetTranslation(x),
-            AlbanianLanguage.Culture: lambda x: AlbanianLanguage.GetTranslation(x),
-            ArabicLanguage.Culture: lambda x: ArabicLanguage.GetTranslation(x),
-            AzerbaijaneseLanguage.Culture: lambda x: AzerbaijaneseLanguage.GetTranslation(x),
-            BengaliLanguage.Culture: lambda x: BengaliLanguage.GetTranslation(x),
-            BosnianLanguage.Culture: lambda x: BosnianLanguage.GetTranslation(x),
-            BulgarianLanguage.Culture: lambda x: BulgarianLanguage.GetTranslation(x),
-            CatalanLanguage.Culture: lambda x: CatalanLanguage.GetTranslation(x),
-            ChineseSimplifiedLanguage.Culture: lambda x: ChineseSimplifiedLanguage.GetTranslation(x),
-            ChineseTraditionalLanguage.Culture: lambda x: ChineseTraditionalLanguage.GetTranslation(x),
-            CroatianLanguage.Culture: lambda x: CroatianLanguage.GetTranslation(x),
-            CzechLanguage.Culture: lambda x: CzechLanguage.GetTranslation(x),
-            DanishLanguage.Culture: lambda x: DanishLanguage.GetTranslation(x),
-            DutchLanguage.Culture: lambda x: DutchLanguage.GetTranslation(x),
-            EstonianLanguage.Culture: lambda x: EstonianLanguage.GetTranslation(x),
-            FinnishLanguage.Culture: lambda x: FinnishLanguage.GetTranslation(x),
-            FrenchLanguage.Culture: lambda x: FrenchLanguage.GetTranslation(x),
-            GermanLanguage.Culture: lambda x: GermanLanguage.GetTranslation(x),
-            GeorgianLanguage.Culture: lambda x: GeorgianLanguage.GetTranslation(x),
-            GreekLanguage.Culture: lambda x: GreekLanguage.GetTranslation(x),
-            HebrewLanguage.Culture: lambda x: HebrewLanguage.GetTranslation(x),
-            HindiLanguage.Culture: lambda x: HindiLanguage.GetTranslation(x),
-            HungarianLanguage.Culture: lambda x: HungarianLanguage.GetTranslation(x),
-            IcelandicLanguage.Culture: lambda x: IcelandicLanguage.GetTranslation(x),
-            IndonesianLanguage.Culture: lambda x: IndonesianLanguage.GetTranslation(x),
-            ItalianLanguage.Culture: lambda x: ItalianLanguage.GetTranslation(x),
-            JapaneseLanguage.Culture: lambda x: JapaneseLanguage.GetTranslation(x),
-            KazakhLanguage.Culture: lambda x: KazakhLanguage.GetTranslation(x),
-            KhmerLanguage.Culture: lambda x: KhmerLanguage.GetTranslation(x),
-            KoreanLanguage.Culture: lambda x: KoreanLanguage.GetTranslation(x),
-            LatvianLanguage.Culture: lambda x: LatvianLanguage.GetTranslation(x),
-            MacedonianLanguage.Culture: lambda x: MacedonianLanguage.GetTranslation(x),
-            NorwegianBokmalLanguage.Culture: lambda x: NorwegianBokmalLanguage.GetTranslation(x),
-            NorwegianNynorskLanguage.Culture: lambda x: NorwegianNynorskLanguage.GetTranslation(x),
-            PersianLanguage.Culture: lambda x: PersianLanguage.GetTranslation(x),
-            PolishLanguage.Culture: lambda x: PolishLanguage.GetTranslation(x),
-            PortugueseLanguage.Culture: lambda x: PortugueseLanguage.GetTranslation(x),
-            PortugueseBrazilLanguage.Culture: lambda x: PortugueseBrazilLanguage.GetTranslation(x),
-            RomanianLanguage.Culture: lambda x: RomanianLanguage.GetTranslation(x),
-            RomanshLanguage.Culture: lambda x: RomanshLanguage.GetTranslation(x),
-            RussianLanguage.Culture: lambda x: RussianLanguage.GetTranslation(x),
-            SerbianCyrillicLanguage.Culture: lambda x: SerbianCyrillicLanguage.GetTranslation(x),
-            SerbianLatinLanguage.Culture: lambda x: SerbianLatinLanguage.GetTranslation(x),
-            SlovakLanguage.Culture: lambda x: SlovakLanguage.GetTranslation(x),
-            SlovenianLanguage.Culture: lambda x: SlovenianLanguage.GetTranslation(x),
-            SpanishLanguage.Culture: lambda x: SpanishLanguage.GetTranslation(x),
-            SwedishLanguage.Culture: lambda x: SwedishLanguage.GetTranslation(x),
-            TajikLanguage.Culture: lambda x: TajikLanguage.GetTranslation(x),
-            TamilLanguage.Culture: lambda x: TamilLanguage.GetTranslation(x),
-            TeluguLanguage.Culture: lambda x: TeluguLanguage.GetTranslation(x),
-            ThaiLanguage.Culture: lambda x: ThaiLanguage.GetTranslation(x),
-            TurkishLanguage.Culture: lambda x: TurkishLanguage.GetTranslation(x),
-            UkrainianLanguage.Culture: lambda x: UkrainianLanguage.GetTranslation(x),
-            UzbekCyrillicLanguage.Culture: lambda x: UzbekCyrillicLanguage.GetTranslation(x),
-            UzbekLatinLanguage.Culture: lambda x: UzbekLatinLanguage.GetTranslation(x),
-            VietnameseLanguage.Culture: lambda x: VietnameseLanguage.GetTranslation(x),
-            WelshLanguage.Culture: lambda x: WelshLanguage.GetTranslation(x),
-        }
-        value = dicc.get(culture, None)
-        return value(key) if value is not None else None
+        language = load_language(culture)
+        return language.Translations.get(key, None) if language is not None else None
 
     @property
     @override
@@ -227,6 +116,7 @@ class LanguageManager(ILanguageManager, LanguageManagerExtension):
     def Clear(self) -> None:
         """Removes all languages except the default."""
         self._languages.clear()
+        self._clear_cache()
 
     def AddTranslation(self, culture: str, key: ValidatorType, message: str) -> None:
         """Adds a custom translation for a specific culture and key."""
@@ -239,6 +129,31 @@ class LanguageManager(ILanguageManager, LanguageManagerExtension):
             raise ValueError(f"'{message}' must not be empty")
 
         self._languages[f"{culture}:{key}"] = message
+        self._clear_cache()
+
+    def _get_culture(self, culture: Optional[CultureInfo]) -> CultureInfo:
+        if culture is not None:
+            return culture
+        if self.Culture is not None:
+            return self.Culture
+        return CultureInfo.CurrentUICulture()
+
+    def _memoizes(self) -> bool:
+        # Subclasses that look strings up on their own may return a different one on every call, so nothing is memoized for them
+        cls = type(self)
+        return cls.GetString is LanguageManager.GetString and cls._find_string is LanguageManager._find_string and cls.GetTranslation is LanguageManager.GetTranslation
+
+    @override
+    def ResolveErrorMessageUsingErrorCode(self, error_code: str, fall_back_Key: str) -> str:
+        """Same as 'LanguageManagerExtension.ResolveErrorMessageUsingErrorCode', memoized per culture, error code and fallback key."""
+        if not self._memoizes():
+            return LanguageManagerExtension.ResolveErrorMessageUsingErrorCode(self, error_code, fall_back_Key)
+
+        cache_key = (self._get_culture(None).Name if self._enabled else "", error_code, fall_back_Key)
+        message = self._error_messages.get(cache_key, None)
+        if message is None:
+            message = self._error_messages[cache_key] = LanguageManagerExtension.ResolveErrorMessageUsingErrorCode(self, error_code, fall_back_Key)
+        return message
 
     @override
     def GetString(self, key: str, culture: Optional[CultureInfo] = None) -> str:
@@ -254,13 +169,21 @@ class LanguageManager(ILanguageManager, LanguageManagerExtension):
             str
 
         """
-        if self._enabled:
-            if culture is None:
-                if self.Culture is not None:
-                    culture = self.Culture
-                else:
-                    culture = CultureInfo.CurrentUICulture()
+        if not self._enabled:
+            return self._find_string(key, None)
+
+        culture = self._get_culture(culture)
+        if not self._memoizes():
+            return self._find_string(key, culture)
+
+        cache_key = (culture.Name, key)
+        value = self._strings.get(cache_key, None)
+        if value is None:
+            value = self._strings[cache_key] = self._find_string(key, culture)
+        return value
 
+    def _find_string(self, key: str, culture: Optional[CultureInfo]) -> str:
+        if culture is not None:
             currentCultureKey: str = culture.Name + ":" + key
 
             value = self._languages.get(currentCultureKey, self.GetTranslation(culture.Name, key))
@@ -22,37 +22,38 @@
 class AlbanianLanguage:
     Culture: str = "sq"
 
+    Translations: dict[str, str] = {
+        "EmailValidator": "'{PropertyName}' nuk është një adresë e saktë emaili.",
+        "GreaterThanOrEqualValidator": "'{PropertyName}' duhet të jetë më e madhe se ose e barabartë me '{ComparisonValue}'.",
+        "GreaterThanValidator": "'{PropertyName}' duhet të jetë më e madhe se '{ComparisonValue}'.",
+        "LengthValidator": "'{PropertyName}' duhet të jetë midis {min_length} dhe {max_length} karakteresh. Ju keni shkruar {total_length} karaktere.",
+        "MinimumLengthValidator": "Gjatësia e '{PropertyName}' duhet të jetë të paktën {min_length} karaktere. Ju keni shkruar {total_length} karaktere.",
+        "MaximumLengthValidator": "Gjatësia e '{PropertyName}' duhet të jetë {max_length} karaktere ose më pak. Ju keni shkruar {total_length} karaktere.",
+        "LessThanOrEqualValidator": "'{PropertyName}'  duhet të jetë më e vogël ose e barabartë me '{ComparisonValue}'.",
+        "LessThanValidator": "'{PropertyName}' duhet të jetë më e vogël se '{ComparisonValue}'.",
+        "NotEmptyValidator": "'{PropertyName}' nuk duhet të jetë bosh.",
+        "NotEqualValidator": "'{PropertyName}' nuk duhet të jetë e barabartë me '{ComparisonValue}'.",
+        "NotNullValidator": "'{PropertyName}' nuk duhet të jetë bosh.",
+        "PredicateValidator": "Kushti i specifikuar nuk u arrit për '{PropertyName}'.",
+        "AsyncPredicateValidator": "Kushti i specifikuar nuk u arrit për '{PropertyName}'.",
+        "RegularExpressionValidator": "'{PropertyName}' nuk është në formatin e duhur.",
+        "EqualValidator": "'{PropertyName}' duhet të jetë e barabartë me '{ComparisonValue}'.",
+        "ExactLengthValidator": "'{PropertyName}' duhet të jetë {max_length} karaktere në gjatësi. Ju keni shkruar {total_length} karaktere.",
+        "InclusiveBetweenValidator": "'{PropertyName}' duhet të jetë midis {From} dhe {To}. Ju keni shkruar {PropertyValue}.",
+        "ExclusiveBetweenValidator": "'{PropertyName}' duhet të jetë midis {From} dhe {To} (përjashtuese). Ju keni shkruar {PropertyValue}.",
+        "CreditCardValidator": "'{PropertyName}' nuk është nje numër i vlefshëm karte krediti.",
+        "ScalePrecisionValidator": "'{PropertyName}' nuk mund të jetë më shumë se {ExpectedPrecision} shifra në total, me hapësirë për {ExpectedScale} shifra dhjetore. {Digits} shifra dhe {ActualScale} shifra dhjetore u gjetën.",
+        "EmptyValidator": "'{PropertyName}' nuk duhet të jetë bosh.",
+        "NullValidator": "'{PropertyName}' duhet të jetë bosh.",
+        "EnumValidator": "'{PropertyName}' ka një varg vlerash të cilat nuk përfshijnë '{PropertyValue}'.",
+        # Additional fallback messages used by clientside validation integration.
+        "Length_Simple": "'{PropertyName}' duhet të jetë midis {min_length} dhe {max_length} karakteresh.",
+        "MinimumLength_Simple": "Gjatësia e '{PropertyName}' duhet të jetë të paktën {min_length} karaktere.",
+        "MaximumLength_Simple": "Gjatësia e '{PropertyName}' duhet të jetë {max_length} karaktere ose më pak.",
+        "ExactLength_Simple": "'{PropertyName}' duhet të jetë {max_length} karaktere në gjatësi.",
+        "InclusiveBetween_Simple": "'{PropertyName}' duhet të jetë midis {From} dhe {To}.",
+    }
+
     @staticmethod
     def GetTranslation(key: str) -> str:
-        dicc: dict[str, str] = {
-            "EmailValidator": "'{PropertyName}' nuk është një adresë e saktë emaili.",
-            "GreaterThanOrEqualValidator": "'{PropertyName}' duhet të jetë më e madhe se ose e barabartë me '{ComparisonValue}'.",
-            "GreaterThanValidator": "'{PropertyName}' duhet të jetë më e madhe se '{ComparisonValue}'.",
-            "LengthValidator": "'{PropertyName}' duhet të jetë midis {min_length} dhe {max_length} karakteresh. Ju keni shkruar {total_length} karaktere.",
-            "MinimumLengthValidator": "Gjatësia e '{PropertyName}' duhet të jetë të paktën {min_length} karaktere. Ju keni shkruar {total_length} karaktere.",
-            "MaximumLengthValidator": "Gjatësia e '{PropertyName}' duhet të jetë {max_length} karaktere ose më pak. Ju keni shkruar {total_length} karaktere.",
-            "LessThanOrEqualValidator": "'{PropertyName}'  duhet të jetë më e vogël ose e barabartë me '{ComparisonValue}'.",
-            "LessThanValidator": "'{PropertyName}' duhet të jetë më e vogël se '{ComparisonValue}'.",
-            "NotEmptyValidator": "'{PropertyName}' nuk duhet të jetë bosh.",
-            "NotEqualValidator": "'{PropertyName}' nuk duhet të jetë e barabartë me '{ComparisonValue}'.",
-            "NotNullValidator": "'{PropertyName}' nuk duhet të jetë bosh.",
-            "PredicateValidator": "Kushti i specifikuar nuk u arrit për '{PropertyName}'.",
-            "AsyncPredicateValidator": "Kushti i specifikuar nuk u arrit për '{PropertyName}'.",
-            "RegularExpressionValidator": "'{PropertyName}' nuk është në formatin e duhur.",
-            "EqualValidator": "'{PropertyName}' duhet të jetë e barabartë me '{ComparisonValue}'.",
-            "ExactLengthValidator": "'{PropertyName}' duhet të jetë {max_length} karaktere në gjatësi. Ju keni shkruar {total_length} karaktere.",
-            "InclusiveBetweenValidator": "'{PropertyName}' duhet të jetë midis {From} dhe {To}. Ju keni shkruar {PropertyValue}.",
-            "ExclusiveBetweenValidator": "'{PropertyName}' duhet të jetë midis {From} dhe {To} (përjashtuese). Ju keni shkruar {PropertyValue}.",
-            "CreditCardValidator": "'{PropertyName}' nuk është nje numër i vlefshëm karte krediti.",
-            "ScalePrecisionValidator": "'{PropertyName}' nuk mund të jetë më shumë se {ExpectedPrecision} shifra në total, me hapësirë për {ExpectedScale} shifra dhjetore. {Digits} shifra dhe {ActualScale} shifra dhjetore u gjetën.",
-            "EmptyValidator": "'{PropertyName}' nuk duhet të jetë bosh.",
-            "NullValidator": "'{PropertyName}' duhet të jetë bosh.",
-            "EnumValidator": "'{PropertyName}' ka një varg vlerash të cilat nuk përfshijnë '{PropertyValue}'.",
-            # Additional fallback messages used by clientside validation integration.
-            "Length_Simple": "'{PropertyName}' duhet të jetë midis {min_length} dhe {max_length} karakteresh.",
-            "MinimumLength_Simple": "Gjatësia e '{PropertyName}' duhet të jetë të paktën {min_length} karaktere.",
-            "MaximumLength_Simple": "Gjatësia e '{PropertyName}' duhet të jetë {max_length} karaktere ose më pak.",
-            "ExactLength_Simple": "'{PropertyName}' duhet të jetë {max_length} karaktere në gjatësi.",
-            "InclusiveBetween_Simple": "'{PropertyName}' duhet të jetë midis {From} dhe {To}.",
-        }
-        return dicc.get(key, None)
+        return AlbanianLanguage.Translations.get(key, None)
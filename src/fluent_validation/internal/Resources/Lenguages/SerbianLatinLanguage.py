@@ -22,37 +22,38 @@
 class SerbianLatinLanguage:
     Culture: str = "sr-Latn"
 
+    Translations: dict[str, str] = {
+        "EmailValidator": "'{PropertyName}' nije validna email adresa.",
+        "GreaterThanOrEqualValidator": "'{PropertyName}' mora biti veće ili jednako od '{ComparisonValue}'.",
+        "GreaterThanValidator": "'{PropertyName}' mora biti veće od '{ComparisonValue}'.",
+        "LengthValidator": "'{PropertyName}' mora imati između {min_length} i {max_length} karaktera. Uneseno je {total_length} karaktera.",
+        "MinimumLengthValidator": "'{PropertyName}' mora imati najmanje {min_length} karaktera. Uneseno je {total_length} karaktera.",
+        "MaximumLengthValidator": "'{PropertyName}' ne sme imati više od {max_length} karaktera. Uneseno je {total_length} karaktera.",
+        "LessThanOrEqualValidator": "'{PropertyName}' mora biti manje ili jednako od '{ComparisonValue}'.",
+        "LessThanValidator": "'{PropertyName}' mora biti manje od '{ComparisonValue}'.",
+        "NotEmptyValidator": "'{PropertyName}' ne sme biti prazno.",
+        "NotEqualValidator": "'{PropertyName}' ne sme biti jednako '{ComparisonValue}'.",
+        "NotNullValidator": "'{PropertyName}' ne sme biti prazno.",
+        "PredicateValidator": "Zadati uslov nije ispunjen za '{PropertyName}'.",
+        "AsyncPredicateValidator": "Zadati uslov nije ispunjen za '{PropertyName}'.",
+        "RegularExpressionValidator": "'{PropertyName}' nije u odgovarajućem formatu.",
+        "EqualValidator": "'{PropertyName}' mora biti jednako '{ComparisonValue}'.",
+        "ExactLengthValidator": "'{PropertyName}' mora imati tačno {max_length} karaktera. Uneseno je {total_length} karaktera.",
+        "InclusiveBetweenValidator": "'{PropertyName}' mora biti između {From} i {To}. Uneseno je {PropertyValue}.",
+        "ExclusiveBetweenValidator": "'{PropertyName}' mora biti između {From} i {To} (ekskluzivno). Uneseno je {PropertyValue}.",
+        "CreditCardValidator": "'{PropertyName}' nije validan broj kreditne kartice.",
+        "ScalePrecisionValidator": "'{PropertyName}' ne sme imati više od {ExpectedPrecision} cifara, sa dozvoljenih {ExpectedScale} decimalnih mesta. Uneseno je {Digits} cifara i {ActualScale} decimalnih mesta.",
+        "EmptyValidator": "'{PropertyName}' mora biti prazno.",
+        "NullValidator": "'{PropertyName}' mora biti prazno.",
+        "EnumValidator": "'{PropertyName}' ima raspon vrednosti koji ne uključuje '{PropertyValue}'.",
+        # Additional fallback messages used by clientside validation integration.
+        "Length_Simple": "'{PropertyName}' mora imati između {min_length} i {max_length} karaktera.",
+        "MinimumLength_Simple": "'{PropertyName}' mora imati najmanje {min_length} karaktera.",
+        "MaximumLength_Simple": "'{PropertyName}' ne sme imati više od {max_length} karaktera.",
+        "ExactLength_Simple": "'{PropertyName}' mora imati tačno {max_length} karaktera.",
+        "InclusiveBetween_Simple": "'{PropertyName}' mora biti između {From} i {To}.",
+    }
+
     @staticmethod
     def GetTranslation(key: str) -> str:
-        dicc: dict[str, str] = {
-            "EmailValidator": "'{PropertyName}' nije validna email adresa.",
-            "GreaterThanOrEqualValidator": "'{PropertyName}' mora biti veće ili jednako od '{ComparisonValue}'.",
-            "GreaterThanValidator": "'{PropertyName}' mora biti veće od '{ComparisonValue}'.",
-            "LengthValidator": "'{PropertyName}' mora imati između {min_length} i {max_length} karaktera. Uneseno je {total_length} karaktera.",
-            "MinimumLengthValidator": "'{PropertyName}' mora imati najmanje {min_length} karaktera. Uneseno je {total_length} karaktera.",
-            "MaximumLengthValidator": "'{PropertyName}' ne sme imati više od {max_length} karaktera. Uneseno je {total_length} karaktera.",
-            "LessThanOrEqualValidator": "'{PropertyName}' mora biti manje ili jednako od '{ComparisonValue}'.",
-            "LessThanValidator": "'{PropertyName}' mora biti manje od '{ComparisonValue}'.",
-            "NotEmptyValidator": "'{PropertyName}' ne sme biti prazno.",
-            "NotEqualValidator": "'{PropertyName}' ne sme biti jednako '{ComparisonValue}'.",
-            "NotNullValidator": "'{PropertyName}' ne sme biti prazno.",
-            "PredicateValidator": "Zadati uslov nije ispunjen za '{PropertyName}'.",
-            "AsyncPredicateValidator": "Zadati uslov nije ispunjen za '{PropertyName}'.",
-            "RegularExpressionValidator": "'{PropertyName}' nije u odgovarajućem formatu.",
-            "EqualValidator": "'{PropertyName}' mora biti jednako '{ComparisonValue}'.",
-            "ExactLengthValidator": "'{PropertyName}' mora imati tačno {max_length} karaktera. Uneseno je {total_length} karaktera.",
-            "InclusiveBetweenValidator": "'{PropertyName}' mora biti između {From} i {To}. Uneseno je {PropertyValue}.",
-            "ExclusiveBetweenValidator": "'{PropertyName}' mora biti između {From} i {To} (ekskluzivno). Uneseno je {PropertyValue}.",
-            "CreditCardValidator": "'{PropertyName}' nije validan broj kreditne kartice.",
-            "ScalePrecisionValidator": "'{PropertyName}' ne sme imati više od {ExpectedPrecision} cifara, sa dozvoljenih {ExpectedScale} decimalnih mesta. Uneseno je {Digits} cifara i {ActualScale} decimalnih mesta.",
-            "EmptyValidator": "'{PropertyName}' mora biti prazno.",
-            "NullValidator": "'{PropertyName}' mora biti prazno.",
-            "EnumValidator": "'{PropertyName}' ima raspon vrednosti koji ne uključuje '{PropertyValue}'.",
-            # Additional fallback messages used by clientside validation integration.
-            "Length_Simple": "'{PropertyName}' mora imati između {min_length} i {max_length} karaktera.",
-            "MinimumLength_Simple": "'{PropertyName}' mora imati najmanje {min_length} karaktera.",
-            "MaximumLength_Simple": "'{PropertyName}' ne sme imati više od {max_length} karaktera.",
-            "ExactLength_Simple": "'{PropertyName}' mora imati tačno {max_length} karaktera.",
-            "InclusiveBetween_Simple": "'{PropertyName}' mora biti između {From} i {To}.",
-        }
-        return dicc.get(key, None)
+        return SerbianLatinLanguage.Translations.get(key, None)
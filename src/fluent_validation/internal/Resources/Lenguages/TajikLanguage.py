@@ -22,37 +22,38 @@
 class TajikLanguage:
     Culture: str = "tg"
 
+    Translations: dict[str, str] = {
+        "EmailValidator": "'{PropertyName}' суроғаи почтаи электронии дуруст нест.",
+        "GreaterThanOrEqualValidator": "'{PropertyName}' бояд аз '{ComparisonValue}' бузургтар ё баробар бошад.",
+        "GreaterThanValidator": "'{PropertyName}' бояд аз '{ComparisonValue}' бузургтар бошад.",
+        "LengthValidator": "'{PropertyName}' бояд дар байни аломатҳои {min_length} ва {max_length} бошад. Миқдори аломатҳои воридшуда: {total_length}",
+        "MinimumLengthValidator": "Дарозии '{PropertyName}' бояд ҳадди аққал {min_length} аломат бошад. Миқдори аломатҳои воридшуда: {total_length}",
+        "MaximumLengthValidator": "Дарозии '{PropertyName}' бояд {max_length} аломат ё камтар бошад. Миқдори аломатҳои воридшуда: {total_length}",
+        "LessThanOrEqualValidator": "'{PropertyName}' бояд аз '{ComparisonValue}' камтар ё баробар бошад.",
+        "LessThanValidator": "'{PropertyName}' бояд камтар аз '{ComparisonValue}' бошад.",
+        "NotEmptyValidator": "'{PropertyName}' набояд холӣ бошад.",
+        "NotEqualValidator": "'{PropertyName}' набояд ба '{ComparisonValue}' баробар бошад.",
+        "NotNullValidator": "'{PropertyName}' набояд холӣ бошад.",
+        "PredicateValidator": "Шарти муайяншуда барои '{PropertyName}' иҷро нашуд.",
+        "AsyncPredicateValidator": "Шарти муайяншуда барои '{PropertyName}' иҷро нашуд.",
+        "RegularExpressionValidator": "'{PropertyName}' дар формати дуруст нест.",
+        "EqualValidator": "'{PropertyName}' бояд ба '{ComparisonValue}' баробар бошад.",
+        "ExactLengthValidator": "'{PropertyName}' бояд дарозии {max_length} аломат бошад. Миқдори аломатҳои воридшуда: {total_length}",
+        "InclusiveBetweenValidator": "'{PropertyName}' бояд байни {From} ва {To} бошад. Шумо {PropertyValue}-ро ворид кардаед.",
+        "ExclusiveBetweenValidator": "'{PropertyName}' бояд байни {From} ва {To} (ба истиснои ҳаминҳо) бошад. Шумо {PropertyValue}-ро ворид кардаед.",
+        "CreditCardValidator": "'{PropertyName}' рақами дурусти корти кредитӣ нест.",
+        "ScalePrecisionValidator": "'{PropertyName}' набояд дар маҷмӯъ аз рақамҳои {ExpectedPrecision} зиёд бошад, бо назардошти он барои даҳҳо {ExpectedScale}. {Digits} рақам ва {ActualScale} даҳӣ ёфт шуданд.",
+        "EmptyValidator": "'{PropertyName}' бояд холӣ бошад.",
+        "NullValidator": "'{PropertyName}' бояд холӣ бошад.",
+        "EnumValidator": "'{PropertyName}' як қатор арзишҳо дорад, ки '{PropertyValue}'-ро дар бар намегирад.",
+        # Additional fallback messages used by clientside validation integration.
+        "Length_Simple": "'{PropertyName}' бояд дар байни {min_length} ва {max_length} аломат бошад.",
+        "MinimumLength_Simple": "Дарозии '{PropertyName}' бояд ҳадди аққал {min_length} аломат бошад.",
+        "MaximumLength_Simple": "Дарозии '{PropertyName}' бояд {max_length} аломат ё камтар бошад.",
+        "ExactLength_Simple": "'{PropertyName}' бояд дарозии {max_length} аломат бошад.",
+        "InclusiveBetween_Simple": "'{PropertyName}' бояд байни {From} ва {To} бошад.",
+    }
+
     @staticmethod
     def GetTranslation(key: str) -> str:
-        dicc: dict[str, str] = {
-            "EmailValidator": "'{PropertyName}' суроғаи почтаи электронии дуруст нест.",
-            "GreaterThanOrEqualValidator": "'{PropertyName}' бояд аз '{ComparisonValue}' бузургтар ё баробар бошад.",
-            "GreaterThanValidator": "'{PropertyName}' бояд аз '{ComparisonValue}' бузургтар бошад.",
-            "LengthValidator": "'{PropertyName}' бояд дар байни аломатҳои {min_length} ва {max_length} бошад. Миқдори аломатҳои воридшуда: {total_length}",
-            "MinimumLengthValidator": "Дарозии '{PropertyName}' бояд ҳадди аққал {min_length} аломат бошад. Миқдори аломатҳои воридшуда: {total_length}",
-            "MaximumLengthValidator": "Дарозии '{PropertyName}' бояд {max_length} аломат ё камтар бошад. Миқдори аломатҳои воридшуда: {total_length}",
-            "LessThanOrEqualValidator": "'{PropertyName}' бояд аз '{ComparisonValue}' камтар ё баробар бошад.",
-            "LessThanValidator": "'{PropertyName}' бояд камтар аз '{ComparisonValue}' бошад.",
-            "NotEmptyValidator": "'{PropertyName}' набояд холӣ бошад.",
-            "NotEqualValidator": "'{PropertyName}' набояд ба '{ComparisonValue}' баробар бошад.",
-            "NotNullValidator": "'{PropertyName}' набояд холӣ бошад.",
-            "PredicateValidator": "Шарти муайяншуда барои '{PropertyName}' иҷро нашуд.",
-            "AsyncPredicateValidator": "Шарти муайяншуда барои '{PropertyName}' иҷро нашуд.",
-            "RegularExpressionValidator": "'{PropertyName}' дар формати дуруст нест.",
-            "EqualValidator": "'{PropertyName}' бояд ба '{ComparisonValue}' баробар бошад.",
-            "ExactLengthValidator": "'{PropertyName}' бояд дарозии {max_length} аломат бошад. Миқдори аломатҳои воридшуда: {total_length}",
-            "InclusiveBetweenValidator": "'{PropertyName}' бояд байни {From} ва {To} бошад. Шумо {PropertyValue}-ро ворид кардаед.",
-            "ExclusiveBetweenValidator": "'{PropertyName}' бояд байни {From} ва {To} (ба истиснои ҳаминҳо) бошад. Шумо {PropertyValue}-ро ворид кардаед.",
-            "CreditCardValidator": "'{PropertyName}' рақами дурусти корти кредитӣ нест.",
-            "ScalePrecisionValidator": "'{PropertyName}' набояд дар маҷмӯъ аз рақамҳои {ExpectedPrecision} зиёд бошад, бо назардошти он барои даҳҳо {ExpectedScale}. {Digits} рақам ва {ActualScale} даҳӣ ёфт шуданд.",
-            "EmptyValidator": "'{PropertyName}' бояд холӣ бошад.",
-            "NullValidator": "'{PropertyName}' бояд холӣ бошад.",
-            "EnumValidator": "'{PropertyName}' як қатор арзишҳо дорад, ки '{PropertyValue}'-ро дар бар намегирад.",
-            # Additional fallback messages used by clientside validation integration.
-            "Length_Simple": "'{PropertyName}' бояд дар байни {min_length} ва {max_length} аломат бошад.",
-            "MinimumLength_Simple": "Дарозии '{PropertyName}' бояд ҳадди аққал {min_length} аломат бошад.",
-            "MaximumLength_Simple": "Дарозии '{PropertyName}' бояд {max_length} аломат ё камтар бошад.",
-            "ExactLength_Simple": "'{PropertyName}' бояд дарозии {max_length} аломат бошад.",
-            "InclusiveBetween_Simple": "'{PropertyName}' бояд байни {From} ва {To} бошад.",
-        }
-        return dicc.get(key, None)
+        return TajikLanguage.Translations.get(key, None)
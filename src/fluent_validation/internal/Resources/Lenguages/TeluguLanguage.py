@@ -22,37 +22,38 @@
 class TeluguLanguage:
     Culture: str = "te"
 
+    Translations: dict[str, str] = {
+        "EmailValidator": "'{PropertyName}' చెల్లుబాటు అయ్యే ఈమెయిల్ చిరునామా కాదు.",
+        "GreaterThanOrEqualValidator": "'{PropertyName}' తప్పనిసరిగా '{ComparisonValue}' కంటే ఎక్కువ లేదా సమానం అయ్యి ఉండాలి.",
+        "GreaterThanValidator": "'{PropertyName}' తప్పనిసరిగా '{ComparisonValue}' కంటే ఎక్కువ అయ్యి ఉండాలి.",
+        "LengthValidator": "'{PropertyName}' {min_length} మరియు {max_length} అక్షరాల మధ్య ఉండాలి. మీరు {total_length} అక్షరాలు నమోదు చేశారు.",
+        "MinimumLengthValidator": "'{PropertyName}' యొక్క పొడవు కనీసం {min_length} అక్షరాలు ఉండాలి. మీరు {total_length} అక్షరాలు నమోదు చేశారు.",
+        "MaximumLengthValidator": "'{PropertyName}' యొక్క పొడవు {max_length} అక్షరాలు లేదా అంతకంటే తక్కువ ఉండాలి. మీరు {total_length} అక్షరాలు నమోదు చేశారు.",
+        "LessThanOrEqualValidator": "'{PropertyName}' తప్పనిసరిగా '{ComparisonValue}' కంటే తక్కువ లేదా సమానం అయ్యి ఉండాలి.",
+        "LessThanValidator": "'{PropertyName}' తప్పనిసరిగా '{ComparisonValue}' కంటే తక్కువ అయ్యి ఉండాలి.",
+        "NotEmptyValidator": "'{PropertyName}' ఖాళీగా ఉండకూడదు.",
+        "NotEqualValidator": "'{PropertyName}' తప్పనిసరిగా '{ComparisonValue}' కి సమానం అయ్యి ఉండకూడదు.",
+        "NotNullValidator": "'{PropertyName}' ఖాళీగా ఉండకూడదు.",
+        "PredicateValidator": "'{PropertyName}' కోసం పేర్కొన్న షరతు తీర్చబడలేదు.",
+        "AsyncPredicateValidator": "'{PropertyName}' కోసం పేర్కొన్న షరతు తీర్చబడలేదు.",
+        "RegularExpressionValidator": "'{PropertyName}' సరైన ఫార్మాట్‌లో లేదు.",
+        "EqualValidator": "'{PropertyName}' తప్పనిసరిగా '{ComparisonValue}' కి సమానం అయ్యి ఉండాలి.",
+        "ExactLengthValidator": "'{PropertyName}' తప్పనిసరిగా {max_length} అక్షరాల పొడవు ఉండాలి. మీరు {total_length} అక్షరాలు నమోదు చేశారు.",
+        "InclusiveBetweenValidator": "'{PropertyName}' తప్పనిసరిగా {From} మరియు {To} మధ్య ఉండాలి. మీరు {PropertyValue} నమోదు చేశారు.",
+        "ExclusiveBetweenValidator": "'{PropertyName}' తప్పనిసరిగా {From} మరియు {To} మధ్య (ఎక్స్‌క్లూజివ్) ఉండాలి. మీరు {PropertyValue} నమోదు చేశారు.",
+        "CreditCardValidator": "'{PropertyName}' చెల్లుబాటు అయ్యే క్రెడిట్ కార్డ్ నంబర్ కాదు.",
+        "ScalePrecisionValidator": "'{PropertyName}' మొత్తం {ExpectedPrecision} అంకెలకు మించి ఉండకూడదు, {ExpectedScale} దశాంశాలకు అనుమతి ఉంది. {Digits} అంకెలు మరియు {ActualScale} దశాంశాలు కనుగొనబడ్డాయి.",
+        "EmptyValidator": "'{PropertyName}' ఖాళీగా ఉండాలి.",
+        "NullValidator": "'{PropertyName}' ఖాళీగా ఉండాలి.",
+        "EnumValidator": "'{PropertyName}' లో '{PropertyValue}' చేర్చబడని విలువల పరిధి ఉంది.",
+        # Additional fallback messages used by clientside validation integration.
+        "Length_Simple": "'{PropertyName}' {min_length} మరియు {max_length} అక్షరాల మధ్య ఉండాలి.",
+        "MinimumLength_Simple": "'{PropertyName}' యొక్క పొడవు కనీసం {min_length} అక్షరాలు ఉండాలి.",
+        "MaximumLength_Simple": "'{PropertyName}' యొక్క పొడవు {max_length} అక్షరాలు లేదా అంతకంటే తక్కువ ఉండాలి.",
+        "ExactLength_Simple": "'{PropertyName}' తప్పనిసరిగా {max_length} అక్షరాల పొడవు ఉండాలి.",
+        "InclusiveBetween_Simple": "'{PropertyName}' తప్పనిసరిగా {From} మరియు {To} మధ్య ఉండాలి.",
+    }
+
     @staticmethod
     def GetTranslation(key: str) -> str:
-        dicc: dict[str, str] = {
-            "EmailValidator": "'{PropertyName}' చెల్లుబాటు అయ్యే ఈమెయిల్ చిరునామా కాదు.",
-            "GreaterThanOrEqualValidator": "'{PropertyName}' తప్పనిసరిగా '{ComparisonValue}' కంటే ఎక్కువ లేదా సమానం అయ్యి ఉండాలి.",
-            "GreaterThanValidator": "'{PropertyName}' తప్పనిసరిగా '{ComparisonValue}' కంటే ఎక్కువ అయ్యి ఉండాలి.",
-            "LengthValidator": "'{PropertyName}' {min_length} మరియు {max_length} అక్షరాల మధ్య ఉండాలి. మీరు {total_length} అక్షరాలు నమోదు చేశారు.",
-            "MinimumLengthValidator": "'{PropertyName}' యొక్క పొడవు కనీసం {min_length} అక్షరాలు ఉండాలి. మీరు {total_length} అక్షరాలు నమోదు చేశారు.",
-            "MaximumLengthValidator": "'{PropertyName}' యొక్క పొడవు {max_length} అక్షరాలు లేదా అంతకంటే తక్కువ ఉండాలి. మీరు {total_length} అక్షరాలు నమోదు చేశారు.",
-            "LessThanOrEqualValidator": "'{PropertyName}' తప్పనిసరిగా '{ComparisonValue}' కంటే తక్కువ లేదా సమానం అయ్యి ఉండాలి.",
-            "LessThanValidator": "'{PropertyName}' తప్పనిసరిగా '{ComparisonValue}' కంటే తక్కువ అయ్యి ఉండాలి.",
-            "NotEmptyValidator": "'{PropertyName}' ఖాళీగా ఉండకూడదు.",
-            "NotEqualValidator": "'{PropertyName}' తప్పనిసరిగా '{ComparisonValue}' కి సమానం అయ్యి ఉండకూడదు.",
-            "NotNullValidator": "'{PropertyName}' ఖాళీగా ఉండకూడదు.",
-            "PredicateValidator": "'{PropertyName}' కోసం పేర్కొన్న షరతు తీర్చబడలేదు.",
-            "AsyncPredicateValidator": "'{PropertyName}' కోసం పేర్కొన్న షరతు తీర్చబడలేదు.",
-            "RegularExpressionValidator": "'{PropertyName}' సరైన ఫార్మాట్‌లో లేదు.",
-            "EqualValidator": "'{PropertyName}' తప్పనిసరిగా '{ComparisonValue}' కి సమానం అయ్యి ఉండాలి.",
-            "ExactLengthValidator": "'{PropertyName}' తప్పనిసరిగా {max_length} అక్షరాల పొడవు ఉండాలి. మీరు {total_length} అక్షరాలు నమోదు చేశారు.",
-            "InclusiveBetweenValidator": "'{PropertyName}' తప్పనిసరిగా {From} మరియు {To} మధ్య ఉండాలి. మీరు {PropertyValue} నమోదు చేశారు.",
-            "ExclusiveBetweenValidator": "'{PropertyName}' తప్పనిసరిగా {From} మరియు {To} మధ్య (ఎక్స్‌క్లూజివ్) ఉండాలి. మీరు {PropertyValue} నమోదు చేశారు.",
-            "CreditCardValidator": "'{PropertyName}' చెల్లుబాటు అయ్యే క్రెడిట్ కార్డ్ నంబర్ కాదు.",
-            "ScalePrecisionValidator": "'{PropertyName}' మొత్తం {ExpectedPrecision} అంకెలకు మించి ఉండకూడదు, {ExpectedScale} దశాంశాలకు అనుమతి ఉంది. {Digits} అంకెలు మరియు {ActualScale} దశాంశాలు కనుగొనబడ్డాయి.",
-            "EmptyValidator": "'{PropertyName}' ఖాళీగా ఉండాలి.",
-            "NullValidator": "'{PropertyName}' ఖాళీగా ఉండాలి.",
-            "EnumValidator": "'{PropertyName}' లో '{PropertyValue}' చేర్చబడని విలువల పరిధి ఉంది.",
-            # Additional fallback messages used by clientside validation integration.
-            "Length_Simple": "'{PropertyName}' {min_length} మరియు {max_length} అక్షరాల మధ్య ఉండాలి.",
-            "MinimumLength_Simple": "'{PropertyName}' యొక్క పొడవు కనీసం {min_length} అక్షరాలు ఉండాలి.",
-            "MaximumLength_Simple": "'{PropertyName}' యొక్క పొడవు {max_length} అక్షరాలు లేదా అంతకంటే తక్కువ ఉండాలి.",
-            "ExactLength_Simple": "'{PropertyName}' తప్పనిసరిగా {max_length} అక్షరాల పొడవు ఉండాలి.",
-            "InclusiveBetween_Simple": "'{PropertyName}' తప్పనిసరిగా {From} మరియు {To} మధ్య ఉండాలి.",
-        }
-        return dicc.get(key, None)
+        return TeluguLanguage.Translations.get(key, None)
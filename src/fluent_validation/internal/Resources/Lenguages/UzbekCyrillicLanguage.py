@@ -22,37 +22,38 @@
 class UzbekCyrillicLanguage:
     Culture: str = "uz-Cyrl-UZ"
 
+    Translations: dict[str, str] = {
+        "EmailValidator": "'{PropertyName}' яроқли электрон почта манзили эмас.",
+        "GreaterThanOrEqualValidator": "'{PropertyName}' камида '{ComparisonValue}'га тенг бўлиши шарт.",
+        "GreaterThanValidator": "'{PropertyName}' '{ComparisonValue}'дан катта бўлиши шарт.",
+        "LengthValidator": "'{PropertyName}' {min_length}тадан {max_length}тагача белгидан иборат бўлиши шарт. Сиз {total_length}та белги киритдингиз.",
+        "MinimumLengthValidator": "'{PropertyName}' камида {min_length}та белгидан иборат бўлиши шарт. Сиз {total_length}та белги киритдингиз.",
+        "MaximumLengthValidator": "'{PropertyName}' кўпи билан {max_length}та белгидан иборат бўлиши шарт. Сиз {total_length}та белги киритдингиз.",
+        "LessThanOrEqualValidator": "'{PropertyName}' '{ComparisonValue}'дан кам ёки тенг бўлиши шарт.",
+        "LessThanValidator": "'{PropertyName}' '{ComparisonValue}'дан кам бўлиши шарт.",
+        "NotEmptyValidator": "'{PropertyName}' бўш бўлиши мумкин эмас.",
+        "NotEqualValidator": "'{PropertyName}' '{ComparisonValue}'га тенг бўлиши мумкин эмас.",
+        "NotNullValidator": "'{PropertyName}' бўш бўлиши мумкин эмас.",
+        "PredicateValidator": "'{PropertyName}'нинг белгиланган шарти бажарилмади.",
+        "AsyncPredicateValidator": "'{PropertyName}'нинг белгиланган шарти бажарилмади.",
+        "RegularExpressionValidator": "'{PropertyName}' нотўғри форматда.",
+        "EqualValidator": "'{PropertyName}' '{ComparisonValue}'га тенг бўлиши шарт.",
+        "ExactLengthValidator": "'{PropertyName}' айнан {max_length}та белгидан иборат бўлиши шарт. Сиз {total_length}та белги киритдингиз.",
+        "InclusiveBetweenValidator": "'{PropertyName}' {From}дан {To}гача бўлиши шарт. Сиз {PropertyValue} киритдингиз.",
+        "ExclusiveBetweenValidator": "'{PropertyName}' {From}дан {To}гача бўлиши шарт (ушбу қийматлар ҳисобга олинмайди). Сиз {PropertyValue} киритдингиз.",
+        "CreditCardValidator": "'{PropertyName}' яроқли кредит карта рақами эмас.",
+        "ScalePrecisionValidator": "'{PropertyName}' бутун қисми жами {ExpectedPrecision}та рақамдан ошмаслиги шарт, жумладан рухсат этилган {ExpectedScale} хона каср(лар) аниқликда. Бутун қисмда {Digits}та рақам(лар) ва {ActualScale} хона каср(лар) топилди.",
+        "EmptyValidator": "'{PropertyName}' бўш бўлиши шарт.",
+        "NullValidator": "'{PropertyName}' бўш бўлиши шарт.",
+        "EnumValidator": "'{PropertyName}' қийматлари орасида '{PropertyValue}' йўқ.",
+        # Additional fallback messages used by clientside validation integration.
+        "Length_Simple": "'{PropertyName}' {min_length}тадан {max_length}тагача белгидан иборат бўлиши шарт.",
+        "MinimumLength_Simple": "'{PropertyName}' камида {min_length}та белгидан иборат бўлиши шарт.",
+        "MaximumLength_Simple": "'{PropertyName}' кўпи билан {max_length}та белгидан иборат бўлиши шарт.",
+        "ExactLength_Simple": "'{PropertyName}' айнан {max_length}та белгидан иборат бўлиши шарт.",
+        "InclusiveBetween_Simple": "'{PropertyName}'нинг қиймати {From}дан {To}гача бўлиши шарт.",
+    }
+
     @staticmethod
     def GetTranslation(key: str) -> str:
-        dicc: dict[str, str] = {
-            "EmailValidator": "'{PropertyName}' яроқли электрон почта манзили эмас.",
-            "GreaterThanOrEqualValidator": "'{PropertyName}' камида '{ComparisonValue}'га тенг бўлиши шарт.",
-            "GreaterThanValidator": "'{PropertyName}' '{ComparisonValue}'дан катта бўлиши шарт.",
-            "LengthValidator": "'{PropertyName}' {min_length}тадан {max_length}тагача белгидан иборат бўлиши шарт. Сиз {total_length}та белги киритдингиз.",
-            "MinimumLengthValidator": "'{PropertyName}' камида {min_length}та белгидан иборат бўлиши шарт. Сиз {total_length}та белги киритдингиз.",
-            "MaximumLengthValidator": "'{PropertyName}' кўпи билан {max_length}та белгидан иборат бўлиши шарт. Сиз {total_length}та белги киритдингиз.",
-            "LessThanOrEqualValidator": "'{PropertyName}' '{ComparisonValue}'дан кам ёки тенг бўлиши шарт.",
-            "LessThanValidator": "'{PropertyName}' '{ComparisonValue}'дан кам бўлиши шарт.",
-            "NotEmptyValidator": "'{PropertyName}' бўш бўлиши мумкин эмас.",
-            "NotEqualValidator": "'{PropertyName}' '{ComparisonValue}'га тенг бўлиши мумкин эмас.",
-            "NotNullValidator": "'{PropertyName}' бўш бўлиши мумкин эмас.",
-            "PredicateValidator": "'{PropertyName}'нинг белгиланган шарти бажарилмади.",
-            "AsyncPredicateValidator": "'{PropertyName}'нинг белгиланган шарти бажарилмади.",
-            "RegularExpressionValidator": "'{PropertyName}' нотўғри форматда.",
-            "EqualValidator": "'{PropertyName}' '{ComparisonValue}'га тенг бўлиши шарт.",
-            "ExactLengthValidator": "'{PropertyName}' айнан {max_length}та белгидан иборат бўлиши шарт. Сиз {total_length}та белги киритдингиз.",
-            "InclusiveBetweenValidator": "'{PropertyName}' {From}дан {To}гача бўлиши шарт. Сиз {PropertyValue} киритдингиз.",
-            "ExclusiveBetweenValidator": "'{PropertyName}' {From}дан {To}гача бўлиши шарт (ушбу қийматлар ҳисобга олинмайди). Сиз {PropertyValue} киритдингиз.",
-            "CreditCardValidator": "'{PropertyName}' яроқли кредит карта рақами эмас.",
-            "ScalePrecisionValidator": "'{PropertyName}' бутун қисми жами {ExpectedPrecision}та рақамдан ошмаслиги шарт, жумладан рухсат этилган {ExpectedScale} хона каср(лар) аниқликда. Бутун қисмда {Digits}та рақам(лар) ва {ActualScale} хона каср(лар) топилди.",
-            "EmptyValidator": "'{PropertyName}' бўш бўлиши шарт.",
-            "NullValidator": "'{PropertyName}' бўш бўлиши шарт.",
-            "EnumValidator": "'{PropertyName}' қийматлари орасида '{PropertyValue}' йўқ.",
-            # Additional fallback messages used by clientside validation integration.
-            "Length_Simple": "'{PropertyName}' {min_length}тадан {max_length}тагача белгидан иборат бўлиши шарт.",
-            "MinimumLength_Simple": "'{PropertyName}' камида {min_length}та белгидан иборат бўлиши шарт.",
-            "MaximumLength_Simple": "'{PropertyName}' кўпи билан {max_length}та белгидан иборат бўлиши шарт.",
-            "ExactLength_Simple": "'{PropertyName}' айнан {max_length}та белгидан иборат бўлиши шарт.",
-            "InclusiveBetween_Simple": "'{PropertyName}'нинг қиймати {From}дан {To}гача бўлиши шарт.",
-        }
-        return dicc.get(key, None)
+        return UzbekCyrillicLanguage.Translations.get(key, None)
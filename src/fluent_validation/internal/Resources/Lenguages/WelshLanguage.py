@@ -22,37 +22,38 @@
 class WelshLanguage:
     Culture: str = "cy"
 
+    Translations: dict[str, str] = {
+        "EmailValidator": "Nid yw '{PropertyName}' yn gyfeiriad e-bost dilys.",
+        "GreaterThanOrEqualValidator": "Rhaid i '{PropertyName}' fod yn fwy na '{ComparisonValue}', neu'n gyfartal ag o.",
+        "GreaterThanValidator": "Rhaid i '{PropertyName}' fod yn fwy na '{ComparisonValue}'.",
+        "LengthValidator": "Rhaid i '{PropertyName}' fod rhwng {min_length} a {max_length} o nodau. Rydych wedi rhoi {total_length} nod.",
+        "MinimumLengthValidator": "Rhaid i '{PropertyName}' fod o leiaf {min_length} nod o hyd. Rydych wedi rhoi {total_length} nod.",
+        "MaximumLengthValidator": "Rhaid i '{PropertyName}' fod yn {max_length} nod o hyd neu lai. Rydych wedi rhoi {total_length} nod.",
+        "LessThanOrEqualValidator": "Rhaid i '{PropertyName}' fod yn llai na '{ComparisonValue}', neu'n gyfartal ag o.",
+        "LessThanValidator": "Rhaid i '{PropertyName}' fod yn llai na '{ComparisonValue}'.",
+        "NotEmptyValidator": "Ni ddylai '{PropertyName}' fod yn wag.",
+        "NotEqualValidator": "Ni ddylai '{PropertyName}' fod yn gyfartal â '{ComparisonValue}'.",
+        "NotNullValidator": "Ni ddylai '{PropertyName}' fod yn wag.",
+        "PredicateValidator": "Ni chyflawnwyd y gofyniad penodol ar gyfer '{PropertyName}'.",
+        "AsyncPredicateValidator": "Ni chyflawnwyd y gofyniad penodol ar gyfer '{PropertyName}'.",
+        "RegularExpressionValidator": "Nid yw '{PropertyName}' yn y fformat cywir.",
+        "EqualValidator": "Mae'n rhaid i '{PropertyName}' fod yn gyfartal â '{ComparisonValue}'.",
+        "ExactLengthValidator": "Mae'n rhaid i '{PropertyName}' fod yn {max_length} nod o hyd. Rydych wedi rhoi {total_length} nod.",
+        "InclusiveBetweenValidator": "Rhaid i '{PropertyName}' fod rhwng {From} a {To}. Rydych wedi rhoi {PropertyValue}.",
+        "ExclusiveBetweenValidator": "Rhaid i '{PropertyName}' fod rhwng {From} a {To} (ddim yn gynwysedig). Rydych wedi rhoi {PropertyValue}.",
+        "CreditCardValidator": "Nid yw '{PropertyName}' yn rhif cerdyn credyd dilys.",
+        "ScalePrecisionValidator": "Ni ddylai '{PropertyName}' fod yn fwy na {ExpectedPrecision} digid i gyd  gan ganiatáu ar gyfer {ExpectedScale} degolyn. Canfuwyd {Digits} digid a {ActualScale} degolyn.",
+        "EmptyValidator": "Rhaid i '{PropertyName}' fod yn wag.",
+        "NullValidator": "Rhaid i '{PropertyName}' fod yn wag.",
+        "EnumValidator": "Mae gan '{PropertyName}' ystod o werthoedd nad ydynt yn cynnwys '{PropertyValue}'.",
+        # Additional fallback messages used by clientside validation integration.
+        "Length_Simple": "Rhaid i '{PropertyName}' fod rhwng {min_length} a {max_length} o nodau.",
+        "MinimumLength_Simple": "Rhaid i '{PropertyName}' fod o leiaf {min_length} nod o hyd.",
+        "MaximumLength_Simple": "Rhaid i '{PropertyName}' fod yn {max_length} nod o hyd neu lai.",
+        "ExactLength_Simple": "Mae'n rhaid i '{PropertyName}' fod yn {max_length} nod o hyd.",
+        "InclusiveBetween_Simple": "Rhaid i '{PropertyName}' fod rhwng {From} a {To}.",
+    }
+
     @staticmethod
     def GetTranslation(key: str) -> str:
-        dicc: dict[str, str] = {
-            "EmailValidator": "Nid yw '{PropertyName}' yn gyfeiriad e-bost dilys.",
-            "GreaterThanOrEqualValidator": "Rhaid i '{PropertyName}' fod yn fwy na '{ComparisonValue}', neu'n gyfartal ag o.",
-            "GreaterThanValidator": "Rhaid i '{PropertyName}' fod yn fwy na '{ComparisonValue}'.",
-            "LengthValidator": "Rhaid i '{PropertyName}' fod rhwng {min_length} a {max_length} o nodau. Rydych wedi rhoi {total_length} nod.",
-            "MinimumLengthValidator": "Rhaid i '{PropertyName}' fod o leiaf {min_length} nod o hyd. Rydych wedi rhoi {total_length} nod.",
-            "MaximumLengthValidator": "Rhaid i '{PropertyName}' fod yn {max_length} nod o hyd neu lai. Rydych wedi rhoi {total_length} nod.",
-            "LessThanOrEqualValidator": "Rhaid i '{PropertyName}' fod yn llai na '{ComparisonValue}', neu'n gyfartal ag o.",
-            "LessThanValidator": "Rhaid i '{PropertyName}' fod yn llai na '{ComparisonValue}'.",
-            "NotEmptyValidator": "Ni ddylai '{PropertyName}' fod yn wag.",
-            "NotEqualValidator": "Ni ddylai '{PropertyName}' fod yn gyfartal â '{ComparisonValue}'.",
-            "NotNullValidator": "Ni ddylai '{PropertyName}' fod yn wag.",
-            "PredicateValidator": "Ni chyflawnwyd y gofyniad penodol ar gyfer '{PropertyName}'.",
-            "AsyncPredicateValidator": "Ni chyflawnwyd y gofyniad penodol ar gyfer '{PropertyName}'.",
-            "RegularExpressionValidator": "Nid yw '{PropertyName}' yn y fformat cywir.",
-            "EqualValidator": "Mae'n rhaid i '{PropertyName}' fod yn gyfartal â '{ComparisonValue}'.",
-            "ExactLengthValidator": "Mae'n rhaid i '{PropertyName}' fod yn {max_length} nod o hyd. Rydych wedi rhoi {total_length} nod.",
-            "InclusiveBetweenValidator": "Rhaid i '{PropertyName}' fod rhwng {From} a {To}. Rydych wedi rhoi {PropertyValue}.",
-            "ExclusiveBetweenValidator": "Rhaid i '{PropertyName}' fod rhwng {From} a {To} (ddim yn gynwysedig). Rydych wedi rhoi {PropertyValue}.",
-            "CreditCardValidator": "Nid yw '{PropertyName}' yn rhif cerdyn credyd dilys.",
-            "ScalePrecisionValidator": "Ni ddylai '{PropertyName}' fod yn fwy na {ExpectedPrecision} digid i gyd  gan ganiatáu ar gyfer {ExpectedScale} degolyn. Canfuwyd {Digits} digid a {ActualScale} degolyn.",
-            "EmptyValidator": "Rhaid i '{PropertyName}' fod yn wag.",
-            "NullValidator": "Rhaid i '{PropertyName}' fod yn wag.",
-            "EnumValidator": "Mae gan '{PropertyName}' ystod o werthoedd nad ydynt yn cynnwys '{PropertyValue}'.",
-            # Additional fallback messages used by clientside validation integration.
-            "Length_Simple": "Rhaid i '{PropertyName}' fod rhwng {min_length} a {max_length} o nodau.",
-            "MinimumLength_Simple": "Rhaid i '{PropertyName}' fod o leiaf {min_length} nod o hyd.",
-            "MaximumLength_Simple": "Rhaid i '{PropertyName}' fod yn {max_length} nod o hyd neu lai.",
-            "ExactLength_Simple": "Mae'n rhaid i '{PropertyName}' fod yn {max_length} nod o hyd.",
-            "InclusiveBetween_Simple": "Rhaid i '{PropertyName}' fod rhwng {From} a {To}.",
-        }
-        return dicc.get(key, None)
+        return WelshLanguage.Translations.get(key, None)
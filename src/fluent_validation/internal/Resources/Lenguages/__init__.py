@@ -16,60 +16,160 @@
 # The latest version of this file can be found at https://github.com/p-hzamora/FluentValidation
 # endregion
 
+from __future__ import annotations
+import importlib
+from typing import Optional, TYPE_CHECKING
+
+# English is the fallback of every other culture, so it is always loaded
 from .EnglishLanguage import EnglishLanguage as EnglishLanguage
-from .SpanishLanguage import SpanishLanguage as SpanishLanguage
-from .FrenchLanguage import FrenchLanguage as FrenchLanguage
-from .GermanLanguage import GermanLanguage as GermanLanguage
-from .ItalianLanguage import ItalianLanguage as ItalianLanguage
-from .PortugueseLanguage import PortugueseLanguage as PortugueseLanguage
-from .DutchLanguage import DutchLanguage as DutchLanguage
-from .RussianLanguage import RussianLanguage as RussianLanguage
-from .ChineseSimplifiedLanguage import ChineseSimplifiedLanguage as ChineseSimplifiedLanguage
-from .JapaneseLanguage import JapaneseLanguage as JapaneseLanguage
-from .KoreanLanguage import KoreanLanguage as KoreanLanguage
-from .PolishLanguage import PolishLanguage as PolishLanguage
-from .TurkishLanguage import TurkishLanguage as TurkishLanguage
-from .ArabicLanguage import ArabicLanguage as ArabicLanguage
-from .SwedishLanguage import SwedishLanguage as SwedishLanguage
-from .CzechLanguage import CzechLanguage as CzechLanguage
-from .HungarianLanguage import HungarianLanguage as HungarianLanguage
-from .NorwegianBokmalLanguage import NorwegianBokmalLanguage as NorwegianBokmalLanguage
-from .DanishLanguage import DanishLanguage as DanishLanguage
-from .FinnishLanguage import FinnishLanguage as FinnishLanguage
-from .HindiLanguage import HindiLanguage as HindiLanguage
-from .ThaiLanguage import ThaiLanguage as ThaiLanguage
-from .VietnameseLanguage import VietnameseLanguage as VietnameseLanguage
-from .IndonesianLanguage import IndonesianLanguage as IndonesianLanguage
-from .ChineseTraditionalLanguage import ChineseTraditionalLanguage as ChineseTraditionalLanguage
-from .RomanianLanguage import RomanianLanguage as RomanianLanguage
-from .BulgarianLanguage import BulgarianLanguage as BulgarianLanguage
-from .CroatianLanguage import CroatianLanguage as CroatianLanguage
-from .SlovakLanguage import SlovakLanguage as SlovakLanguage
-from .SlovenianLanguage import SlovenianLanguage as SlovenianLanguage
-from .EstonianLanguage import EstonianLanguage as EstonianLanguage
-from .LatvianLanguage import LatvianLanguage as LatvianLanguage
-from .GreekLanguage import GreekLanguage as GreekLanguage
-from .AlbanianLanguage import AlbanianLanguage as AlbanianLanguage
-from .AzerbaijaneseLanguage import AzerbaijaneseLanguage as AzerbaijaneseLanguage
-from .BengaliLanguage import BengaliLanguage as BengaliLanguage
-from .BosnianLanguage import BosnianLanguage as BosnianLanguage
-from .CatalanLanguage import CatalanLanguage as CatalanLanguage
-from .GeorgianLanguage import GeorgianLanguage as GeorgianLanguage
-from .HebrewLanguage import HebrewLanguage as HebrewLanguage
-from .IcelandicLanguage import IcelandicLanguage as IcelandicLanguage
-from .KazakhLanguage import KazakhLanguage as KazakhLanguage
-from .KhmerLanguage import KhmerLanguage as KhmerLanguage
-from .MacedonianLanguage import MacedonianLanguage as MacedonianLanguage
-from .NorwegianNynorskLanguage import NorwegianNynorskLanguage as NorwegianNynorskLanguage
-from .PersianLanguage import PersianLanguage as PersianLanguage
-from .PortugueseBrazilLanguage import PortugueseBrazilLanguage as PortugueseBrazilLanguage
-from .RomanshLanguage import RomanshLanguage as RomanshLanguage
-from .SerbianCyrillicLanguage import SerbianCyrillicLanguage as SerbianCyrillicLanguage
-from .SerbianLatinLanguage import SerbianLatinLanguage as SerbianLatinLanguage
-from .TajikLanguage import TajikLanguage as TajikLanguage
-from .TamilLanguage import TamilLanguage as TamilLanguage
-from .TeluguLanguage import TeluguLanguage as TeluguLanguage
-from .UkrainianLanguage import UkrainianLanguage as UkrainianLanguage
-from .UzbekCyrillicLanguage import UzbekCyrillicLanguage as UzbekCyrillicLanguage
-from .UzbekLatinLanguage import UzbekLatinLanguage as UzbekLatinLanguage
-from .WelshLanguage import WelshLanguage as WelshLanguage
+
+if TYPE_CHECKING:
+    from .SpanishLanguage import SpanishLanguage as SpanishLanguage
+    from .FrenchLanguage import FrenchLanguage as FrenchLanguage
+    from .GermanLanguage import GermanLanguage as GermanLanguage
+    from .ItalianLanguage import ItalianLanguage as ItalianLanguage
+    from .PortugueseLanguage import PortugueseLanguage as PortugueseLanguage
+    from .DutchLanguage import DutchLanguage as DutchLanguage
+    from .RussianLanguage import RussianLanguage as RussianLanguage
+    from .ChineseSimplifiedLanguage import ChineseSimplifiedLanguage as ChineseSimplifiedLanguage
+    from .JapaneseLanguage import JapaneseLanguage as JapaneseLanguage
+    from .KoreanLanguage import KoreanLanguage as KoreanLanguage
+    from .PolishLanguage import PolishLanguage as PolishLanguage
+    from .TurkishLanguage import TurkishLanguage as TurkishLanguage
+    from .ArabicLanguage import ArabicLanguage as ArabicLanguage
+    from .SwedishLanguage import SwedishLanguage as SwedishLanguage
+    from .CzechLanguage import CzechLanguage as CzechLanguage
+    from .HungarianLanguage import HungarianLanguage as HungarianLanguage
+    from .NorwegianBokmalLanguage import NorwegianBokmalLanguage as NorwegianBokmalLanguage
+    from .DanishLanguage import DanishLanguage as DanishLanguage
+    from .FinnishLanguage import FinnishLanguage as FinnishLanguage
+    from .HindiLanguage import HindiLanguage as HindiLanguage
+    from .ThaiLanguage import ThaiLanguage as ThaiLanguage
+    from .VietnameseLanguage import VietnameseLanguage as VietnameseLanguage
+    from .IndonesianLanguage import IndonesianLanguage as IndonesianLanguage
+    from .ChineseTraditionalLanguage import ChineseTraditionalLanguage as ChineseTraditionalLanguage
+    from .RomanianLanguage import RomanianLanguage as RomanianLanguage
+    from .BulgarianLanguage import BulgarianLanguage as BulgarianLanguage
+    from .CroatianLanguage import CroatianLanguage as CroatianLanguage
+    from .SlovakLanguage import SlovakLanguage as SlovakLanguage
+    from .SlovenianLanguage import SlovenianLanguage as SlovenianLanguage
+    from .EstonianLanguage import EstonianLanguage as EstonianLanguage
+    from .LatvianLanguage import LatvianLanguage as LatvianLanguage
+    from .GreekLanguage import GreekLanguage as GreekLanguage
+    from .AlbanianLanguage import AlbanianLanguage as AlbanianLanguage
+    from .AzerbaijaneseLanguage import AzerbaijaneseLanguage as AzerbaijaneseLanguage
+    from .BengaliLanguage import BengaliLanguage as BengaliLanguage
+    from .BosnianLanguage import BosnianLanguage as BosnianLanguage
+    from .CatalanLanguage import CatalanLanguage as CatalanLanguage
+    from .GeorgianLanguage import GeorgianLanguage as GeorgianLanguage
+    from .HebrewLanguage import HebrewLanguage as HebrewLanguage
+    from .IcelandicLanguage import IcelandicLanguage as IcelandicLanguage
+    from .KazakhLanguage import KazakhLanguage as KazakhLanguage
+    from .KhmerLanguage import KhmerLanguage as KhmerLanguage
+    from .MacedonianLanguage import MacedonianLanguage as MacedonianLanguage
+    from .NorwegianNynorskLanguage import NorwegianNynorskLanguage as NorwegianNynorskLanguage
+    from .PersianLanguage import PersianLanguage as PersianLanguage
+    from .PortugueseBrazilLanguage import PortugueseBrazilLanguage as PortugueseBrazilLanguage
+    from .RomanshLanguage import RomanshLanguage as RomanshLanguage
+    from .SerbianCyrillicLanguage import SerbianCyrillicLanguage as SerbianCyrillicLanguage
+    from .SerbianLatinLanguage import SerbianLatinLanguage as SerbianLatinLanguage
+    from .TajikLanguage import TajikLanguage as TajikLanguage
+    from .TamilLanguage import TamilLanguage as TamilLanguage
+    from .TeluguLanguage import TeluguLanguage as TeluguLanguage
+    from .UkrainianLanguage import UkrainianLanguage as UkrainianLanguage
+    from .UzbekCyrillicLanguage import UzbekCyrillicLanguage as UzbekCyrillicLanguage
+    from .UzbekLatinLanguage import UzbekLatinLanguage as UzbekLatinLanguage
+    from .WelshLanguage import WelshLanguage as WelshLanguage
+
+
+# Culture -> name of the module (and of its class) with the translations. A module is only imported the first time its culture is used
+_cultures: dict[str, str] = {
+    "ar": "ArabicLanguage",
+    "az": "AzerbaijaneseLanguage",
+    "bg": "BulgarianLanguage",
+    "bn": "BengaliLanguage",
+    "bs": "BosnianLanguage",
+    "ca": "CatalanLanguage",
+    "cs": "CzechLanguage",
+    "cy": "WelshLanguage",
+    "da": "DanishLanguage",
+    "de": "GermanLanguage",
+    "el": "GreekLanguage",
+    "en": "EnglishLanguage",
+    "en-GB": "EnglishLanguage",
+    "en-US": "EnglishLanguage",
+    "es-ES": "SpanishLanguage",
+    "et": "EstonianLanguage",
+    "fa": "PersianLanguage",
+    "fi": "FinnishLanguage",
+    "fr": "FrenchLanguage",
+    "he": "HebrewLanguage",
+    "hi": "HindiLanguage",
+    "hr": "CroatianLanguage",
+    "hu": "HungarianLanguage",
+    "id": "IndonesianLanguage",
+    "is": "IcelandicLanguage",
+    "it": "ItalianLanguage",
+    "ja": "JapaneseLanguage",
+    "ka": "GeorgianLanguage",
+    "kk": "KazakhLanguage",
+    "km": "KhmerLanguage",
+    "ko": "KoreanLanguage",
+    "lv": "LatvianLanguage",
+    "mk": "MacedonianLanguage",
+    "nb": "NorwegianBokmalLanguage",
+    "nl": "DutchLanguage",
+    "nn": "NorwegianNynorskLanguage",
+    "pl": "PolishLanguage",
+    "pt": "PortugueseLanguage",
+    "pt-BR": "PortugueseBrazilLanguage",
+    "rm": "RomanshLanguage",
+    "ro": "RomanianLanguage",
+    "ru": "RussianLanguage",
+    "sk": "SlovakLanguage",
+    "sl": "SlovenianLanguage",
+    "sq": "AlbanianLanguage",
+    "sr": "SerbianCyrillicLanguage",
+    "sr-Latn": "SerbianLatinLanguage",
+    "sv": "SwedishLanguage",
+    "ta": "TamilLanguage",
+    "te": "TeluguLanguage",
+    "tg": "TajikLanguage",
+    "th": "ThaiLanguage",
+    "tr": "TurkishLanguage",
+    "uk": "UkrainianLanguage",
+    "uz": "UzbekLatinLanguage",
+    "uz-Cyrl-UZ": "UzbekCyrillicLanguage",
+    "vi": "VietnameseLanguage",
+    "zh-Hans": "ChineseSimplifiedLanguage",
+    "zh-Hant": "ChineseTraditionalLanguage",
+}
+
+_loaded: dict[str, type] = {"EnglishLanguage": EnglishLanguage}
+
+
+def load_language(culture: str) -> Optional[type]:
+    """Returns the language registered for 'culture', importing its module on first use, or None if there is none."""
+    name = _cultures.get(culture, None)
+    if name is None:
+        return None
+    language = _loaded.get(name, None)
+    return language if language is not None else __getattr__(name)
+
+
+def __getattr__(name: str) -> type:
+    # Keeps 'from fluent_validation.internal.Resources.Lenguages import SpanishLanguage' working without importing every language
+    language = _loaded.get(name, None)
+    if language is not None:
+        return language
+    if name not in _cultures.values():
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    language = _loaded[name] = getattr(importlib.import_module(f"{__name__}.{name}"), name)
+    # Importing the submodule binds it to the package under the same name. Bind the class instead, as the eager imports did
+    globals()[name] = language
+    return language
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_cultures.values()})
@@ -17,11 +17,13 @@
 # endregion
 
 from __future__ import annotations
-from typing import Any, Callable, Type, Optional, TYPE_CHECKING, overload
+from typing import Any, Callable, ClassVar, Iterable, Type, Optional, TYPE_CHECKING, overload
 
 from fluent_validation.MemberInfo import MemberInfo
 from fluent_validation.ValidatorOptions import ValidatorOptions
+from fluent_validation.internal.ConditionChain import ConditionChain
 from fluent_validation.internal.ExtensionInternal import ExtensionsInternal
+from fluent_validation.internal.FailFastFailures import FailFastFailures, StopValidation
 from fluent_validation.IValidationRule import IValidationRule
 from fluent_validation.internal.IRuleComponent import IRuleComponent
 from fluent_validation.internal.MessageBuilderContext import IMessageBuilderContext, MessageBuilderContext
@@ -50,12 +52,16 @@ class RuleBase[T, TProperty, TValue](IValidationRule[T, TValue]):
         "_displayNameFunc",
         "_components",
         "_condition",
+        "_conditions",
         "_displayName",
         "_rule_sets",
         "_DependentRules",
         "_MessageBuilder",
     )
 
+    # Incremented every time the RuleSets of a rule change
+    RuleSetsVersion: ClassVar[int] = 0
+
     def __init__(
         self,
         member: MemberInfo,
@@ -79,9 +85,10 @@ class RuleBase[T, TProperty, TValue](IValidationRule[T, TValue]):
 
         self._components: list[RuleComponent[T, TProperty]] = []
         self._condition: Optional[Callable[[ValidationContext[T]], bool]] = None
+        self._conditions: tuple[Callable[[ValidationContext[T]], bool], ...] = ()
 
         self._displayName: str = None
-        self._rule_sets: Optional[list[str]] = None
+        self._rule_sets: Optional[frozenset[str]] = None
         self._DependentRules: list[IValidationRuleInternal[T]] = None
         self._MessageBuilder: None | Callable[[IMessageBuilderContext[T, TProperty]], str] = None
 
@@ -139,6 +146,11 @@ class RuleBase[T, TProperty, TValue](IValidationRule[T, TValue]):
         """Condition for all validators in this rule."""
         return self._condition
 
+    @property
+    def Conditions(self) -> tuple[Callable[[ValidationContext[T]], bool], ...]:
+        """Shared conditions of this rule, in evaluation order."""
+        return self._conditions
+
     @property
     def PropertyName(self):
         return self._propertyName
@@ -186,12 +198,14 @@ class RuleBase[T, TProperty, TValue](IValidationRule[T, TValue]):
         self._cascadeModeThunk = lambda: value
 
     @property
-    def RuleSets(self) -> list[str]:
+    def RuleSets(self) -> Optional[frozenset[str]]:
         return self._rule_sets
 
     @RuleSets.setter
-    def RuleSets(self, value: list[str]):
-        self._rule_sets = value
+    def RuleSets(self, value: Optional[Iterable[str]]):
+        self._rule_sets = frozenset(value) if value is not None else None
+        # Any RuleSetIndex built before this change is stale
+        RuleBase.RuleSetsVersion += 1
 
     @property
     def dependent_rules(self) -> list[IValidationRuleInternal[T]]:
@@ -232,11 +246,8 @@ class RuleBase[T, TProperty, TValue](IValidationRule[T, TValue]):
     # }
 
     def ApplySharedCondition(self, condition: Callable[[ValidationContext[T]], bool]) -> None:
-        if self._condition is None:
-            self._condition = condition
-        else:
-            original = self._condition
-            self._condition = lambda ctx: condition(ctx) and original(ctx)
+        self._conditions = ConditionChain.prepend(self._conditions, condition)
+        self._condition = ConditionChain.combine(self._conditions)
 
     # public void ApplySharedAsyncCondition(Func<ValidationContext<T>, CancellationToken, Task<bool>> condition) {
     # 	if (_asyncCondition == null) {
@@ -255,6 +266,9 @@ class RuleBase[T, TProperty, TValue](IValidationRule[T, TValue]):
 
     @staticmethod
     def PrepareMessageFormatterForValidationError(context: ValidationContext[T], value: TValue) -> None:
+        # Called by every rule before building a failure. 'is_valid' only needs to know that there is one
+        if context.Failures.__class__ is FailFastFailures:
+            raise StopValidation
         context.MessageFormatter.AppendPropertyName(context.DisplayName)
         context.MessageFormatter.AppendPropertyValue(value)
         context.MessageFormatter.AppendArgument("PropertyPath", context.PropertyPath)
@@ -266,13 +280,17 @@ class RuleBase[T, TProperty, TValue](IValidationRule[T, TValue]):
         component: RuleComponent[T, TValue],
     ) -> ValidationFailure:
         if self.MessageBuilder is not None:
-            error = self.MessageBuilder(MessageBuilderContext[T, TProperty](context, value, component))
+            failure = ValidationFailure(context.PropertyPath, self.MessageBuilder(MessageBuilderContext[T, TProperty](context, value, component)), value, component.ErrorCode)
+            failure.FormattedMessagePlaceholderValues = context.MessageFormatter.PlaceholderValues.copy()
+        elif context.MessageFormatter.RendersLazily:
+            # The message is rendered from the template and the placeholder values the first time ErrorMessage is read
+            placeholderValues = context.MessageFormatter.PlaceholderValues.copy()
+            failure = ValidationFailure(context.PropertyPath, None, value, component.ErrorCode, MessageTemplate=component.GetErrorMessageTemplate(context, value))
+            failure.FormattedMessagePlaceholderValues = placeholderValues
         else:
-            error = component.GetErrorMessage(context, value)
-
-        failure = ValidationFailure(context.PropertyPath, error, value, component.ErrorCode)
+            failure = ValidationFailure(context.PropertyPath, component.GetErrorMessage(context, value), value, component.ErrorCode)
+            failure.FormattedMessagePlaceholderValues = context.MessageFormatter.PlaceholderValues.copy()
 
-        failure.FormattedMessagePlaceholderValues = context.MessageFormatter.PlaceholderValues.copy()
         failure.ErrorCode = component.ErrorCode if component.ErrorCode is not None else ValidatorOptions.Global.ErrorCodeResolver(component.Validator)
 
         failure.Severity = component.SeverityProvider(context, value) if component.SeverityProvider is not None else ValidatorOptions.Global.Severity
@@ -45,6 +45,8 @@ class RuleBuilder[T, TProperty](
 
     @property
     def Rule(self) -> IValidationRuleInternal[T, TProperty]:
+        # Every change made through the builder reads the rule here, so a plan compiled before the change is discarded
+        self.parent_validator._discard_plan()
         return self._rule
 
     @property
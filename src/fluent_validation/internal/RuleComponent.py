@@ -20,6 +20,7 @@ from typing import Any, Callable, Optional, overload
 
 from fluent_validation.AsyncValidatorInvokedSynchronouslyException import AsyncValidatorInvokedSynchronouslyException
 from fluent_validation.IValidationContext import ValidationContext
+from fluent_validation.internal.ConditionChain import ConditionChain
 from fluent_validation.internal.IRuleComponent import IRuleComponent
 from fluent_validation.validators.IpropertyValidator import IAsyncPropertyValidator, IPropertyValidator
 
@@ -32,6 +33,7 @@ class RuleComponent[T, TProperty](IRuleComponent):
         "_asyncPropertyValidator",
         "_errorMessageFactory",
         "_condition",
+        "_conditions",
         "_CustomStateProvider",
         "_SeverityProvider",
         "_asyncCondition",
@@ -50,6 +52,7 @@ class RuleComponent[T, TProperty](IRuleComponent):
         self._errorMessageFactory: Callable[[ValidationContext], T] = None
 
         self._condition: Callable[[ValidationContext[T], bool]] = None
+        self._conditions: tuple[Callable[[ValidationContext[T]], bool], ...] = ()
 
         self._CustomStateProvider: Callable[[ValidationContext[T], TProperty], Any] = None
         self._SeverityProvider: Callable[[ValidationContext[T]], TProperty] = None
@@ -129,12 +132,14 @@ class RuleComponent[T, TProperty](IRuleComponent):
         # only supports asynchronous invocation.
         raise AsyncValidatorInvokedSynchronouslyException
 
+    @property
+    def Conditions(self) -> tuple[Callable[[ValidationContext[T]], bool], ...]:
+        """Conditions of this component, in evaluation order."""
+        return self._conditions
+
     def ApplyCondition(self, condition: Callable[[ValidationContext[T]], bool]) -> None:
-        if self._condition is None:
-            self._condition = condition
-        else:
-            original = self._condition
-            self._condition = lambda ctx: condition(ctx) and original(ctx)
+        self._conditions = ConditionChain.prepend(self._conditions, condition)
+        self._condition = ConditionChain.combine(self._conditions)
 
     def InvokeCondition(self, context: ValidationContext[T]) -> bool:
         if self._condition is not None:
@@ -177,16 +182,21 @@ class RuleComponent[T, TProperty](IRuleComponent):
         self._error_code = value
 
     def GetErrorMessage(self, context: Optional[ValidationContext[T]], value: TProperty):
-        # FIXME [x]: self._error_message has value when it must by empty test "test_When_the_maxlength_validator_fails_the_error_message_should_be_set"
-        rawTemplate: Optional[str] = self._errorMessageFactory(context, value) if self._errorMessageFactory else self._error_message
-        if rawTemplate is None:
-            rawTemplate = self.Validator.get_default_message_template(self.ErrorCode)  # original
+        rawTemplate: str = self.GetErrorMessageTemplate(context, value)
 
         if context is None:
             return rawTemplate
 
         return context.MessageFormatter.BuildMessage(rawTemplate)
 
+    def GetErrorMessageTemplate(self, context: Optional[ValidationContext[T]], value: TProperty) -> str:
+        """Gets the error message template, with its placeholders not replaced yet."""
+        # FIXME [x]: self._error_message has value when it must by empty test "test_When_the_maxlength_validator_fails_the_error_message_should_be_set"
+        rawTemplate: Optional[str] = self._errorMessageFactory(context, value) if self._errorMessageFactory else self._error_message
+        if rawTemplate is None:
+            rawTemplate = self.Validator.get_default_message_template(self.ErrorCode)  # original
+        return rawTemplate
+
     def GetUnformattedErrorMessage(self) -> str:
         message: str = self._errorMessageFactory(None, None) if self._errorMessageFactory is not None else self._error_message
 
@@ -0,0 +1,95 @@
+# region License
+# Copyright (c) .NET Foundation and contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# The latest version of this file can be found at https://github.com/p-hzamora/FluentValidation
+# endregion
+
+from __future__ import annotations
+from typing import Optional, TYPE_CHECKING
+
+from fluent_validation.internal.RuleBase import RuleBase
+from fluent_validation.internal.RuleSetValidatorSelector import RulesetValidatorSelector
+
+if TYPE_CHECKING:
+    from fluent_validation.internal.TrackingCollection import TrackingCollection
+    from fluent_validation.IValidationRuleInternal import IValidationRuleInternal
+
+
+class RuleSetIndex:
+    """Positions of the rules of a validator grouped by rule set.
+
+    Used when a validator runs with a RulesetValidatorSelector, so only the rules that can match the requested rule sets
+    are visited. The selector still decides whether each of them runs and records the executed rule sets.
+    """
+
+    __slots__ = (
+        "_count",
+        "_version",
+        "_byName",
+        "_default",
+        "_noRuleSet",
+        "_includes",
+        "_positions",
+    )
+
+    def __init__(self, rules: TrackingCollection[IValidationRuleInternal]) -> None:
+        self._count: int = len(rules)
+        self._version: int = RuleBase.RuleSetsVersion
+        self._byName: dict[str, list[int]] = {}
+        self._default: list[int] = []
+        self._noRuleSet: list[int] = []
+        self._includes: list[int] = []
+        self._positions: dict[frozenset[str], Optional[tuple[int, ...]]] = {}
+
+        for position, rule in enumerate(rules):
+            ruleSets = rule.RuleSets
+            if not ruleSets:
+                self._noRuleSet.append(position)
+                self._default.append(position)
+                if RulesetValidatorSelector.IsIncludeRule(rule):
+                    self._includes.append(position)
+                continue
+
+            for name in ruleSets:
+                self._byName.setdefault(name, []).append(position)
+            if RulesetValidatorSelector.IncludesDefault(ruleSets):
+                self._default.append(position)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} with {len(self._byName)} rule sets>"
+
+    def IsCurrent(self, rules: TrackingCollection[IValidationRuleInternal]) -> bool:
+        """Whether the index still matches 'rules'. Adding a rule or changing the RuleSets of any rule makes it stale."""
+        return self._count == len(rules) and self._version == RuleBase.RuleSetsVersion
+
+    def positions(self, ruleSets: frozenset[str]) -> Optional[tuple[int, ...]]:
+        """Positions of the rules that can run with 'ruleSets', in order, or None when every rule can."""
+        if ruleSets in self._positions:
+            return self._positions[ruleSets]
+
+        if RulesetValidatorSelector.WildcardRuleSetName in ruleSets:
+            positions = None
+        elif not ruleSets:
+            positions = tuple(self._noRuleSet)
+        else:
+            selected: set[int] = set(self._includes)
+            if RulesetValidatorSelector.IncludesDefault(ruleSets):
+                selected.update(self._default)
+            for name in ruleSets:
+                selected.update(self._byName.get(name, ()))
+            positions = tuple(sorted(selected))
+
+        self._positions[ruleSets] = positions
+        return positions
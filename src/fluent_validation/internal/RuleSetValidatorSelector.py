@@ -17,6 +17,7 @@
 # endregion
 
 from __future__ import annotations
+from functools import lru_cache
 from typing import Callable, Iterable, override, TYPE_CHECKING
 from fluent_validation.IValidationRule import IValidationRule
 from fluent_validation.internal.IValidatorSelector import IValidatorSelector
@@ -40,46 +41,61 @@ class RulesetValidatorSelector(IValidatorSelector):
     DefaultRuleSetNameInArray: list[str] = [DefaultRuleSetName]
 
     @property
-    def RuleSets(self) -> Iterable[str]:
+    def RuleSets(self) -> frozenset[str]:
         return self._rulesetsToExecute
 
     def __init__(self, rulesetsToExecute: Iterable[str]):
-        self._rulesetsToExecute: Iterable[str] = rulesetsToExecute
+        self._rulesetsToExecute: frozenset[str] = frozenset(rulesetsToExecute)
+        self._executesDefault: bool = self.IncludesDefault(self._rulesetsToExecute)
+        self._executesAll: bool = self.WildcardRuleSetName in self._rulesetsToExecute
+
+    @property
+    @override
+    def Cost(self) -> int:
+        return 10
 
     @override
     def CanExecute(self, rule: IValidationRule, propertyPath: str, context: IValidationContext):
-        executed: set[str] = get_or_add(context.RootContextData, "_FV_RuleSetsExecuted", lambda: set())
+        executed: set[str] = self.GetExecutedRuleSets(context)
+        ruleSets = rule.RuleSets
 
-        if (rule.RuleSets is None or len(rule.RuleSets) == 0) and self._rulesetsToExecute:
-            if self.IsIncludeRule(rule):
+        if not ruleSets:
+            if not self._rulesetsToExecute or self._executesDefault or self._executesAll:
+                executed.add(self.DefaultRuleSetName)
                 return True
+            return self.IsIncludeRule(rule)
 
-        if (rule.RuleSets is None or len(rule.RuleSets) == 0) and not self._rulesetsToExecute:
+        if self._executesDefault and self.IncludesDefault(ruleSets):
             executed.add(self.DefaultRuleSetName)
             return True
 
-        if any([StringComparer.OrdinalIgnoreCase(self.DefaultRuleSetName, x) for x in self._rulesetsToExecute]):
-            if rule.RuleSets is None or len(rule.RuleSets) == 0 or any([StringComparer.OrdinalIgnoreCase(self.DefaultRuleSetName, x) for x in rule.RuleSets]):
-                executed.add(self.DefaultRuleSetName)
-                return True
-
-        if rule.RuleSets is not None and len(rule.RuleSets) > 0 and self._rulesetsToExecute:
-            # FIXME [x]: try to get the intersection with
-            intersection = set(rule.RuleSets) & set(self._rulesetsToExecute)
-            if intersection:
-                for r in intersection:
-                    executed.add(r)
-                return True
+        intersection = self._rulesetsToExecute.intersection(ruleSets)
+        if intersection:
+            executed.update(intersection)
+            return True
 
-        if self.WildcardRuleSetName in self._rulesetsToExecute:
-            if rule.RuleSets is None or len(rule.RuleSets) == 0:
-                executed.add(self.DefaultRuleSetName)
-            else:
-                for r in rule.RuleSets:
-                    executed.add(r)
+        if self._executesAll:
+            executed.update(ruleSets)
             return True
         return False
 
+    @staticmethod
+    def GetExecutedRuleSets(context: IValidationContext) -> set[str]:
+        """The rule sets executed so far, shared by the whole validation through the root context data."""
+        return get_or_add(context.RootContextData, "_FV_RuleSetsExecuted", lambda: set())
+
+    @staticmethod
+    def IncludesDefault(ruleSets: Iterable[str]) -> bool:
+        """Whether 'ruleSets' contains the default rule set, ignoring case."""
+        if not isinstance(ruleSets, frozenset):
+            ruleSets = frozenset(ruleSets)
+        return RulesetValidatorSelector._includes_default(ruleSets)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _includes_default(ruleSets: frozenset[str]) -> bool:
+        return any(StringComparer.OrdinalIgnoreCase(RulesetValidatorSelector.DefaultRuleSetName, x) for x in ruleSets)
+
     @staticmethod
     def IsIncludeRule(rule: IValidationRule) -> bool:
         from fluent_validation.internal.IncludeRule import IIncludeRule
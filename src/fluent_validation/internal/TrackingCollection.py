@@ -115,6 +115,12 @@ class TrackingCollection[T](IEnumerable[T]):
     def __iter__(self):
         return iter(self._innerCollection)
 
+    def copy(self) -> TrackingCollection[T]:
+        """Returns a new collection with the same items and no handlers."""
+        collection = TrackingCollection[T]()
+        collection._innerCollection = self._innerCollection.copy()
+        return collection
+
     def OnItemAdded(self, onItemAdded: Callable[[T], None]) -> IDisposable:
         self.ItemAdded.append(onItemAdded)
         return EventDisposable(self, onItemAdded)
@@ -39,6 +39,7 @@ class ValidationStrategy[T]:
         self._ruleSets: Optional[list[str]] = None
         self._throw: bool = False
         self._customSelector: Optional[MemberNameValidatorSelector] = None
+        self._selector: Optional[IValidatorSelector] = None
 
     @overload
     def IncludeProperties(self, *properties: str) -> ValidationStrategy[T]:
@@ -74,6 +75,7 @@ class ValidationStrategy[T]:
             else:
                 self._properties.extend(MemberNameValidatorSelector.MemberNamesFromExpressions(*properties))
 
+        self._selector = None
         return self
 
     def IncludeRulesNotInRuleSet(self) -> ValidationStrategy[T]:
@@ -84,6 +86,7 @@ class ValidationStrategy[T]:
         if not self._ruleSets:
             self._ruleSets = []
         self._ruleSets.append(RulesetValidatorSelector.DefaultRuleSetName)
+        self._selector = None
         return self
 
     def IncludeAllRuleSets(self) -> ValidationStrategy[T]:
@@ -94,6 +97,7 @@ class ValidationStrategy[T]:
         if not self._ruleSets:
             self._ruleSets = []
         self._ruleSets.append(RulesetValidatorSelector.WildcardRuleSetName)
+        self._selector = None
         return self
 
     def IncludeRuleSets(self, *ruleSets: str) -> ValidationStrategy[T]:
@@ -108,6 +112,7 @@ class ValidationStrategy[T]:
                 self._ruleSets = list(ruleSets)
             else:
                 self._ruleSets.extend(ruleSets)
+        self._selector = None
         return self
 
     def UseCustomSelector(self, selector: IValidatorSelector) -> ValidationStrategy[T]:
@@ -118,6 +123,7 @@ class ValidationStrategy[T]:
             selector: The custom selector to use
         """
         self._customSelector = selector
+        self._selector = None
         return self
 
     def ThrowOnFailures(self) -> ValidationStrategy[T]:
@@ -126,6 +132,10 @@ class ValidationStrategy[T]:
         return self
 
     def GetSelector(self) -> IValidatorSelector:
+        """Builds the selector once and shares it with every context created from this strategy."""
+        if self._selector is not None:
+            return self._selector
+
         selector: IValidatorSelector = None
 
         if self._properties is not None or self._ruleSets is not None or self._customSelector is not None:
@@ -144,6 +154,7 @@ class ValidationStrategy[T]:
         else:
             selector = ValidatorOptions.Global.ValidatorSelectors.DefaultValidatorSelectorFactory()
 
+        self._selector = selector
         return selector
 
     def BuildContext(self, instance: T) -> ValidationContext[T]:
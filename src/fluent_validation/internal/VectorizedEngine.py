@@ -0,0 +1,375 @@
+# region License
+# Copyright (c) .NET Foundation and contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# The latest version of this file can be found at https://github.com/p-hzamora/FluentValidation
+# endregion
+
+from __future__ import annotations
+from decimal import Decimal
+import operator
+from typing import Any, Callable, Iterable, Mapping, Optional, TYPE_CHECKING
+
+from fluent_validation.enums import CascadeMode
+from fluent_validation.internal.AccessorCache import AccessorCache
+from fluent_validation.internal.PropertyRule import PropertyRule
+from fluent_validation.IValidationContext import ValidationContext
+from fluent_validation.results.BatchValidationResult import BatchValidationResult
+from fluent_validation.results.ValidationResult import ValidationResult
+from fluent_validation.validators.AbstractComparisonValidator import Comparison
+from fluent_validation.validators.ComparableComparer import ComparableComparer
+from fluent_validation.validators.ExclusiveBetweenValidator import ExclusiveBetweenValidator
+from fluent_validation.validators.GreaterThanOrEqualValidator import GreaterThanOrEqualValidator
+from fluent_validation.validators.GreaterThanValidator import GreaterThanValidator
+from fluent_validation.validators.InclusiveBetweenValidator import InclusiveBetweenValidator
+from fluent_validation.validators.LengthValidator import ExactLengthValidator, LengthValidator, MaximumLengthValidator, MinimumLengthValidator
+from fluent_validation.validators.LessThanOrEqualValidator import LessThanOrEqualValidator
+from fluent_validation.validators.LessThanValidator import LessThanValidator
+from fluent_validation.validators.NotNullValidator import NotNullValidator
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from fluent_validation.abstract_validator import AbstractValidator
+    from fluent_validation.internal.IValidatorSelector import IValidatorSelector
+    from fluent_validation.internal.MessageFormatter import MessageFormatter
+    from fluent_validation.IValidationRuleInternal import IValidationRuleInternal
+    from fluent_validation.validators.IpropertyValidator import IPropertyValidator
+
+
+type ColumnCheck = Callable[[Any, np.ndarray], np.ndarray]
+"""Receives the non-null values of a column and returns a boolean mask, True where the value is valid."""
+
+_NUMBERS: tuple[type, ...] = (int, float, Decimal)
+
+_OPERATORS: dict[Comparison, Callable[[Any, Any], Any]] = {
+    Comparison.greater_than: operator.gt,
+    Comparison.GreaterThanOrEqual: operator.ge,
+    Comparison.less_than: operator.lt,
+    Comparison.LessThanOrEqual: operator.le,
+}
+
+
+def comparable(np, values: np.ndarray, constant: Any) -> np.ndarray:
+    """Returns 'values' in a dtype where comparing them with 'constant' gives the same answer as in python.
+
+    numpy compares an int column with a float (or a float column with an int) in float64, which is not exact above 2**53,
+    and casts python scalars down to narrower columns. Only int64 against int and float64 against float are compared
+    natively, any other numeric column is compared as python objects.
+    """
+    dtype = values.dtype
+    if dtype.kind not in "biuf":
+        return values
+    if (dtype == np.int64 and type(constant) is int and -(2**63) <= constant < 2**63) or (dtype == np.float64 and type(constant) is float):
+        return values
+    return values.astype(object)
+
+
+def import_numpy():
+    try:
+        import numpy
+    except ImportError as e:  # pragma: no cover - depends on the environment
+        raise ImportError("Vectorized validation requires numpy. Install it with 'pip install numpy'") from e
+    return numpy
+
+
+class ColumnRow:
+    """Read-only view of a single row of a ColumnBatch, so the regular rules can access it as 'row.Attribute'."""
+
+    __slots__ = (
+        "_columns",
+        "_index",
+        "_prefix",
+    )
+
+    def __init__(self, columns: Mapping[str, Any], index: int, prefix: str = "") -> None:
+        self._columns: Mapping[str, Any] = columns
+        self._index: int = index
+        self._prefix: str = prefix
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self._index}>"
+
+    def __getattr__(self, name: str) -> Any:
+        key = self._prefix + name
+        column = self._columns.get(key, None)
+        if column is not None:
+            value = column[self._index]
+            # numpy scalars are converted back to python objects, so failures hold the same values as with instances
+            return value.item() if type(value).__module__ == "numpy" else value
+
+        nested = key + "."
+        if any(x.startswith(nested) for x in self._columns):
+            return ColumnRow(self._columns, self._index, nested)
+        raise AttributeError(f"'{self.__class__.__name__}' has no column '{key}'")
+
+
+class ColumnBatch:
+    """Uniform access to a batch given as a list of instances, a dict of columns or a numpy structured array.
+
+    Nested properties are looked up in column dicts with the same path used for property names, e.g. 'Address.Line1'.
+    """
+
+    __slots__ = (
+        "_rows",
+        "_columns",
+        "_length",
+    )
+
+    def __init__(self, data: Iterable[Any] | Mapping[str, Iterable[Any]] | np.ndarray) -> None:
+        self._rows: Optional[list[Any]] = None
+        self._columns: Optional[dict[str, Any]] = None
+
+        names = getattr(getattr(data, "dtype", None), "names", None)
+        if names:
+            self._columns = {name: data[name] for name in names}
+        elif isinstance(data, Mapping):
+            self._columns = {key: value if hasattr(value, "dtype") else list(value) for key, value in data.items()}
+        else:
+            self._rows = list(data)
+
+        if self._rows is not None:
+            self._length: int = len(self._rows)
+        else:
+            lengths = {len(x) for x in self._columns.values()}
+            if len(lengths) > 1:
+                raise ValueError(f"All the columns must have the same length, got {sorted(lengths)}")
+            self._length = lengths.pop() if lengths else 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def row(self, index: int) -> Any:
+        if self._rows is not None:
+            return self._rows[index]
+        return ColumnRow(self._columns, index)
+
+    def column(self, np, chain: tuple[str, ...]) -> Optional[np.ndarray]:
+        """Returns the values of 'chain' as an array, or None when they cannot be read column-wise."""
+        if self._rows is None:
+            values = self._columns.get(".".join(chain), None)
+            if values is None:
+                return None
+            return values if hasattr(values, "dtype") else self.to_array(np, values)
+
+        getter = operator.attrgetter(".".join(chain))
+        try:
+            return self.to_array(np, [getter(x) for x in self._rows])
+        except AttributeError:
+            return None
+
+    @staticmethod
+    def to_array(np, values: list[Any]) -> np.ndarray:
+        # Plain np.array would coerce mixed values ([1, "a"] -> ['1', 'a']), so only homogeneous numbers get a native dtype
+        kinds = set(map(type, values))
+        try:
+            if kinds == {int}:
+                return np.array(values, dtype=np.int64)
+            if kinds == {float}:
+                return np.array(values, dtype=np.float64)
+        except OverflowError:
+            pass
+        return np.fromiter(values, dtype=object, count=len(values))
+
+
+class VectorizedRule:
+    __slots__ = (
+        "rule",
+        "chain",
+        "checks",
+    )
+
+    def __init__(self, rule: PropertyRule, chain: tuple[str, ...], checks: list[ColumnCheck]) -> None:
+        self.rule: PropertyRule = rule
+        self.chain: tuple[str, ...] = chain
+        self.checks: list[ColumnCheck] = checks
+
+
+class VectorizedEngine[T]:
+    """Evaluates the simple property rules of a validator column-wise with numpy.
+
+    A rule is vectorized when it is a plain property rule over an attribute chain, without conditions or dependent rules,
+    and all its validators are not_null, comparisons, inclusive/exclusive between or length with constant arguments.
+    Those rules are reduced to a boolean mask per row. Only the rows that fail the mask are validated again through the
+    regular path, which builds exactly the same ValidationFailure objects as 'validate'. The rest of rules (must, custom,
+    child validators, collections...) are run row by row as usual.
+    """
+
+    __slots__ = (
+        "_validator",
+        "_vectorized",
+        "_residual",
+    )
+
+    def __init__(self, validator: AbstractValidator[T]) -> None:
+        self._validator: AbstractValidator[T] = validator
+        self._vectorized: list[VectorizedRule] = []
+        self._residual: list[IValidationRuleInternal[T]] = []
+
+        # pre_validate can change the result of any instance, so it can only be honoured row by row
+        can_vectorize: bool = self._uses_default_pre_validate(validator)
+        for rule in validator.Rules:
+            vectorized = self.vectorize_rule(rule) if can_vectorize else None
+            if vectorized is None:
+                self._residual.append(rule)
+            else:
+                self._vectorized.append(vectorized)
+
+    @staticmethod
+    def _uses_default_pre_validate(validator: AbstractValidator[T]) -> bool:
+        from fluent_validation.abstract_validator import AbstractValidator
+
+        return type(validator).pre_validate is AbstractValidator.pre_validate
+
+    @property
+    def VectorizedRules(self) -> list[PropertyRule]:
+        return [x.rule for x in self._vectorized]
+
+    @property
+    def ResidualRules(self) -> list[IValidationRuleInternal[T]]:
+        return self._residual
+
+    @classmethod
+    def vectorize_rule(cls, rule: IValidationRuleInternal[T]) -> Optional[VectorizedRule]:
+        if type(rule) is not PropertyRule or not rule.PropertyName or rule.Condition is not None or rule.dependent_rules:
+            return None
+
+        chain = AccessorCache.attribute_chain(rule.Expression.func)
+        if not chain:
+            return None
+
+        checks: list[ColumnCheck] = []
+        for component in rule.Components:
+            if component.HasCondition or not component.SupportsSynchronousValidation:
+                return None
+            check = cls.vectorize_validator(component.Validator)
+            if check is None:
+                return None
+            checks.append(check)
+        return VectorizedRule(rule, chain, checks)
+
+    @staticmethod
+    def vectorize_validator(validator: IPropertyValidator) -> Optional[ColumnCheck]:
+        kind = type(validator)
+
+        if kind is NotNullValidator:
+            # Null values are never valid, and 'check' only receives the non-null ones
+            return lambda np, values: np.ones(len(values), dtype=bool)
+
+        if kind in (GreaterThanValidator, GreaterThanOrEqualValidator, LessThanValidator, LessThanOrEqualValidator):
+            if validator._valueToCompareFunc is not None or validator._valueToCompareFuncForNullables is not None or not hasattr(validator, "_valueToCompare"):
+                return None
+            constant = validator.ValueToCompare
+            if type(constant) not in _NUMBERS and type(constant) is not str:
+                return None
+            op = _OPERATORS[validator.Comparison]
+            return lambda np, values: np.asarray(op(comparable(np, values, constant), constant), dtype=bool)
+
+        if kind in (InclusiveBetweenValidator, ExclusiveBetweenValidator):
+            if getattr(validator._explicitComparer, "__origin__", validator._explicitComparer) is not ComparableComparer:
+                return None
+            lower, upper = validator.From, validator.To
+            if kind is InclusiveBetweenValidator:
+                return lambda np, values: ~np.asarray(comparable(np, values, lower) < lower, dtype=bool) & ~np.asarray(comparable(np, values, upper) > upper, dtype=bool)
+            return lambda np, values: np.asarray(comparable(np, values, lower) > lower, dtype=bool) & np.asarray(comparable(np, values, upper) < upper, dtype=bool)
+
+        if kind in (LengthValidator, ExactLengthValidator, MaximumLengthValidator, MinimumLengthValidator):
+            if validator._min_func is not None or validator._max_func is not None:
+                return None
+            min_length, max_length = validator.Min, validator.Max
+
+            def check_length(np, values: np.ndarray) -> np.ndarray:
+                if values.dtype.kind == "U":
+                    lengths = np.char.str_len(values)
+                else:
+                    lengths = np.fromiter(map(len, values), dtype=np.int64, count=len(values))
+                valid = lengths >= min_length
+                if max_length != -1:
+                    valid &= lengths <= max_length
+                return valid
+
+            return check_length
+
+        return None
+
+    def mask(self, np, batch: ColumnBatch, selector: IValidatorSelector, probe: ValidationContext[T]) -> np.ndarray:
+        """Returns a boolean array, True for the rows that pass every vectorized rule."""
+        valid = np.ones(len(batch), dtype=bool)
+
+        for vectorized in self._vectorized:
+            if not selector.CanExecute(vectorized.rule, vectorized.rule.PropertyName, probe):
+                continue
+
+            column = batch.column(np, vectorized.chain)
+            if column is None:
+                # The column cannot be read as a whole, so every row goes through the regular path
+                return np.zeros(len(batch), dtype=bool)
+
+            null = np.equal(column, None) if column.dtype == object else np.zeros(len(column), dtype=bool)
+            rule_valid = ~null if any(type(x.Validator) is NotNullValidator for x in vectorized.rule.Components) else np.ones(len(column), dtype=bool)
+            values = column[~null]
+            try:
+                values_valid = np.ones(len(values), dtype=bool)
+                for check in vectorized.checks:
+                    values_valid &= check(np, values)
+                rule_valid[~null] &= values_valid
+            except (TypeError, ValueError):
+                # Values that numpy cannot compare are left to the regular validators
+                rule_valid[:] = False
+            valid &= rule_valid
+        return valid
+
+    def validate(self, data: Any, selector: IValidatorSelector, messageFormatter: MessageFormatter, throwOnFailures: bool) -> BatchValidationResult:
+        np = import_numpy()
+        validator = self._validator
+        batch = data if isinstance(data, ColumnBatch) else ColumnBatch(data)
+
+        probe = ValidationContext(None, None, selector, [], messageFormatter)
+        valid = self.mask(np, batch, selector, probe)
+
+        invalid_results: dict[int, ValidationResult] = {}
+        rule_sets_executed: set[str] = set(probe.RootContextData.get("_FV_RuleSetsExecuted", ()))
+
+        rows = range(len(batch)) if self._residual else np.flatnonzero(~valid).tolist()
+        for index in rows:
+            context = ValidationContext(batch.row(index), None, selector, [], messageFormatter)
+            context.ThrowOnFailures = throwOnFailures
+            if valid[index]:
+                result = self._validate_residual(context)
+            else:
+                result = validator.validate(context)
+
+            if not result.is_valid:
+                invalid_results[index] = result
+            if result.RuleSetsExecuted:
+                rule_sets_executed.update(result.RuleSetsExecuted)
+
+        return BatchValidationResult(len(batch), invalid_results, sorted(rule_sets_executed) if rule_sets_executed else None)
+
+    def _validate_residual(self, context: ValidationContext[T]) -> ValidationResult:
+        """Same loop as 'AbstractValidator.ValidateInternalSync' but only over the rules that were not vectorized."""
+        validator = self._validator
+        result = ValidationResult(errors=context.Failures)
+        stop = validator.ClassLevelCascadeMode == CascadeMode.Stop
+
+        for rule in self._residual:
+            totalFailures = len(context.Failures)
+            rule.ValidateSync(context)
+            if stop and len(context.Failures) > totalFailures:
+                break
+
+        validator.SetExecutedRuleSets(result, context)
+        if not result.is_valid and context.ThrowOnFailures:
+            validator.RaiseValidationException(context, result)
+        return result
@@ -17,6 +17,8 @@
 # endregion
 
 from collections import defaultdict
+from functools import lru_cache
+from types import CodeType
 from typing import Any, Callable, NamedTuple, Self, Optional
 from dis import Instruction, Bytecode
 from .dis_types import OpName
@@ -73,6 +75,16 @@ class TreeInstruction:
     def __repr__(self) -> str:
         return f"{TreeInstruction.__name__} < at {hex(id(self))}>"
 
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def disassemble(code: CodeType) -> tuple[TupleInstruction, ...]:
+        """
+        Return 'to_list' result of the code object, cached by code.
+        Every instance of a validator defines its rules with the same lambdas, so they share a single parse.
+        The result is shared between callers and must not be mutated.
+        """
+        return tuple(TreeInstruction(code).to_list())
+
     @staticmethod
     def _transform__compare_op(compare_sybmol: ConditionType) -> str:
         dicc_symbols: dict[ConditionType, str] = {
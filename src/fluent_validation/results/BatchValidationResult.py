@@ -0,0 +1,108 @@
+# region License
+# Copyright (c) .NET Foundation and contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# The latest version of this file can be found at https://github.com/p-hzamora/FluentValidation
+# endregion
+
+from __future__ import annotations
+from typing import Iterable, Iterator, Optional, TYPE_CHECKING
+
+from fluent_validation.results.ValidationResult import ValidationResult
+
+if TYPE_CHECKING:
+    from .ValidationFailure import ValidationFailure
+
+
+class BatchValidationResult:
+    """Compact result of 'AbstractValidator.validate_many'.
+
+    Only the results of the instances that failed are kept, indexed by their position in the batch. The result of a valid
+    instance is created on demand when it is accessed by index or while iterating.
+    """
+
+    __slots__ = (
+        "_count",
+        "_invalid_results",
+        "_rule_sets_executed",
+    )
+
+    def __init__(self, count: int = 0, invalid_results: Optional[dict[int, ValidationResult]] = None, rule_sets_executed: Optional[list[str]] = None) -> None:
+        self._count: int = count
+        self._invalid_results: dict[int, ValidationResult] = invalid_results if invalid_results is not None else {}
+        self._rule_sets_executed: Optional[list[str]] = rule_sets_executed
+
+    @classmethod
+    def from_results(cls, results: Iterable[ValidationResult]) -> BatchValidationResult:
+        count: int = 0
+        invalid_results: dict[int, ValidationResult] = {}
+        rule_sets_executed: set[str] = set()
+
+        for result in results:
+            if not result.is_valid:
+                invalid_results[count] = result
+            if result.RuleSetsExecuted:
+                rule_sets_executed.update(result.RuleSetsExecuted)
+            count += 1
+        return cls(count, invalid_results, sorted(rule_sets_executed) if rule_sets_executed else None)
+
+    def __repr__(self) -> str:
+        return f"{BatchValidationResult.__name__}: Count={self._count}; Invalid={self.invalid_count}"
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> ValidationResult:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(f"Index '{index}' is out of range for a batch of {self._count} instances")
+
+        result = self._invalid_results.get(index, None)
+        if result is None:
+            result = ValidationResult()
+            result.RuleSetsExecuted = self._rule_sets_executed
+        return result
+
+    def __iter__(self) -> Iterator[ValidationResult]:
+        for index in range(self._count):
+            yield self[index]
+
+    @property
+    def is_valid(self) -> bool:
+        return len(self._invalid_results) == 0
+
+    @property
+    def invalid_count(self) -> int:
+        return len(self._invalid_results)
+
+    @property
+    def valid_count(self) -> int:
+        return self._count - len(self._invalid_results)
+
+    @property
+    def invalid_results(self) -> dict[int, ValidationResult]:
+        """Results of the instances that failed, keyed by their position in the batch."""
+        return self._invalid_results
+
+    @property
+    def errors(self) -> list[ValidationFailure]:
+        return [failure for result in self._invalid_results.values() for failure in result.errors]
+
+    @property
+    def RuleSetsExecuted(self) -> Optional[list[str]]:
+        return self._rule_sets_executed
+
+    def to_dictionary(self) -> dict[int, dict[str, list[str]]]:
+        return {index: result.to_dictionary() for index, result in self._invalid_results.items()}
@@ -18,6 +18,7 @@
 
 from typing import Any
 from fluent_validation.enums import Severity as _Severity
+from fluent_validation.internal.MessageFormatter import MessageFormatter
 
 
 class ValidationFailure:
@@ -29,6 +30,7 @@ class ValidationFailure:
         "_ErrorCode",
         "_severity",
         "_FormattedMessagePlaceholderValues",
+        "_MessageTemplate",
     )
 
     def __init__(
@@ -37,6 +39,7 @@ class ValidationFailure:
         ErrorMessage: str = None,
         AttemptedValue: object = None,
         ErrorCode: str = None,
+        MessageTemplate: str = None,
     ):
         self._PropertyName: str = PropertyName
         self._ErrorMessage: str = ErrorMessage
@@ -46,6 +49,7 @@ class ValidationFailure:
         self._ErrorCode: str = ErrorCode
         self._severity: _Severity = _Severity.Error
         self._FormattedMessagePlaceholderValues: dict[str, object] = None
+        self._MessageTemplate: str = MessageTemplate
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}: {self._PropertyName} {id(self)}>"
@@ -56,8 +60,16 @@ class ValidationFailure:
 
     @property
     def ErrorMessage(self) -> str:
+        # Failures created by the validators keep the template and render the message the first time it is read
+        if self._ErrorMessage is None and self._MessageTemplate is not None:
+            self._ErrorMessage = MessageFormatter.format_template(self._MessageTemplate, self._FormattedMessagePlaceholderValues or {})
         return self._ErrorMessage
 
+    @property
+    def MessageTemplate(self) -> str:
+        """The error message template, before its placeholders were replaced. None if the failure was created with its message."""
+        return self._MessageTemplate
+
     @property
     def AttemptedValue(self) -> object:
         return self._AttemptedValue
@@ -95,4 +107,4 @@ class ValidationFailure:
         self._FormattedMessagePlaceholderValues = value
 
     def __str__(self) -> str:
-        return self._ErrorMessage
+        return self.ErrorMessage
@@ -28,6 +28,7 @@ from fluent_validation.validators.EmptyValidator import ValidationContext
 from fluent_validation.MemberInfo import MemberInfo
 
 import inspect
+import threading
 from .ChildValidatorAdaptor import ChildValidatorAdaptor
 
 
@@ -97,12 +98,12 @@ class PolymorphicValidator[T, TProperty](ChildValidatorAdaptor[T, TProperty]):
             TProperty: Base type of property being validated
     """
 
-    _derivedValidators: dict[Type, DerivedValidatorFactory] = {}
-    _unknownTypeValidators: list[DerivedValidatorFactory] = []  # COMMENT: Only for python purpose. For factories with unknown types
-
     # Need the base constructor call, even though we're just passing None.
     def __init__(self, t_property: Type[TProperty]):
         super().__init__(None, t_property)
+        self._derivedValidators: dict[Type, DerivedValidatorFactory] = {}
+        self._unknownTypeValidators: list[DerivedValidatorFactory] = []  # COMMENT: Only for python purpose. For factories with unknown types
+        self._lock: threading.Lock = threading.Lock()
 
     def __add_with_validator[TDerived](self, validatorFactory: IValidator[TDerived], *ruleSets: str) -> PolymorphicValidator[T, TProperty]:
         """
@@ -227,13 +228,15 @@ class PolymorphicValidator[T, TProperty](ChildValidatorAdaptor[T, TProperty]):
 
         # COMMENT: Only for python purpose
         # If no exact match, try factories with unknown types
-        for factory in self._unknownTypeValidators:
+        for factory in tuple(self._unknownTypeValidators):
             try:
                 validator = factory.GetValidator(context, value)
                 if validator and hasattr(validator, "_type_model") and validator._type_model is type(value):
-                    # Move this factory to the correct type for future lookups
-                    self._derivedValidators[type(value)] = factory
-                    self._unknownTypeValidators.remove(factory)
+                    # Move this factory to the correct type for future lookups. Another thread may have moved it already
+                    with self._lock:
+                        self._derivedValidators[type(value)] = factory
+                        if factory in self._unknownTypeValidators:
+                            self._unknownTypeValidators.remove(factory)
                     return validator
             except Exception:
                 continue
@@ -19,7 +19,7 @@
 from dataclasses import dataclass
 
 import re
-from typing import Callable, Optional, overload, override
+from typing import Callable, overload, override
 from fluent_validation.IValidationContext import ValidationContext
 
 from fluent_validation.validators.PropertyValidator import PropertyValidator
@@ -95,31 +95,21 @@ class RegularExpressionValidator[T](PropertyValidator[T, str], IRegularExpressio
     def __init__with_callable_dynamic(self, expression: Callable[[T], str | re.Pattern], options: _FlagsType = re.NOFLAG):
         """
         Handles callable that returns either str or re.Pattern.
-        Type discovery happens at runtime on first call.
+        The type is checked on every call instead of caching a resolved function on the validator, so the validator is
+        never mutated while validating and can be shared between threads. 're.compile' keeps its own cache of patterns.
         """
         self._expression = f"Dynamic: {expression.__name__ if hasattr(expression, '__name__') else 'lambda'}"
-        self._cached_func: Optional[Callable[[T], re.Pattern]] = None
         self._original_callable = expression
         self._options = options
 
         def dynamic_regex_func(instance: T) -> re.Pattern:
-            # Cache the resolved function after first call
-            if self._cached_func is None:
-                result = self._original_callable(instance)
-
-                if isinstance(result, str):
-                    # It returns string, so create a function that compiles it
-                    self._cached_func = lambda x: self.CreateRegex(self._original_callable(x), self._options)
-                elif isinstance(result, re.Pattern):
-                    # It returns pattern, so use it directly (ignore options if provided)
-                    if self._options != re.NOFLAG:
-                        # If options were provided but we got a Pattern, we need to recompile
-                        self._cached_func = lambda x: self.CreateRegex(self._original_callable(x).pattern, self._options)
-                    else:
-                        self._cached_func = self._original_callable
-                else:
-                    raise TypeError(f"Callable must return str or re.Pattern, got {type(result)}")
-
-            return self._cached_func(instance)
+            result = self._original_callable(instance)
+
+            if isinstance(result, str):
+                return self.CreateRegex(result, self._options)
+            if isinstance(result, re.Pattern):
+                # If options were provided but we got a Pattern, we need to recompile
+                return self.CreateRegex(result.pattern, self._options) if self._options != re.NOFLAG else result
+            raise TypeError(f"Callable must return str or re.Pattern, got {type(result)}")
 
         self._regex_func = dynamic_regex_func
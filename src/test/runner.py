@@ -67,6 +67,15 @@ import test_RegularExpressionValidator
 import test_LocalisedMessages
 import test_PropertyChain
 import test_InheritanceValidator
+import test_ExecutionPlan
+import test_ValidateMany
+import test_VectorizedValidation
+import test_ParallelValidator
+import test_ThreadSafety
+import test_ImportTime
+import test_CachedRules
+import test_AccessorCache
+import test_IsValid
 import python_test.test_extract_type_when_using_cast_method as _python_cast_method
 import python_test.test_not_empty as _python_not_empty
 
@@ -128,6 +137,15 @@ suite.addTests(
         *loader.loadTestsFromModule(test_LanguageManager),
         *loader.loadTestsFromModule(test_UserState),
         *loader.loadTestsFromModule(test_ValidationResult),
+        *loader.loadTestsFromModule(test_ExecutionPlan),
+        *loader.loadTestsFromModule(test_ValidateMany),
+        *loader.loadTestsFromModule(test_VectorizedValidation),
+        *loader.loadTestsFromModule(test_ParallelValidator),
+        *loader.loadTestsFromModule(test_ThreadSafety),
+        *loader.loadTestsFromModule(test_ImportTime),
+        *loader.loadTestsFromModule(test_CachedRules),
+        *loader.loadTestsFromModule(test_AccessorCache),
+        *loader.loadTestsFromModule(test_IsValid),
     )
 )
 
@@ -0,0 +1,66 @@
+# region License
+# Copyright (c) .NET Foundation and contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# The latest version of this file can be found at https://github.com/p-hzamora/FluentValidation
+# endregion
+
+import operator
+import unittest
+import sys
+from pathlib import Path
+
+sys.path.append([str(x) for x in Path(__file__).parents if x.name == "src"].pop())
+
+from fluent_validation import AbstractValidator  # noqa: E402
+from fluent_validation.internal.AccessorCache import AccessorCache  # noqa: E402
+from person import _Address, Person  # noqa: E402
+
+
+class AccessorCacheTests(unittest.TestCase):
+    def setUp(self):
+        AccessorCache.clear()
+
+    def test_Attribute_chains_share_one_attrgetter(self):
+        first = AccessorCache[Person].GetCachedAccessor(None, lambda x: x.Address.Line1)
+        second = AccessorCache[Person].GetCachedAccessor(None, lambda p: p.Address.Line1)
+
+        self.assertIsInstance(first, operator.attrgetter)
+        self.assertIs(first, second)
+        self.assertEqual(first(Person(Address=_Address(Line1="1"), Orders=[])), "1")
+        self.assertEqual(AccessorCache.cache_info().misses, 1)
+        self.assertEqual(AccessorCache.cache_info().hits, 1)
+
+    def test_Other_expressions_are_returned_as_is(self):
+        suffix = "!"
+        expressions = [
+            lambda x: x.Surname.upper(),
+            lambda x: x.Surname + suffix,
+            lambda x: x,
+            lambda x, y: x.Surname,
+        ]
+        for expression in expressions:
+            self.assertIs(AccessorCache[Person].GetCachedAccessor(None, expression), expression)
+        self.assertEqual(AccessorCache.cache_info().currsize, 0)
+
+    def test_Rules_read_the_property_with_the_cached_accessor(self):
+        validator = AbstractValidator[Person](Person)
+        validator.rule_for(lambda x: x.Surname).not_null()
+
+        self.assertIsInstance(validator.Rules[0].PropertyFunc, operator.attrgetter)
+        self.assertTrue(validator.validate(Person(Surname="foo", Orders=[])).is_valid)
+
+
+if __name__ == "__main__":
+    unittest.main()
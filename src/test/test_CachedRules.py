@@ -0,0 +1,129 @@
+# region License
+# Copyright (c) .NET Foundation and contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# The latest version of this file can be found at https://github.com/p-hzamora/FluentValidation
+# endregion
+
+import gc
+import unittest
+import sys
+import weakref
+from pathlib import Path
+
+sys.path.append([str(x) for x in Path(__file__).parents if x.name == "src"].pop())
+
+from fluent_validation import AbstractValidator, CascadeMode  # noqa: E402
+from fluent_validation.ValidatorOptions import ValidatorOptions  # noqa: E402
+from CultureScope import CultureScope  # noqa: E402
+from person import Person  # noqa: E402
+
+
+class CachedPersonValidator(AbstractValidator[Person], cache_rules=True):
+    built: int = 0
+
+    def __init__(self, min_length: int = 2):
+        super().__init__(Person)
+        CachedPersonValidator.built += 1
+        self.rule_for(lambda x: x.Surname).not_null()
+        self.rule_for(lambda x: x.Forename).length(min_length, 5)
+
+
+class StopOnFirstFailureValidator(AbstractValidator[Person], cache_rules=True):
+    def __init__(self):
+        super().__init__(Person)
+        self.RuleLevelCascadeMode = CascadeMode.Stop
+        self.rule_for(lambda x: x.Surname).not_null().not_empty()
+
+
+class ExtendedPersonValidator(CachedPersonValidator):
+    def __init__(self):
+        super().__init__()
+        self.rule_for(lambda x: x.Email).not_null()
+
+
+class CachedRulesTests(unittest.TestCase):
+    def __init__(self, methodName="runTest"):
+        super().__init__(methodName)
+        CultureScope.SetDefaultCulture()
+
+    def setUp(self):
+        ValidatorOptions.Global.PropertyNameResolver = None
+        CachedPersonValidator.clear_rules_cache()
+        CachedPersonValidator.built = 0
+
+    def test_Rules_are_built_once_per_class_and_arguments(self):
+        first, second = CachedPersonValidator(), CachedPersonValidator()
+        third = CachedPersonValidator(min_length=3)
+
+        self.assertEqual(CachedPersonValidator.built, 2)
+        self.assertEqual(list(first.Rules), list(second.Rules))
+        self.assertIsNot(first.Rules, second.Rules)
+        self.assertTrue(second.validate(Person(Surname="foo", Forename="ab", Orders=[])).is_valid)
+        self.assertFalse(third.validate(Person(Surname="foo", Forename="ab", Orders=[])).is_valid)
+
+    def test_Rules_added_to_an_instance_are_not_shared(self):
+        first = CachedPersonValidator()
+        first.rule_for(lambda x: x.Email).not_null()
+        second = CachedPersonValidator()
+
+        self.assertEqual(len(first.Rules), 3)
+        self.assertEqual(len(second.Rules), 2)
+
+    def test_Subclasses_build_their_own_rules(self):
+        CachedPersonValidator()
+        validator = ExtendedPersonValidator()
+
+        self.assertEqual(CachedPersonValidator.built, 2)
+        self.assertEqual([x.PropertyName for x in validator.Rules], ["Surname", "Forename", "Email"])
+        self.assertEqual(len(CachedPersonValidator().Rules), 2)
+
+    def test_Cascade_modes_cannot_be_changed_on_cached_instances(self):
+        first, second = CachedPersonValidator(), CachedPersonValidator()
+
+        with self.assertRaises(RuntimeError):
+            first.RuleLevelCascadeMode = CascadeMode.Stop
+        with self.assertRaises(RuntimeError):
+            second.RuleLevelCascadeMode = CascadeMode.Stop
+        with self.assertRaises(RuntimeError):
+            second.ClassLevelCascadeMode = CascadeMode.Stop
+        self.assertEqual(len(first.validate(Person(Surname=None, Forename="a", Orders=[])).errors), 2)
+        self.assertEqual(len(second.validate(Person(Surname=None, Forename="a", Orders=[])).errors), 2)
+
+    def test_Cascade_modes_set_in_init_apply_to_every_instance(self):
+        StopOnFirstFailureValidator.clear_rules_cache()
+        first, second = StopOnFirstFailureValidator(), StopOnFirstFailureValidator()
+
+        self.assertEqual(len(first.validate(Person(Surname=None, Orders=[])).errors), 1)
+        self.assertEqual(len(second.validate(Person(Surname=None, Orders=[])).errors), 1)
+
+    def test_Cached_rules_do_not_keep_instances_alive(self):
+        first = CachedPersonValidator()
+        reference = weakref.ref(first)
+        del first
+        gc.collect()
+
+        self.assertIsNone(reference())
+        self.assertTrue(CachedPersonValidator().validate(Person(Surname="foo", Forename="ab", Orders=[])).is_valid)
+
+    def test_Clearing_the_cache_builds_the_rules_again(self):
+        CachedPersonValidator()
+        CachedPersonValidator.clear_rules_cache()
+        CachedPersonValidator()
+
+        self.assertEqual(CachedPersonValidator.built, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
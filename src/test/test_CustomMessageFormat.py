@@ -24,6 +24,10 @@ sys.path.append([str(x) for x in Path(__file__).parents if x.name == "src"].pop(
 
 from fluent_validation.validators.NotNullValidator import INotNullValidator
 from fluent_validation.IValidationRule import IValidationRule
+from fluent_validation.internal.DefaultValidatorSelector import DefaultValidatorSelector
+from fluent_validation.internal.MessageFormatter import MessageFormatter
+from fluent_validation.IValidationContext import ValidationContext
+from fluent_validation.ValidatorOptions import ValidatorOptions
 from CultureScope import CultureScope
 from TestValidator import TestValidator
 from person import Person
@@ -89,6 +93,78 @@ class CustomMessageFormatTester(unittest.TestCase):
         self.assertEqual(result.errors[0].ErrorMessage, "Surname")
         self.assertEqual(result.errors[1].ErrorMessage, "Orders[0]")
 
+    def test_Message_is_rendered_from_the_template_when_read(self):
+        self.validator.rule_for(lambda x: x.Surname).length(2, 5).with_message("{PropertyName} has {total_length} characters")
+
+        failure = self.validator.validate(Person(Surname="abcdefg")).errors[0]
+        self.assertEqual(failure.MessageTemplate, "{PropertyName} has {total_length} characters")
+        self.assertEqual(failure.FormattedMessagePlaceholderValues["total_length"], 7)
+        self.assertEqual(failure.ErrorMessage, "Surname has 7 characters")
+        self.assertEqual(str(failure), "Surname has 7 characters")
+
+    def test_Templates_are_parsed_once(self):
+        MessageFormatter.parse_template.cache_clear()
+        formatter = MessageFormatter().AppendArgument("Total", 1234.5).AppendArgument("Empty", None)
+        template = "{PropertyName}: {Total:,.2f} {Empty}{Unknown}!"
+
+        self.assertEqual(formatter.BuildMessage(template), "{PropertyName}: 1,234.50 {Unknown}!")
+        self.assertEqual(formatter.BuildMessage(template), "{PropertyName}: 1,234.50 {Unknown}!")
+        self.assertEqual(formatter.BuildMessage("No placeholders"), "No placeholders")
+        self.assertEqual(MessageFormatter.parse_template.cache_info().hits, 1)
+        self.assertEqual(MessageFormatter.parse_template.cache_info().currsize, 2)
+
+    def test_Message_is_built_eagerly_by_custom_formatters(self):
+        class UpperMessageFormatter(MessageFormatter):
+            def BuildMessage(self, messageTemplate: str) -> str:
+                return super().BuildMessage(messageTemplate).upper()
+
+        ValidatorOptions.Global.MessageFormatterFactory = UpperMessageFormatter
+        try:
+            self.validator.rule_for(lambda x: x.Surname).not_null().with_message("{PropertyName}")
+            failure = self.validator.validate(Person()).errors[0]
+        finally:
+            ValidatorOptions.Global.MessageFormatterFactory = None
+
+        self.assertIsNone(failure.MessageTemplate)
+        self.assertEqual(failure.ErrorMessage, "SURNAME")
+
+    def test_Placeholders_appended_while_the_message_is_built_are_kept(self):
+        class TaggingMessageFormatter(MessageFormatter):
+            def BuildMessage(self, messageTemplate: str) -> str:
+                self.AppendArgument("Rendered", True)
+                return super().BuildMessage(messageTemplate)
+
+        def _lambda(cfg: IValidationRule):
+            cfg.MessageBuilder = lambda context: context.MessageFormatter.AppendArgument("Built", True).BuildMessage("{PropertyName}")
+
+        self.validator.rule_for(lambda x: x.Forename).not_null().configure(_lambda)
+        ValidatorOptions.Global.MessageFormatterFactory = TaggingMessageFormatter
+        try:
+            self.validator.rule_for(lambda x: x.Surname).not_null()
+            result = self.validator.validate(Person())
+        finally:
+            ValidatorOptions.Global.MessageFormatterFactory = None
+
+        self.assertTrue(result.errors[0].FormattedMessagePlaceholderValues["Built"])
+        self.assertTrue(result.errors[1].FormattedMessagePlaceholderValues["Rendered"])
+
+    def test_Contexts_without_a_formatter_use_the_MessageFormatterFactory(self):
+        class CustomMessageFormatter(MessageFormatter): ...
+
+        ValidatorOptions.Global.MessageFormatterFactory = CustomMessageFormatter
+        try:
+            contexts = [
+                ValidationContext(Person()),
+                ValidationContext(Person(), None, DefaultValidatorSelector()),
+                ValidationContext(Person(), None, DefaultValidatorSelector(), []),
+            ]
+            formatters = [type(x.MessageFormatter) for x in contexts]
+        finally:
+            ValidatorOptions.Global.MessageFormatterFactory = None
+
+        self.assertEqual(formatters, [CustomMessageFormatter] * 3)
+        self.assertIs(type(ValidationContext(Person(), None, DefaultValidatorSelector(), []).MessageFormatter), MessageFormatter)
+
 
 if __name__ == "__main__":
     unittest.main()
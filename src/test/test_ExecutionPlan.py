@@ -0,0 +1,276 @@
+# region License
+# Copyright (c) .NET Foundation and contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# The latest version of this file can be found at https://github.com/p-hzamora/FluentValidation
+# endregion
+
+import unittest
+import sys
+from pathlib import Path
+
+sys.path.append([str(x) for x in Path(__file__).parents if x.name == "src"].pop())
+
+from fluent_validation import AbstractValidator, CascadeMode  # noqa: E402
+from fluent_validation.internal.ExecutionPlan import ConditionGroupStep, PropertyRuleStep, RuleStep  # noqa: E402
+from fluent_validation.results.ValidationResult import ValidationResult  # noqa: E402
+from fluent_validation.ValidatorOptions import ValidatorOptions  # noqa: E402
+from CultureScope import CultureScope  # noqa: E402
+from person import _Address, EnumGender, Order, Person  # noqa: E402
+
+
+class AddressValidator(AbstractValidator[_Address]):
+    def __init__(self):
+        super().__init__(_Address)
+        self.rule_for(lambda x: x.Postcode).not_null()
+        self.rule_for(lambda x: x.Line1).not_empty().length(2, 10)
+
+
+class PersonValidator(AbstractValidator[Person]):
+    def __init__(self):
+        super().__init__(Person)
+        self.rule_for(lambda x: x.Surname).not_null().length(2, 5).with_name("Last name")
+        self.rule_for(lambda x: x.Forename).not_empty().when(lambda x: x.Surname is not None)
+        self.rule_for(lambda x: x.Age).greater_than(18).less_than(100).WithErrorCode("AGE")
+        self.rule_for(lambda x: x.Email).email_address().dependent_rules(lambda: self.rule_for(lambda x: x.Email).must(lambda x: x is None or x.endswith(".com")))
+        self.rule_for(lambda x: x.Address).set_validator(AddressValidator()).when(lambda x: x.Address is not None)
+        self.rule_for_each(lambda x: x.Orders).must(lambda x: x.Amount > 0)
+        self.rule_for(lambda x: x.NickNames).custom(self._nick_names)
+
+        self.when(lambda x: x.Id > 0, lambda: self.rule_for(lambda x: x.CreditCard).credit_card())
+
+        self.rule_set("names", lambda: self.rule_for(lambda x: x.NameField).not_null())
+
+    @staticmethod
+    def _nick_names(value, context) -> None:
+        if value is not None and len(value) > 2:
+            context.AddFailure(propertyName="NickNames", errorMessage="Too many nick names")
+
+
+class BuiltInValidator(AbstractValidator[Person]):
+    def __init__(self):
+        super().__init__(Person)
+        self.rule_for(lambda x: x.Surname).not_null().not_empty().length(2, 5).matches(r"^[a-z]+$")
+        self.rule_for(lambda x: x.Forename).max_length(4).when(lambda x: x.Surname is not None)
+        self.rule_for(lambda x: x.Age).greater_than(18).less_than_or_equal_to(100).inclusive_between(20, 90)
+        self.rule_for(lambda x: x.Id).greater_than_or_equal_to(0).less_than(lambda x: x.AnotherInt)
+        self.rule_for(lambda x: x.Gender).is_in_enum()
+        self.rule_for(lambda x: x.Address.Line1).not_empty().when(lambda x: x.Address is not None)
+        self.rule_for(lambda x: x.Email).must(lambda x: x is None or "@" in x).not_empty()
+
+
+class ConditionalValidator(AbstractValidator[Person]):
+    def __init__(self):
+        super().__init__(Person)
+        # fmt: off
+        self.when(lambda x: x.Id > 0, lambda: (
+            self.rule_for(lambda x: x.Surname).not_null(),
+            self.rule_for(lambda x: x.Forename).not_empty().length(1, 3).when(lambda x: x.Surname is not None),
+            self.when(lambda x: x.Age is not None, lambda: self.rule_for(lambda x: x.Age).greater_than(18)),
+        )).otherwise(lambda: (
+            self.rule_for(lambda x: x.Email).not_null(),
+            self.rule_for(lambda x: x.Age).less_than(50).when(lambda x: x.Age is not None),
+        ))
+        # fmt: on
+        self.rule_for(lambda x: x.Surname).length(2, 5)
+
+
+def _dump(result: ValidationResult) -> list[tuple]:
+    return [(x.PropertyName, x.ErrorMessage, x.ErrorCode, x.AttemptedValue, x.Severity) for x in result.errors]
+
+
+class ExecutionPlanTests(unittest.TestCase):
+    def __init__(self, methodName="runTest"):
+        super().__init__(methodName)
+        CultureScope.SetDefaultCulture()
+
+    @staticmethod
+    def _people() -> list[Person]:
+        return [
+            Person(),
+            Person(Surname="foo", Forename="bar", Age=30, Email="foo@bar.com"),
+            Person(Surname="foobarbaz", Forename="", Age=10, Email="foo@bar.es", Id=1, CreditCard="1234"),
+            Person(Surname="ab", Age=101, Email="invalid", NickNames=["a", "b", "c"], Orders=[Order(0), Order(10), Order(-1)]),
+            Person(Surname="abc", Forename="x", Age=50, Address=_Address(Line1="a")),
+        ]
+
+    def test_Compiled_validator_produces_the_same_results(self):
+        interpreted = PersonValidator()
+        compiled = PersonValidator().compile()
+        self.assertTrue(compiled.IsCompiled)
+        self.assertFalse(interpreted.IsCompiled)
+
+        for person in self._people():
+            self.assertEqual(_dump(interpreted.validate(person)), _dump(compiled.validate(person)))
+
+    def test_Compiled_validator_produces_the_same_results_with_rulesets(self):
+        interpreted = PersonValidator()
+        compiled = PersonValidator().compile()
+
+        for person in self._people():
+            expected = interpreted.validate(person, lambda v: v.IncludeRuleSets("names").IncludeRulesNotInRuleSet())
+            actual = compiled.validate(person, lambda v: v.IncludeRuleSets("names").IncludeRulesNotInRuleSet())
+            self.assertEqual(_dump(expected), _dump(actual))
+            self.assertEqual(sorted(expected.RuleSetsExecuted), sorted(actual.RuleSetsExecuted))
+
+    def test_Compiled_validator_honours_class_level_cascade(self):
+        interpreted = PersonValidator()
+        interpreted.ClassLevelCascadeMode = CascadeMode.Stop
+        compiled = PersonValidator()
+        compiled.ClassLevelCascadeMode = CascadeMode.Stop
+        compiled.compile()
+
+        for person in self._people():
+            self.assertEqual(_dump(interpreted.validate(person)), _dump(compiled.validate(person)))
+
+    def test_Compiled_validator_honours_rule_level_cascade(self):
+        interpreted = PersonValidator()
+        interpreted.RuleLevelCascadeMode = CascadeMode.Stop
+        compiled = PersonValidator()
+        compiled.RuleLevelCascadeMode = CascadeMode.Stop
+        compiled.compile()
+
+        person = Person(Surname="foobarbaz", Age=10)
+        self.assertEqual(_dump(interpreted.validate(person)), _dump(compiled.validate(person)))
+
+    def test_Plan_lowers_property_rules_and_delegates_the_rest(self):
+        validator = PersonValidator().compile()
+        steps = validator._plan.Steps
+
+        self.assertEqual(len(steps), len(validator.Rules))
+        self.assertIsInstance(steps[0], PropertyRuleStep)
+        self.assertIsInstance(steps[5], RuleStep)
+
+    def test_Adding_a_rule_discards_the_plan(self):
+        validator = PersonValidator().compile()
+        validator.rule_for(lambda x: x.Regex).not_null()
+
+        self.assertFalse(validator.IsCompiled)
+        result = validator.validate(Person(Surname="foo", Forename="bar", Age=30, Email="foo@bar.com", Orders=[]))
+        self.assertEqual(len(result.errors), 1)
+        self.assertEqual(result.errors[0].ErrorCode, "NotNullValidator")
+
+    def test_Chaining_onto_an_existing_rule_discards_the_plan(self):
+        validator = AbstractValidator[Person](Person)
+        rule = validator.rule_for(lambda x: x.Surname).not_null()
+        validator.compile()
+        rule.not_empty()
+
+        self.assertFalse(validator.IsCompiled)
+        self.assertEqual(len(validator.validate(Person(Surname="", Orders=[])).errors), 1)
+
+        validator.compile()
+        rule.when(lambda x: x.Forename is not None)
+        self.assertFalse(validator.IsCompiled)
+        self.assertEqual(len(validator.validate(Person(Surname="", Orders=[])).errors), 0)
+
+    def test_Changing_cascade_mode_discards_the_plan(self):
+        validator = PersonValidator().compile()
+        validator.ClassLevelCascadeMode = CascadeMode.Stop
+        self.assertFalse(validator.IsCompiled)
+
+    def test_Global_cascade_modes_are_snapshotted_until_refresh(self):
+        validator = PersonValidator().compile()
+        person = Person(Surname="foobarbaz", Age=10, Orders=[])
+
+        ValidatorOptions.Global.DefaultClassLevelCascadeMode = CascadeMode.Stop
+        try:
+            self.assertEqual(len(validator.validate(person).errors), 3)
+            self.assertEqual(len(validator.refresh().validate(person).errors), 1)
+            self.assertTrue(validator.IsCompiled)
+        finally:
+            ValidatorOptions.Global.DefaultClassLevelCascadeMode = CascadeMode.Continue
+
+    @staticmethod
+    def _built_in_people() -> list[Person]:
+        return [
+            Person(),
+            Person(Surname="abc", Forename="abcd", Age=50, Id=1, AnotherInt=2, Gender=EnumGender.Male, Email="a@b.c"),
+            Person(Surname="", Forename="abcdef", Age=10, Id=-1, AnotherInt=-5, Gender=5, Email="abc", Address=_Address(Line1="")),
+            Person(Surname="ABCDEFG", Age=95.5, Id=3, Gender=EnumGender.Female, Email="", Address=_Address(Line1="1")),
+            Person(Surname="   ", Age=101, Id=0, AnotherInt=1, Gender=None, Email=None),
+        ]
+
+    def test_Generated_validator_produces_the_same_results(self):
+        interpreted = BuiltInValidator()
+        generated = BuiltInValidator().compile(codegen=True)
+
+        for person in self._built_in_people():
+            self.assertEqual(_dump(interpreted.validate(person)), _dump(generated.validate(person)))
+
+    def test_Generated_validator_produces_the_same_results_with_cascade(self):
+        interpreted = BuiltInValidator()
+        interpreted.RuleLevelCascadeMode = CascadeMode.Stop
+        generated = BuiltInValidator()
+        generated.RuleLevelCascadeMode = CascadeMode.Stop
+        generated.compile(codegen=True)
+
+        for person in self._built_in_people():
+            self.assertEqual(_dump(interpreted.validate(person)), _dump(generated.validate(person)))
+
+    def test_Generated_validator_falls_back_for_other_rules(self):
+        interpreted = PersonValidator()
+        generated = PersonValidator().compile(codegen=True)
+
+        for person in self._people():
+            self.assertEqual(_dump(interpreted.validate(person)), _dump(generated.validate(person)))
+
+    def test_Generated_source_inlines_attribute_access_and_checks(self):
+        validator = BuiltInValidator().compile(codegen=True)
+        source = validator._plan.Steps[0].Source
+
+        self.assertIn("context.instance_to_validate.Surname", source)
+        self.assertIn("value is not None", source)
+        self.assertIn("len(value) >= 2 and len(value) <= 5", source)
+        self.assertIn("context.instance_to_validate.Address.Line1", validator._plan.Steps[5].Source)
+
+    def test_Rules_sharing_a_condition_are_grouped(self):
+        validator = ConditionalValidator().compile()
+        runs = validator._plan.Runs
+
+        self.assertEqual(len(validator._plan.Steps), len(validator.Rules))
+        self.assertEqual([type(x) for x in runs], [ConditionGroupStep, ConditionGroupStep, PropertyRuleStep])
+        self.assertEqual([len(x.Steps) for x in runs[:2]], [3, 2])
+        # 'when' on the rule builder applies the same condition to both components, it is evaluated once per rule
+        self.assertIsNotNone(validator._plan.Steps[1]._component_condition)
+        self.assertTrue(all(x.condition is None for x in validator._plan.Steps[1]._components))
+
+    def test_Grouped_conditions_produce_the_same_results(self):
+        people = [
+            Person(Id=1, Forename="abcd", Age=10),
+            Person(Id=1, Surname="abc", Forename="abcd", Age=20),
+            Person(Id=1, Surname="abcdef", Forename=""),
+            Person(Id=0, Age=60),
+            Person(Id=0, Surname="a", Email="a@b.c", Age=20),
+        ]
+        options = [None, lambda v: v.IncludeProperties("Forename", "Age")]
+
+        for cascade in (CascadeMode.Continue, CascadeMode.Stop):
+            interpreted = ConditionalValidator()
+            compiled = ConditionalValidator()
+            generated = ConditionalValidator()
+            for validator in (interpreted, compiled, generated):
+                validator.ClassLevelCascadeMode = cascade
+            compiled.compile()
+            generated.compile(codegen=True)
+
+            for option in options:
+                for person in people:
+                    expected = _dump(interpreted.validate(person, option))
+                    self.assertEqual(expected, _dump(compiled.validate(person, option)))
+                    self.assertEqual(expected, _dump(generated.validate(person, option)))
+
+
+if __name__ == "__main__":
+    unittest.main()
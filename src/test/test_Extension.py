@@ -27,6 +27,7 @@ sys.path.append([str(x) for x in Path(__file__).parents if x.name == "src"].pop(
 from person import Person
 from fluent_validation.internal.ExtensionInternal import ExtensionsInternal
 from fluent_validation.MemberInfo import MemberInfo
+from fluent_validation.lambda_disassembler.tree_instruction import TreeInstruction
 
 
 class ExtensionTester(unittest.TestCase):
@@ -67,6 +68,31 @@ class ExtensionTester(unittest.TestCase):
     def test_SplitPascalCase_should_return_null_when_input_is_null(self):
         self.assertIsNone(ExtensionsInternal.split_pascal_case(None))
 
+    def test_Type_hints_are_resolved_once_per_model_and_attribute_chain(self):
+        MemberInfo.clear_cache()
+
+        expected = MemberInfo(lambda x: x.Address.Line1).get_type_hint(Person)
+        self.assertIs(MemberInfo(lambda p: p.Address.Line1).get_type_hint(Person), expected)
+        self.assertEqual(MemberInfo.resolve_type_hint.cache_info().misses, 2)  # The lambda parameter is part of the key
+        self.assertIs(MemberInfo(lambda x: x.Address.Line1).get_type_hint(Person), expected)
+        self.assertEqual(MemberInfo.resolve_type_hint.cache_info().hits, 1)
+
+        MemberInfo.clear_cache()
+        self.assertEqual(MemberInfo.resolve_type_hint.cache_info().currsize, 0)
+        self.assertEqual(MemberInfo.get_types.cache_info().currsize, 0)
+
+    def test_Lambdas_sharing_code_are_disassembled_once(self):
+        MemberInfo.clear_cache()
+
+        def rule() -> Callable[[Person], str]:
+            return lambda x: x.Address.Line1
+
+        first, second = MemberInfo(rule()), MemberInfo(rule())
+        self.assertEqual((first.Name, first.NestedNames), ("Line1", ["Address", "Line1"]))
+        self.assertEqual((second.Name, second.NestedNames), ("Line1", ["Address", "Line1"]))
+        self.assertEqual(TreeInstruction.disassemble.cache_info().misses, 1)
+        self.assertEqual(TreeInstruction.disassemble.cache_info().hits, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -20,6 +20,7 @@ from dataclasses import dataclass
 import sys
 from typing import Any, override
 import unittest
+from unittest.mock import patch
 from pathlib import Path
 
 
@@ -574,6 +575,21 @@ class ForEachRuleTests(unittest.TestCase):
         result = validator.validate(Person())
         self.assertTrue(result.is_valid)
 
+    def test_Context_is_prepared_once_per_collection_and_restored(self):
+        validator = InlineValidator[Person](Person)
+        validator.rule_for_each(lambda x: x.Orders).must(lambda x: x.Amount > 0).must(lambda x: x.Amount > 1)
+        validator.rule_for(lambda x: x.Surname).not_null()
+
+        context = ValidationContext[Person](Person(Orders=[Order(Amount=0), Order(Amount=1), Order(Amount=2)]))
+        prepare_original = ValidationContext.PrepareForChildCollectionValidator
+        with patch.object(ValidationContext, "PrepareForChildCollectionValidator", autospec=True, side_effect=prepare_original) as prepare:
+            result = validator.validate(context)
+
+        prepare.assert_called_once()
+        self.assertEqual([x.PropertyName for x in result.errors], ["Orders[0]", "Orders[0]", "Orders[1]", "Surname"])
+        self.assertFalse(context.IsChildCollectionContext)
+        self.assertEqual(len(context.PropertyChain), 0)
+
     # 	def public async Task Failing_condition_should_prevent_multiple_components_running_and_not_throw_async(self):
     # 		# https://github.com/p-hzamora/FluentValidation/issues/1698
     # 		validator = InlineValidator[Person](Person)
@@ -0,0 +1,64 @@
+# region License
+# Copyright (c) .NET Foundation and contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# The latest version of this file can be found at https://github.com/p-hzamora/FluentValidation
+# endregion
+
+import os
+import subprocess
+import unittest
+import sys
+from pathlib import Path
+
+SRC = [str(x) for x in Path(__file__).parents if x.name == "src"].pop()
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "PYTHONPATH": SRC}
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True)
+
+
+class ImportTimeTests(unittest.TestCase):
+    """Heavy modules are kept out of 'import fluent_validation'. benchmarks/bench_import_time.py measures the time it takes."""
+
+    def test_Languages_are_imported_on_first_use(self):
+        code = (
+            "import sys, fluent_validation\n"
+            "from fluent_validation.internal.Resources.ILanguageManager import CultureInfo\n"
+            "loaded = lambda: sorted(m.rsplit('.', 1)[1] for m in sys.modules if '.Lenguages.' in m)\n"
+            "print(loaded())\n"
+            "fluent_validation.ValidatorOptions.Global.LanguageManager.GetString('NotNullValidator', CultureInfo('es-ES'))\n"
+            "print(loaded())"
+        )
+        before, after = _run(code).stdout.splitlines()
+
+        self.assertEqual(before, "['EnglishLanguage']")
+        self.assertEqual(after, "['EnglishLanguage', 'SpanishLanguage']")
+
+    def test_Optional_modules_are_imported_on_first_use(self):
+        code = (
+            "import sys, fluent_validation\n"
+            "optional = ('numpy', 'multiprocessing', 'concurrent.futures', 'fluent_validation.ParallelValidator')\n"
+            "print(sorted(m for m in optional if m in sys.modules))\n"
+            "print(fluent_validation.ParallelValidator.__name__, 'fluent_validation.ParallelValidator' in sys.modules)"
+        )
+        before, after = _run(code).stdout.splitlines()
+
+        self.assertEqual(before, "[]")
+        self.assertEqual(after, "ParallelValidator True")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -54,6 +54,7 @@ class TypeUnsafePolymorphicValidator[T, TProperty](PolymorphicValidator[T, TProp
     """Custom polymorphic validator for testing"""
 
     def __init__(self):
+        super().__init__(IFoo)
         self.impl1Validator = InlineValidator(FooImpl1)
         self.impl1Validator.rule_for(lambda x: x.Name).not_null()
 
@@ -0,0 +1,85 @@
+# region License
+# Copyright (c) .NET Foundation and contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# The latest version of this file can be found at https://github.com/p-hzamora/FluentValidation
+# endregion
+
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.append([str(x) for x in Path(__file__).parents if x.name == "src"].pop())
+
+from fluent_validation import AbstractValidator  # noqa: E402
+from fluent_validation.internal.RuleBase import RuleBase  # noqa: E402
+from fluent_validation.ValidatorOptions import ValidatorOptions  # noqa: E402
+from TestValidator import TestValidator  # noqa: E402
+from CultureScope import CultureScope  # noqa: E402
+from person import _Address, Order, Person  # noqa: E402
+
+
+class AddressValidator(AbstractValidator[_Address]):
+    def __init__(self):
+        super().__init__(_Address)
+        self.rule_for(lambda x: x.Line1).not_empty()
+
+
+class IsValidTests(unittest.TestCase):
+    def __init__(self, methodName="runTest"):
+        super().__init__(methodName)
+        CultureScope.SetDefaultCulture()
+
+    def setUp(self):
+        ValidatorOptions.Global.PropertyNameResolver = None
+        self.validator = TestValidator()
+        self.validator.rule_for(lambda x: x.Surname).not_null().length(2, 5)
+        self.validator.rule_for(lambda x: x.Address).set_validator(AddressValidator()).when(lambda x: x.Address is not None)
+        self.validator.rule_for_each(lambda x: x.Orders).must(lambda x: x.Amount > 0)
+
+        self.people = [
+            Person(Surname="foo", Orders=[]),
+            Person(Orders=[]),
+            Person(Surname="foo", Address=_Address(Line1=""), Orders=[]),
+            Person(Surname="foo", Address=_Address(Line1="a"), Orders=[Order(Amount=1), Order(Amount=0)]),
+            Person(Surname="foo", Address=_Address(Line1="a"), Orders=[Order(Amount=1)]),
+        ]
+
+    def test_Returns_the_same_outcome_as_validate(self):
+        for compiled in (False, True):
+            if compiled:
+                self.validator.compile()
+            self.assertEqual([self.validator.is_valid(x) for x in self.people], [self.validator.validate(x).is_valid for x in self.people])
+
+    def test_Stops_at_the_first_failure_without_building_it(self):
+        calls: list[int] = []
+        self.validator.rule_for(lambda x: x.Forename).must(lambda x: calls.append(1) or True)
+
+        with patch.object(RuleBase, "CreateValidationError", autospec=True) as create:
+            self.assertFalse(self.validator.is_valid(Person(Surname="a", Orders=[])))
+
+        create.assert_not_called()
+        self.assertEqual(calls, [])
+
+    def test_Failures_added_by_custom_rules_and_options_are_honoured(self):
+        self.validator.rule_for(lambda x: x.Forename).custom(lambda value, context: context.AddFailure(propertyName="Forename", errorMessage="bad") if value == "bad" else None)
+        person = Person(Surname="foo", Forename="bad", Orders=[])
+
+        self.assertFalse(self.validator.is_valid(person))
+        self.assertTrue(self.validator.is_valid(person, lambda v: v.IncludeProperties("Surname")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -500,6 +500,55 @@ class LanguageManagerTests(unittest.TestCase):
         default_result = custom_manager.GetString("NotNullValidator")
         self.assertEqual(default_result, "foo")
 
+    def test_Resolved_strings_are_refreshed_when_translations_change(self):
+        culture = CultureInfo("fr-FR")
+        original = self._languages.GetString("NotNullValidator", culture)
+        self.assertEqual(self._languages.GetString("NotNullValidator", culture), original)
+
+        self._languages.AddTranslation("fr", "NotNullValidator", "foo")
+        self.assertEqual(self._languages.GetString("NotNullValidator", culture), "foo")
+        self.assertEqual(self._languages.ResolveErrorMessageUsingErrorCode(None, "NotNullValidator"), self._languages.GetString("NotNullValidator"))
+
+        self._languages.Clear()
+        self.assertEqual(self._languages.GetString("NotNullValidator", culture), original)
+
+        self._languages.Enabled = False
+        self.assertEqual(self._languages.GetString("NotNullValidator", culture), "'{PropertyName}' must not be empty.")
+
+    def test_Strings_of_subclasses_that_look_them_up_are_not_memoized(self):
+        class CountingLanguageManager(LanguageManager):
+            calls: int = 0
+
+            def GetString(self, key, culture=None):
+                CountingLanguageManager.calls += 1
+                return f"{key} {CountingLanguageManager.calls}"
+
+        class CountingTranslations(LanguageManager):
+            calls: int = 0
+
+            @staticmethod
+            def GetTranslation(culture, key):
+                CountingTranslations.calls += 1
+                return f"{key} {CountingTranslations.calls}"
+
+        manager = CountingLanguageManager()
+        self.assertEqual(manager.ResolveErrorMessageUsingErrorCode(None, "NotNullValidator"), "NotNullValidator 1")
+        self.assertEqual(manager.ResolveErrorMessageUsingErrorCode(None, "NotNullValidator"), "NotNullValidator 2")
+
+        translations = CountingTranslations()
+        culture = CultureInfo("fr-FR")
+        self.assertEqual(translations.GetString("NotNullValidator", culture), "NotNullValidator 1")
+        self.assertEqual(translations.GetString("NotNullValidator", culture), "NotNullValidator 2")
+
+    def test_Registered_cultures_match_their_languages(self):
+        from fluent_validation.internal.Resources import Lenguages
+
+        for culture, name in Lenguages._cultures.items():
+            language = Lenguages.load_language(culture)
+            self.assertEqual(language.__name__, name)
+            self.assertIn(culture, (language.Culture, getattr(language, "AmericanCulture", None), getattr(language, "BritishCulture", None)))
+            self.assertIs(getattr(Lenguages, name), language)
+
 
 class CustomLanguageManager(LanguageManager):
     def __init__(self):
@@ -0,0 +1,107 @@
+# region License
+# Copyright (c) .NET Foundation and contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# The latest version of this file can be found at https://github.com/p-hzamora/FluentValidation
+# endregion
+
+import unittest
+import sys
+from pathlib import Path
+
+sys.path.append([str(x) for x in Path(__file__).parents if x.name == "src"].pop())
+
+from fluent_validation import AbstractValidator, InlineValidator, ParallelValidator, ValidationException  # noqa: E402
+from fluent_validation.ValidatorOptions import ValidatorOptions  # noqa: E402
+from CultureScope import CultureScope  # noqa: E402
+from person import Person  # noqa: E402
+
+
+class PersonValidator(AbstractValidator[Person]):
+    def __init__(self, max_length: int = 5):
+        super().__init__(Person)
+        self.rule_for(lambda x: x.Surname).not_null()
+        self.rule_for(lambda x: x.Forename).length(2, max_length)
+        self.rule_set("names", lambda: self.rule_for(lambda x: x.NameField).not_null())
+
+
+def _dump(batch) -> list[list[tuple]]:
+    return [[(x.PropertyName, x.ErrorMessage) for x in result.errors] for result in batch]
+
+
+class ParallelValidatorTests(unittest.TestCase):
+    def __init__(self, methodName="runTest"):
+        super().__init__(methodName)
+        CultureScope.SetDefaultCulture()
+
+    def setUp(self):
+        ValidatorOptions.Global.PropertyNameResolver = None
+        self.people = [Person(Surname=None if i % 3 == 0 else "foo", Forename="x" * (i % 8), Orders=[]) for i in range(50)]
+
+    def test_Returns_the_same_results_as_validate_many_in_input_order(self):
+        expected = PersonValidator().validate_many(self.people)
+
+        with ParallelValidator(PersonValidator, workers=2, chunk_size=7) as validator:
+            actual = validator.validate_many(self.people)
+
+        self.assertEqual(len(actual), len(self.people))
+        self.assertEqual(list(actual.invalid_results), list(expected.invalid_results))
+        self.assertEqual(_dump(actual), _dump(expected))
+
+    def test_Workers_argument_of_validate_many(self):
+        validator = PersonValidator().compile()
+
+        self.assertEqual(_dump(validator.validate_many(self.people, workers=2, args=())), _dump(validator.validate_many(self.people)))
+
+    def test_Applies_options_and_constructor_arguments(self):
+        with ParallelValidator(PersonValidator, workers=2, kwargs={"max_length": 10}) as validator:
+            batch = validator.validate_many(self.people, lambda v: v.IncludeRuleSets("names"))
+
+        self.assertEqual(batch.RuleSetsExecuted, ["names"])
+        self.assertEqual(batch.invalid_count, len(self.people))
+
+    def test_Throws_with_the_errors_of_the_first_invalid_instance(self):
+        with ParallelValidator("test_ParallelValidator:PersonValidator", workers=2) as validator:
+            with self.assertRaises(ValidationException) as ex:
+                validator.validate_many(self.people[1:], lambda v: v.ThrowOnFailures())
+
+        self.assertEqual([x.PropertyName for x in ex.exception.Errors], ["Forename"])
+
+    def test_Validators_that_cannot_be_imported_are_rejected(self):
+        class LocalValidator(AbstractValidator[Person]): ...
+
+        with self.assertRaises(ValueError):
+            ParallelValidator(LocalValidator)
+        with self.assertRaises(ValueError):
+            ParallelValidator(InlineValidator[Person](Person))
+        with self.assertRaises(ValueError):
+            PersonValidator().validate_many(self.people, workers=2, lazy=True)
+
+    def test_Instances_require_explicit_constructor_arguments(self):
+        with self.assertRaises(ValueError):
+            ParallelValidator(PersonValidator(max_length=10))
+        with self.assertRaises(ValueError):
+            PersonValidator(max_length=10).validate_many(self.people, workers=2)
+        self.assertEqual(
+            _dump(PersonValidator(max_length=10).validate_many(self.people, workers=2, kwargs={"max_length": 10})),
+            _dump(PersonValidator(max_length=10).validate_many(self.people)),
+        )
+
+        expected = PersonValidator(max_length=10).validate_many(self.people)
+        with ParallelValidator(PersonValidator(max_length=10).compile(), workers=2, kwargs={"max_length": 10}) as validator:
+            self.assertEqual(_dump(validator.validate_many(self.people)), _dump(expected))
+
+
+if __name__ == "__main__":
+    unittest.main()
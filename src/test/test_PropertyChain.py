@@ -24,6 +24,7 @@ sys.path.append([str(x) for x in Path(__file__).parents if x.name == "src"].pop(
 
 from fluent_validation.internal.PropertyChain import PropertyChain
 from fluent_validation.MemberInfo import MemberInfo
+from fluent_validation.ValidatorOptions import ValidatorOptions
 
 
 class Parent:
@@ -92,6 +93,57 @@ class PropertyChainTests(unittest.TestCase):
 
         self.assertEqual(self.chain.ToString(), "Foo")
 
+    def test_Copies_share_members_but_not_changes(self):
+        self.chain.Add("Orders")
+        copy = PropertyChain(self.chain)
+        copy.AddIndexer(0)
+        copy.Add("Amount")
+
+        self.assertEqual(self.chain.ToString(), "Orders")
+        self.assertEqual(copy.ToString(), "Orders[0].Amount")
+        self.assertEqual(len(copy), 2)
+        self.assertEqual(self.chain.BuildPropertyPath("Amount"), "Orders.Amount")
+
+    def test_Replacing_the_indexer_reuses_the_chain(self):
+        self.chain.Add("Orders")
+        element = PropertyChain(self.chain)
+
+        element.ReplaceIndexer(self.chain, 0)
+        first = element._node
+        element.ReplaceIndexer(self.chain, "key", surroundWithBrackets=False)
+        self.assertEqual(element.ToString(), "Orderskey")
+        element.ReplaceIndexer(self.chain, 0)
+
+        self.assertEqual(element.ToString(), "Orders[0]")
+        self.assertIs(element._node, first)
+        self.assertEqual(self.chain.ToString(), "Orders")
+
+    def test_Paths_follow_the_separator_in_use(self):
+        self.chain.Add("Address")
+        self.assertEqual(self.chain.BuildPropertyPath("Line1"), "Address.Line1")
+
+        ValidatorOptions.Global.PropertyChainSeparator = "/"
+        try:
+            self.assertEqual(self.chain.BuildPropertyPath("Line1"), "Address/Line1")
+            self.assertEqual(PropertyChain(None, ["Address", "Line1"]).ToString(), "Address/Line1")
+        finally:
+            ValidatorOptions.Global.PropertyChainSeparator = "."
+
+    def test_Other_separators_do_not_change_the_shared_nodes(self):
+        chain = PropertyChain(None, ["Address", "Line1"])
+        node = chain._node
+
+        ValidatorOptions.Global.PropertyChainSeparator = "/"
+        try:
+            self.assertEqual(chain.ToString(), "Address/Line1")
+            self.assertEqual(chain.BuildPropertyPath("Country"), "Address/Line1/Country")
+        finally:
+            ValidatorOptions.Global.PropertyChainSeparator = "."
+
+        self.assertEqual(node._path, "Address.Line1")
+        self.assertEqual(chain.BuildPropertyPath("Country"), "Address.Line1.Country")
+        self.assertIs(PropertyChain(None, ["Address", "Line1"])._node, node)
+
 
 if __name__ == "__main__":
     unittest.main()
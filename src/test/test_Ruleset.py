@@ -268,6 +268,40 @@ class RulesetTests(unittest.TestCase):
 
         self.assertEqual(len(result.errors), 3)
 
+    def test_Only_rules_that_can_match_the_rule_sets_are_visited(self):
+        validator = InlineValidator[Person](Person)
+        validator.rule_for(lambda x: x.Forename).not_null()
+        for name in ("Create", "Update", "Delete"):
+            validator.rule_set(name, lambda: validator.rule_for(lambda x: x.Surname).not_null())
+        validator.rule_set("Create, default", lambda: validator.rule_for(lambda x: x.Email).not_null())
+
+        self.assertEqual(validator.Rules[4].RuleSets, frozenset(["Create", "default"]))
+
+        calls: list[str] = []
+        can_execute = RulesetValidatorSelector.CanExecute
+
+        def tracking_can_execute(selector, rule, propertyPath, context):
+            calls.append(propertyPath)
+            return can_execute(selector, rule, propertyPath, context)
+
+        RulesetValidatorSelector.CanExecute = tracking_can_execute
+        try:
+            result = validator.validate(Person(), lambda v: v.IncludeRuleSets("Update"))
+            self.assertEqual(calls, ["Surname"])
+            self.AssertExecuted(result, "Update")
+
+            calls.clear()
+            result = validator.validate(Person(), lambda v: v.IncludeRuleSets("default"))
+            self.assertEqual(calls, ["Forename", "Email"])
+            self.AssertExecuted(result, "default")
+
+            calls.clear()
+            result = validator.validate(Person(), lambda v: v.IncludeRuleSets("Missing"))
+            self.assertEqual(calls, [])
+            self.AssertExecuted(result)
+        finally:
+            RulesetValidatorSelector.CanExecute = can_execute
+
 
 #     def test_Task(selfI:ludes_all_rulesets_async() {
 #         validator = InlineValidator[Person](Person)
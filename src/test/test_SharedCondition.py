@@ -772,6 +772,23 @@ class SharedConditionTests(unittest.TestCase):
         containerValidator.rule_for_each(lambda x: x).set_validator(v)
         containerValidator.validate([Collision1(), Collision2()])
 
+    def test_Condition_is_evaluated_once_per_instance_even_if_unhashable_or_false(self):
+        executions: list[Optional[str]] = []
+
+        def predicate(x: Unhashable) -> bool:
+            executions.append(x.Name)
+            return x.Name is None
+
+        v = InlineValidator(Unhashable)
+        v.when(predicate, lambda: (v.rule_for(lambda x: x.Name).not_null(), v.rule_for(lambda x: x.Name).equal("a"), v.rule_for(lambda x: x.Name).length(1, 2)))
+
+        containerValidator = InlineValidator(list[Unhashable])
+        containerValidator.rule_for_each(lambda x: x).set_validator(v)
+        result = containerValidator.validate([Unhashable("b"), Unhashable("b"), Unhashable(None)])
+
+        self.assertEqual(executions, ["b", "b", None])
+        self.assertEqual(len(result.errors), 2)
+
 
 # 	def async Task Shouldnt_break_with_hashcode_collision_async() {
 # 		v1 = InlineValidator[Collision1](Collision1)
@@ -816,5 +833,15 @@ class Collision2(CollisionBase):
         return 1
 
 
+class Unhashable:
+    def __init__(self, Name: Optional[str] = None):
+        self.Name = Name
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Unhashable) and other.Name == self.Name
+
+    __hash__ = None
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,152 @@
+# region License
+# Copyright (c) .NET Foundation and contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# The latest version of this file can be found at https://github.com/p-hzamora/FluentValidation
+# endregion
+
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+import unittest
+import sys
+from pathlib import Path
+from typing import Optional
+
+sys.path.append([str(x) for x in Path(__file__).parents if x.name == "src"].pop())
+
+from fluent_validation import AbstractValidator, InlineValidator  # noqa: E402
+from fluent_validation.internal.MessageFormatter import MessageFormatter  # noqa: E402
+from fluent_validation.validators.PolymorphicValidator import PolymorphicValidator  # noqa: E402
+from fluent_validation.ValidatorOptions import ValidatorOptions  # noqa: E402
+from CultureScope import CultureScope  # noqa: E402
+from person import _Address, Order, Person  # noqa: E402
+
+
+class Cat:
+    def __init__(self, Name: Optional[str] = None) -> None:
+        self.Name = Name
+
+
+class Dog:
+    def __init__(self, Age: int = 0) -> None:
+        self.Age = Age
+
+
+class Owner:
+    def __init__(self, Pet: Cat | Dog) -> None:
+        self.Pet = Pet
+
+
+class PersonValidator(AbstractValidator[Person]):
+    def __init__(self):
+        super().__init__(Person)
+        self.rule_for(lambda x: x.Surname).not_null().length(2, 6)
+        self.rule_for(lambda x: x.Forename).matches(lambda x: r"^[A-Z]" if x.Id % 2 else r"^[a-z]")
+        self.rule_for(lambda x: x.Email).email_address()
+        self.rule_for(lambda x: x.Age).inclusive_between(18, 65).when(lambda x: x.Id % 3 == 0)
+        self.rule_for_each(lambda x: x.Orders).child_rules(lambda orders: orders.rule_for(lambda x: x.Amount).greater_than(0))
+
+        address = InlineValidator[_Address](_Address)
+        address.rule_for(lambda x: x.Line1).not_empty()
+        self.rule_for(lambda x: x.Address).set_validator(address)
+
+
+class OwnerValidator(AbstractValidator[Owner]):
+    def __init__(self):
+        super().__init__(Owner)
+        cat = InlineValidator[Cat](Cat)
+        cat.rule_for(lambda x: x.Name).not_null().max_length(3)
+        dog = InlineValidator[Dog](Dog)
+        dog.rule_for(lambda x: x.Age).less_than(15)
+        self.rule_for(lambda x: x.Pet).set_inheritance_validator(lambda v: v.add(cat).add(dog))
+
+
+def _person(i: int) -> Person:
+    return Person(
+        Id=i,
+        Surname=None if i % 5 == 0 else "x" * (i % 9),
+        Forename="Abc" if i % 4 else "abc",
+        Email="foo@bar.com" if i % 7 else "foo",
+        Age=i % 80,
+        Orders=[Order(Amount=Decimal(i % 3 - 1)) for _ in range(i % 4)],
+        Address=_Address(Line1="" if i % 6 == 0 else "Street"),
+    )
+
+
+def _dump(results) -> list[list[tuple]]:
+    return [[(x.PropertyName, x.ErrorMessage, x.AttemptedValue) for x in result.errors] for result in results]
+
+
+class ThreadSafetyTests(unittest.TestCase):
+    def __init__(self, methodName="runTest"):
+        super().__init__(methodName)
+        CultureScope.SetDefaultCulture()
+
+    def setUp(self):
+        ValidatorOptions.Global.PropertyNameResolver = None
+        self.people = [_person(i) for i in range(600)]
+        self.owners = [Owner(Cat(None if i % 3 == 0 else "x" * (i % 6)) if i % 2 else Dog(i % 30)) for i in range(600)]
+
+        # Switch threads as often as possible, so races show up on builds with a GIL too
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        sys.setswitchinterval(self._switch_interval)
+
+    def test_Threads_produce_the_same_results_as_sequential_validation(self):
+        for validator, instances in ((PersonValidator(), self.people), (OwnerValidator(), self.owners), (PersonValidator().compile(codegen=True), self.people)):
+            expected = validator.validate_many(instances)
+            actual = validator.validate_many(instances, threads=8)
+
+            self.assertEqual(list(actual.invalid_results), list(expected.invalid_results))
+            self.assertEqual(_dump(actual), _dump(expected))
+
+    def test_Validators_shared_by_many_threads(self):
+        person_validator, owner_validator = PersonValidator(), OwnerValidator()
+        expected = (_dump(map(person_validator.validate, self.people)), _dump(map(owner_validator.validate, self.owners)))
+
+        def run(_) -> tuple[list, list]:
+            CultureScope.SetDefaultCulture()
+            return _dump(map(person_validator.validate, self.people)), _dump(map(owner_validator.validate, self.owners))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for actual in executor.map(run, range(16)):
+                self.assertEqual(actual, expected)
+
+    def test_Threads_use_the_culture_of_the_caller(self):
+        validator = PersonValidator()
+        with CultureScope("fr"):
+            expected = validator.validate_many(self.people)
+            actual = validator.validate_many(self.people, threads=4)
+
+        self.assertEqual(_dump(actual), _dump(expected))
+        self.assertEqual(expected[0].errors[0].ErrorMessage, "'Surname' ne doit pas avoir la valeur null.")
+
+    def test_Threads_cannot_be_combined_with_lazy(self):
+        with self.assertRaises(ValueError):
+            PersonValidator().validate_many(self.people, None, lazy=True, threads=2)
+
+    def test_State_is_not_shared_between_instances(self):
+        formatter = MessageFormatter().AppendArgument("MaxLength", 3)
+        self.assertEqual(MessageFormatter().PlaceholderValues, {})
+        self.assertEqual(formatter.PlaceholderValues, {"MaxLength": 3})
+
+        polymorphic = PolymorphicValidator[Owner, Cat](Cat).add(InlineValidator[Cat](Cat))
+        self.assertEqual(len(polymorphic._derivedValidators), 1)
+        self.assertEqual(len(PolymorphicValidator[Owner, Cat](Cat)._derivedValidators), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
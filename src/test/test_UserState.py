@@ -75,6 +75,17 @@ class UserStateTester(unittest.TestCase):
         self.assertIsNone(custom_state[1])  # surname should be None
         self.assertEqual(custom_state[2], "foo")
 
+    def test_Root_context_data_is_created_on_demand_and_shared_with_child_contexts(self):
+        context = ValidationContext(Person())
+
+        self.assertFalse(hasattr(context, "__dict__"))
+        self.assertIsNone(context._RootContextData)
+        self.assertIsNone(context._PropertyChain)
+        self.assertIsNone(context._messageFormatter)
+        child = context.CloneForChildValidator(Person())
+        child.RootContextData["test"] = "foo"
+        self.assertEqual(context.RootContextData, {"test": "foo"})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,105 @@
+# region License
+# Copyright (c) .NET Foundation and contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# The latest version of this file can be found at https://github.com/p-hzamora/FluentValidation
+# endregion
+
+import types
+import unittest
+import sys
+from pathlib import Path
+
+sys.path.append([str(x) for x in Path(__file__).parents if x.name == "src"].pop())
+
+from fluent_validation import BatchValidationResult, ValidationException  # noqa: E402
+from fluent_validation.ValidatorOptions import ValidatorOptions  # noqa: E402
+from TestValidator import TestValidator  # noqa: E402
+from CultureScope import CultureScope  # noqa: E402
+from person import Person  # noqa: E402
+
+
+class ValidateManyTests(unittest.TestCase):
+    def __init__(self, methodName="runTest"):
+        super().__init__(methodName)
+        CultureScope.SetDefaultCulture()
+
+    def setUp(self):
+        ValidatorOptions.Global.PropertyNameResolver = None
+        self.validator = TestValidator()
+        self.validator.rule_for(lambda x: x.Surname).not_null()
+        self.validator.rule_for(lambda x: x.Forename).length(2, 5)
+        self.validator.rule_set("names", lambda: self.validator.rule_for(lambda x: x.NameField).not_null())
+
+        self.people = [
+            Person(Surname="foo", Forename="bar"),
+            Person(Forename="b"),
+            Person(Surname="foo"),
+            Person(Surname=None, Forename="barbazqux"),
+        ]
+
+    @staticmethod
+    def _dump(result) -> list[tuple]:
+        return [(x.PropertyName, x.ErrorMessage) for x in result.errors]
+
+    def test_Returns_the_same_results_as_validate(self):
+        batch = self.validator.validate_many(self.people)
+
+        self.assertIsInstance(batch, BatchValidationResult)
+        self.assertEqual(len(batch), len(self.people))
+        for person, result in zip(self.people, batch):
+            self.assertEqual(self._dump(self.validator.validate(person)), self._dump(result))
+
+    def test_Keeps_only_invalid_results(self):
+        batch = self.validator.validate_many(self.people)
+
+        self.assertFalse(batch.is_valid)
+        self.assertEqual(batch.invalid_count, 2)
+        self.assertEqual(batch.valid_count, 2)
+        self.assertEqual(list(batch.invalid_results), [1, 3])
+        self.assertTrue(batch[0].is_valid)
+        self.assertEqual(len(batch.errors), 4)
+        self.assertEqual(batch.to_dictionary()[1], {"Surname": ["'Surname' must not be empty."], "Forename": ["'Forename' must be between 2 and 5 characters. You entered 1 characters."]})
+
+    def test_Lazy_returns_a_generator_in_input_order(self):
+        results = self.validator.validate_many(self.people, lazy=True)
+
+        self.assertIsInstance(results, types.GeneratorType)
+        self.assertEqual([x.is_valid for x in results], [True, False, True, False])
+
+    def test_Applies_options_to_every_instance(self):
+        batch = self.validator.validate_many(self.people, lambda v: v.IncludeRuleSets("names"))
+
+        self.assertEqual(batch.invalid_count, 4)
+        self.assertTrue(all(result.errors[0].PropertyName == "NameField" for result in batch))
+        self.assertEqual(batch.RuleSetsExecuted, ["names"])
+
+    def test_Throws_on_first_invalid_instance(self):
+        results = self.validator.validate_many(self.people, lambda v: v.ThrowOnFailures(), lazy=True)
+
+        self.assertTrue(next(results).is_valid)
+        with self.assertRaises(ValidationException):
+            next(results)
+
+    def test_Empty_batch_is_valid(self):
+        batch = self.validator.validate_many([])
+
+        self.assertTrue(batch.is_valid)
+        self.assertEqual(len(batch), 0)
+        with self.assertRaises(IndexError):
+            batch[0]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -30,6 +30,13 @@ from CultureScope import CultureScope
 from TestValidator import TestValidator
 from person import Country, Order, Payment, Person, _Address as Address
 from fluent_validation.InlineValidator import InlineValidator
+from fluent_validation.internal.CompositeValidatorSelector import CompositeValidatorSelector
+from fluent_validation.internal.DefaultValidatorSelector import DefaultValidatorSelector
+from fluent_validation.internal.IValidatorSelector import IValidatorSelector
+from fluent_validation.internal.MemberNameValidatorSelector import MemberNameValidatorSelector
+from fluent_validation.internal.ValidationStrategy import ValidationStrategy
+from fluent_validation.IValidationContext import ValidationContext
+from fluent_validation.ValidatorOptions import ValidatorOptions
 
 
 @dataclass
@@ -258,6 +265,105 @@ class ValidatorSelectorTests(unittest.TestCase):
         self.assertEqual(result.errors[1].PropertyName, "Orders[1].Payments[1].Amount")
         self.assertEqual(result.errors[1].ErrorMessage, "'Amount' must be greater than '0'.")
 
+    def test_Default_selector_is_shared(self):
+        selectors = ValidatorOptions.Global.ValidatorSelectors
+
+        self.assertIs(ValidatorOptions.Global.ValidatorSelectors, selectors)
+        self.assertIs(selectors.DefaultValidatorSelectorFactory(), DefaultValidatorSelector.Instance)
+        self.assertIs(ValidationContext(TestObject()).Selector, DefaultValidatorSelector.Instance)
+
+    def test_Configured_default_selector_factory_is_used(self):
+        class CountingSelector(DefaultValidatorSelector):
+            calls: int = 0
+
+            def CanExecute(self, rule, propertyPath, context) -> bool:
+                CountingSelector.calls += 1
+                return super().CanExecute(rule, propertyPath, context)
+
+        validator = InlineValidator[TestObject](TestObject, lambda v: v.rule_for(lambda x: x.SomeProperty).not_null())
+        ValidatorOptions.Global.ValidatorSelectors.DefaultValidatorSelectorFactory = lambda: CountingSelector()
+        try:
+            result = validator.validate(TestObject())
+        finally:
+            ValidatorOptions.Global.ValidatorSelectors.DefaultValidatorSelectorFactory = None
+
+        self.assertEqual(len(result.errors), 1)
+        self.assertEqual(CountingSelector.calls, 1)
+        self.assertIs(ValidatorOptions.Global.ValidatorSelectors.DefaultValidatorSelectorFactory(), DefaultValidatorSelector.Instance)
+
+    def test_Member_names_match_property_paths_by_segments(self):
+        selector = MemberNameValidatorSelector(["Surname", "Address.Line1", "Orders[0].Amount", "Orders[].ProductName"])
+        context = ValidationContext(TestObject())
+
+        def can_execute(propertyPath: str) -> bool:
+            return selector.CanExecute(None, propertyPath, context)
+
+        self.assertTrue(can_execute("Surname"))
+        self.assertTrue(can_execute("Address"))
+        self.assertTrue(can_execute("Address.Line1.Length"))
+        self.assertTrue(can_execute("Orders"))
+        self.assertTrue(can_execute("Orders[0]"))
+        self.assertTrue(can_execute("Orders[0].Amount"))
+        self.assertTrue(can_execute("Orders[3].ProductName"))
+        self.assertFalse(can_execute("Surnames"))
+        self.assertFalse(can_execute("Address.Line2"))
+        self.assertFalse(can_execute("Orders[1].Amount"))
+        self.assertFalse(can_execute("Surname[0]"))
+
+    def test_Composite_selector_stops_at_the_first_selector_that_executes_the_rule(self):
+        calls: list[str] = []
+
+        class NamedSelector(DefaultValidatorSelector):
+            def __init__(self, name: str, cost: int, result: bool):
+                self.name, self.cost, self.result = name, cost, result
+
+            @property
+            def IsStatic(self) -> bool:
+                return False
+
+            @property
+            def Cost(self) -> int:
+                return self.cost
+
+            def CanExecute(self, rule, propertyPath, context) -> bool:
+                calls.append(self.name)
+                return self.result
+
+        selector = CompositeValidatorSelector([NamedSelector("expensive", 50, True), NamedSelector("cheap", 1, True)])
+
+        self.assertTrue(selector.CanExecute(None, "Surname", ValidationContext(TestObject())))
+        self.assertEqual(calls, ["cheap"])
+
+    def test_Static_selector_decisions_are_computed_once_per_strategy(self):
+        class StaticSelector(IValidatorSelector):
+            calls: int = 0
+
+            @property
+            def IsStatic(self) -> bool:
+                return True
+
+            def CanExecute(self, rule, propertyPath, context) -> bool:
+                StaticSelector.calls += 1
+                return propertyPath == "Forename"
+
+        validator = TestValidator()
+        validator.rule_for(lambda x: x.Surname).not_null()
+        validator.rule_for(lambda x: x.Forename).not_null()
+        validator.rule_for(lambda x: x.Email).not_null()
+
+        batch = validator.validate_many([Person(Orders=[]) for _ in range(5)], lambda v: v.UseCustomSelector(StaticSelector()).IncludeProperties("Email"))
+
+        self.assertEqual(StaticSelector.calls, 3)
+        self.assertEqual([x.PropertyName for x in batch[0].errors], ["Forename", "Email"])
+
+    def test_Selector_is_built_once_per_strategy_until_its_options_change(self):
+        strategy = ValidationStrategy[Person]().IncludeProperties("Email").IncludeRuleSets("names")
+        selector = strategy.GetSelector()
+
+        self.assertIsInstance(selector, CompositeValidatorSelector)
+        self.assertIs(strategy.GetSelector(), selector)
+        self.assertIsNot(strategy.IncludeRuleSets("other").GetSelector(), selector)
+
 
 if __name__ == "__main__":
     unittest.main()
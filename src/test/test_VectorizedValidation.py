@@ -0,0 +1,149 @@
+# region License
+# Copyright (c) .NET Foundation and contributors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# The latest version of this file can be found at https://github.com/p-hzamora/FluentValidation
+# endregion
+
+import unittest
+import sys
+from pathlib import Path
+
+sys.path.append([str(x) for x in Path(__file__).parents if x.name == "src"].pop())
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from fluent_validation import AbstractValidator, ValidationException  # noqa: E402
+from fluent_validation.internal.VectorizedEngine import VectorizedEngine  # noqa: E402
+from fluent_validation.ValidatorOptions import ValidatorOptions  # noqa: E402
+from CultureScope import CultureScope  # noqa: E402
+from person import _Address, Person  # noqa: E402
+
+
+class ReadingValidator(AbstractValidator[Person]):
+    def __init__(self):
+        super().__init__(Person)
+        self.rule_for(lambda x: x.Age).not_null().greater_than(0).less_than_or_equal_to(120)
+        self.rule_for(lambda x: x.AnotherInt).inclusive_between(10, 20)
+        self.rule_for(lambda x: x.Id).exclusive_between(0, 100)
+        self.rule_for(lambda x: x.Surname).length(2, 5)
+
+
+class MixedValidator(ReadingValidator):
+    def __init__(self):
+        super().__init__()
+        self.rule_for(lambda x: x.Forename).must(lambda x: x != "bad")
+        self.rule_for(lambda x: x.Address.Line1).not_null().when(lambda x: x.Address is not None)
+
+
+def _dump(batch) -> list[list[tuple]]:
+    return [[(x.PropertyName, x.ErrorMessage, x.AttemptedValue) for x in result.errors] for result in batch]
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class VectorizedValidationTests(unittest.TestCase):
+    def __init__(self, methodName="runTest"):
+        super().__init__(methodName)
+        CultureScope.SetDefaultCulture()
+
+    def setUp(self):
+        ValidatorOptions.Global.PropertyNameResolver = None
+        self.people = [
+            Person(Age=30, AnotherInt=15, Id=5, Surname="abc", Forename="ok"),
+            Person(Age=None, AnotherInt=10, Id=100, Surname="a", Forename="bad"),
+            Person(Age=121, AnotherInt=21, Id=1, Surname=None, Forename="ok", Address=_Address(Line1=None)),
+            Person(Age=0, AnotherInt=9, Id=0, Surname="abcdef", Forename=None, Address=_Address(Line1="1")),
+            Person(Age=50.5, AnotherInt=20, Id=99, Surname="ab", Forename="ok"),
+        ]
+
+    def test_Instances_produce_the_same_results_as_validate_many(self):
+        validator = MixedValidator()
+        expected = validator.validate_many(self.people)
+        actual = validator.validate_many(self.people, vectorized=True)
+
+        self.assertEqual(_dump(expected), _dump(actual))
+        self.assertEqual(list(expected.invalid_results), list(actual.invalid_results))
+
+    def test_Column_dict_produces_the_same_results(self):
+        validator = ReadingValidator()
+        columns = {
+            "Age": [x.Age for x in self.people],
+            "AnotherInt": np.array([x.AnotherInt for x in self.people]),
+            "Id": [x.Id for x in self.people],
+            "Surname": [x.Surname for x in self.people],
+        }
+
+        self.assertEqual(_dump(validator.validate_many(self.people)), _dump(validator.validate_columns(columns)))
+
+    def test_Structured_array_produces_the_same_results(self):
+        validator = ReadingValidator()
+        people = [x for x in self.people if x.Age is not None and x.Surname is not None]
+        data = np.array(
+            [(x.Age, x.AnotherInt, x.Id, x.Surname) for x in people],
+            dtype=[("Age", "f8"), ("AnotherInt", "i8"), ("Id", "i8"), ("Surname", "U10")],
+        )
+
+        self.assertEqual(_dump(validator.validate_many(people)), _dump(validator.validate_columns(data)))
+
+    def test_Nested_columns_are_read_with_the_property_path(self):
+        validator = AbstractValidator[Person](Person)
+        validator.rule_for(lambda x: x.Address.Line1).not_null().length(1, 3)
+
+        batch = validator.validate_columns({"Address.Line1": ["a", None, "abcd"]})
+
+        self.assertEqual([x.is_valid for x in batch], [True, False, False])
+        self.assertEqual(batch[1].errors[0].PropertyName, "Address.Line1")
+        self.assertEqual(batch[2].errors[0].AttemptedValue, "abcd")
+
+    def test_Only_simple_rules_are_vectorized(self):
+        engine = VectorizedEngine[Person](MixedValidator())
+
+        self.assertEqual([x.PropertyName for x in engine.VectorizedRules], ["Age", "AnotherInt", "Id", "Surname"])
+        self.assertEqual([x.PropertyName for x in engine.ResidualRules], ["Forename", "Address.Line1"])
+
+    def test_Values_numpy_cannot_compare_fall_back_to_the_regular_validators(self):
+        validator = AbstractValidator[Person](Person)
+        validator.rule_for(lambda x: x.Age).greater_than(0)
+
+        with self.assertRaises(TypeError):
+            validator.validate_columns({"Age": [1, "a"]})
+
+    def test_Mixed_int_and_float_comparisons_are_exact(self):
+        cases = [
+            (lambda v: v.rule_for(lambda x: x.Id).less_than_or_equal_to(9007199254740992.0), "Id", [2**53, 2**53 + 1]),
+            (lambda v: v.rule_for(lambda x: x.Id).inclusive_between(0.0, 9007199254740992.0), "Id", np.array([2**53, 2**53 + 1], dtype=np.int64)),
+            (lambda v: v.rule_for(lambda x: x.Age).greater_than(2**53 + 1), "Age", np.array([2.0**53 + 2, 2.0**53], dtype=np.float64)),
+        ]
+        for define, name, column in cases:
+            validator = AbstractValidator[Person](Person)
+            define(validator)
+
+            batch = validator.validate_columns({name: column})
+
+            self.assertEqual([x.is_valid for x in batch], [True, False], name)
+
+    def test_Throws_on_first_invalid_row(self):
+        with self.assertRaises(ValidationException):
+            ReadingValidator().validate_many(self.people, lambda v: v.ThrowOnFailures(), vectorized=True)
+
+    def test_Lazy_cannot_be_vectorized(self):
+        with self.assertRaises(ValueError):
+            ReadingValidator().validate_many(self.people, None, lazy=True, vectorized=True)
+
+
+if __name__ == "__main__":
+    unittest.main()